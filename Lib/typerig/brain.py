@@ -13,10 +13,17 @@
 # No warranties. By using this you agree
 # that you use it at your own risk!
 
-__version__ = '0.25.8'
+__version__ = '0.37.1'
 
 # - Dependancies -----------------
 import math
+from array import array
+
+# -- Optional: NumPy is used for batch (vectorized) processing when available
+try:
+	import numpy as np
+except ImportError:
+	np = None
 
 # - Functions -------------------------------------------------
 # -- Math -----------------------------------------------------
@@ -152,6 +159,77 @@ def bilinInterp(x, y, points):
 			q12 * (x2 - x) * (y - y1) +
 			q22 * (x - x1) * (y - y1)
 		   ) / ((x2 - x1) * (y2 - y1) + 0.0)
+
+# -- Interpolation ----------------------------------------------------------
+def normalizeValue(value, axisTriple):
+	'''Normalizes an axis value to the -1 (minimum) .. 0 (default) .. 1 (maximum) range. Values outside the axis are clamped.
+
+	Arguments:
+		value (int or float): Axis value (user or design units)
+		axisTriple (tuple(minimum, default, maximum)): Axis definition
+	Returns:
+		float
+	'''
+	lower, default, upper = [float(item) for item in axisTriple]
+	value = max(min(float(value), upper), lower)
+
+	if value < default:
+		return (value - default)/(default - lower)
+
+	if value > default:
+		return (value - default)/(upper - default)
+
+	return 0.
+
+def normalizeLocation(location, axes):
+	'''Normalizes a designspace location, see normalizeValue. Axes missing in the location are at their default.
+
+	Arguments:
+		location (dict{axis: value}): Location in axis units
+		axes (dict{axis: tuple(minimum, default, maximum)}): Axis definitions
+	Returns:
+		dict{axis: float}: Location with the default (zero) axes omitted
+	'''
+	normalized = {}
+
+	for axis, axisTriple in axes.items():
+		value = normalizeValue(location.get(axis, axisTriple[1]), axisTriple)
+
+		if value != 0.:
+			normalized[axis] = value
+
+	return normalized
+
+def supportScalar(location, support):
+	'''Returns the weight (0..1) of a master region (support) at a normalized location, as in OpenType font variations.
+
+	Arguments:
+		location (dict{axis: float}): Normalized location
+		support (dict{axis: tuple(lower, peak, upper)}): Region of influence of a master
+	Returns:
+		float
+	'''
+	scalar = 1.
+
+	for axis, (lower, peak, upper) in support.items():
+		if peak == 0. or lower > peak or peak > upper or (lower < 0. and upper > 0.):
+			continue
+
+		value = location.get(axis, 0.)
+
+		if value == peak:
+			continue
+
+		if value <= lower or upper <= value:
+			return 0.
+
+		if value < peak:
+			scalar *= (value - lower)/float(peak - lower)
+		else:
+			scalar *= (value - upper)/float(peak - upper)
+
+	return scalar
+
 # -- Contour tests ----------------------------------------------------------
 def ccw(A, B, C):
 	'''Tests whether the turn formed by A, B, and C is Counter clock wise (CCW)'''
@@ -161,13 +239,539 @@ def intersect(A,B,C,D):
 	'''Tests whether A,B and C,D intersect'''
 	return ccw(A,C,D) != ccw(B,C,D) and ccw(A,B,C) != ccw(A,B,D)
 
+def segmentIntersection(x1, y1, x2, y2, x3, y3, x4, y4, tolerance=1e-9):
+	'''Finds where line segments (x1,y1)-(x2,y2) and (x3,y3)-(x4,y4) intersect.
+	Collinear overlapping segments meet at the start of their overlap.
+
+	Returns:
+		tuple(u, v) or None: Parameters (0 <= u, v <= 1) of the intersection along the first and second segment
+	'''
+	rx, ry = x2 - x1, y2 - y1
+	sx, sy = x4 - x3, y4 - y3
+	qx, qy = x3 - x1, y3 - y1
+	denom = rx * sy - ry * sx
+	scale = (abs(rx) + abs(ry)) * (abs(sx) + abs(sy))
+
+	if abs(denom) <= tolerance * scale: # Parallel
+		rr = float(rx * rx + ry * ry)
+
+		if rr == 0 or abs(qx * ry - qy * rx) > tolerance * (rr + qx * qx + qy * qy): 
+			return None # ... but not collinear
+		
+		v0, v1 = (qx * rx + qy * ry) / rr, ((x4 - x1) * rx + (y4 - y1) * ry) / rr
+		u = max(0., min(v0, v1))
+
+		if u > min(1., max(v0, v1)): 
+			return None
+
+		return u, (u - v0) / (v1 - v0) if v1 != v0 else 0.
+
+	u = (qx * sy - qy * sx) / float(denom)
+	v = (qx * ry - qy * rx) / float(denom)
+
+	if -tolerance <= u <= 1 + tolerance and -tolerance <= v <= 1 + tolerance:
+		return min(max(u, 0.), 1.), min(max(v, 0.), 1.)
+
+	return None
+
+def contourSegments(onCurve, closed=True):
+	'''Splits contour nodes into segments at on-curve nodes.
+
+	Arguments:
+		onCurve (list(bool)): On-curve flag of every node in contour order
+		closed (bool): Closed contour - last segment ends at the first on-curve node
+	Returns:
+		list[tuple(int)]: Node indices of every segment - 2 for lines, 3 for quadratic and 4 for cubic curves
+	'''
+	nodeCount = len(onCurve)
+	onCurveIndices = [nid for nid in range(nodeCount) if onCurve[nid]]
+	segments = []
+
+	if not len(onCurveIndices): 
+		return segments
+
+	start = onCurveIndices[0]
+	current = [start]
+	steps = nodeCount if closed else nodeCount - 1 - start
+
+	for step in range(1, steps + 1):
+		nid = (start + step) % nodeCount
+		current.append(nid)
+
+		if onCurve[nid]:
+			assert len(current) <= 4, 'Segment with more than two off-curve nodes: %s' %current
+			segments.append(tuple(current))
+			current = [nid]
+
+	return segments
+
+# -- Bezier -----------------------------------------------------------------
+_gaussLegendreCache = {}
+
+def gaussLegendre(order=16):
+	'''Returns the abscissas and weights of the Gauss-Legendre quadrature of given [order] over the [-1, 1] interval.
+	Calculated once (Newton iteration over Legendre polynomials) and cached per order.
+	
+	Arguments:
+		order (int): Number of sampling points (2 or more)
+	Returns:
+		tuple(list(float), list(float)): Abscissas and weights
+	'''
+	if order not in _gaussLegendreCache:
+		nodes, weights = [], []
+
+		for i in range(1, order + 1):
+			x = math.cos(math.pi * (i - .25) / (order + .5)) # Initial guess
+			
+			for iteration in range(100):
+				p0, p1 = 1., x
+				
+				for k in range(2, order + 1):
+					p0, p1 = p1, ((2*k - 1)*x*p1 - (k - 1)*p0)/k
+
+				dp = order*(x*p1 - p0)/(x*x - 1)
+				dx = p1/dp
+				x -= dx
+
+				if abs(dx) < 1e-15: break
+
+			nodes.append(x)
+			weights.append(2./((1 - x*x)*dp*dp))
+
+		_gaussLegendreCache[order] = (nodes, weights)
+
+	return _gaussLegendreCache[order]
+
+def cubicExtremeTimes(p0, p1, p2, p3):
+	'''Returns the times (0 < t < 1) at which the first derivative of a single (X or Y) cubic Bezier coordinate becomes zero.
+	Order of the results: linear solution or (positive, negative) root of the quadratic.
+	
+	Arguments:
+		p0, p1, p2, p3 (int or float): Coordinates of the control points along one axis
+	Returns:
+		list(float)
+	'''
+	tvalues = []
+	b = float(6 * p0 - 12 * p1 + 6 * p2)
+	a = float(-3 * p0 + 9 * p1 - 9 * p2 + 3 * p3)
+	c = float(3 * p1 - 3 * p0)
+
+	if abs(a) < 1e-12:        # Numerical robustness
+		if abs(b) < 1e-12:    # Numerical robustness
+			return tvalues
+
+		t = -c / b
+
+		if 0 < t and t < 1:
+			tvalues.append(t)
+
+		return tvalues
+
+	b2ac = float(b * b - 4 * c * a)
+
+	if b2ac < 0:
+		return tvalues
+	
+	sqrtb2ac = math.sqrt(b2ac)
+
+	# - Cancellation free roots: keeps the valid root of nearly quadratic curves (a ~ 0, ex. elevated quadratic segments)
+	q = -.5 * (b + (sqrtb2ac if b >= 0 else -sqrtb2ac))
+
+	if q == 0: # Double root at t = 0
+		return tvalues
+
+	t1, t2 = (q / a, c / q) if b < 0 else (c / q, q / a)
+
+	if 0 < t1 and t1 < 1:
+		tvalues.append(t1)
+
+	if 0 < t2 and t2 < 1:
+		tvalues.append(t2)
+
+	return tvalues
+
+def flattenCubic(x0, y0, x1, y1, x2, y2, x3, y3, tolerance=.5, maxDepth=16):
+	'''Adaptive flattening of a cubic Bezier: subdivides until the control points 
+	lie within [tolerance] from the chord, so flat parts give few points and tight turns many.
+
+	Arguments:
+		x0, y0 ... x3, y3 (int or float): Control point coordinates
+		tolerance (float): Max distance between the curve and the polyline (approx.)
+		maxDepth (int): Subdivision limit
+	Returns:
+		list[tuple(x, y, t)]: Polyline points including both ends with the curve time of each
+	'''
+	points = [(x0, y0, 0.)]
+	stack = [(x0, y0, x1, y1, x2, y2, x3, y3, 0., 1., 0)]
+
+	while len(stack):
+		x0, y0, x1, y1, x2, y2, x3, y3, t0, t1, depth = stack.pop()
+		dx, dy = x3 - x0, y3 - y0
+		chord = math.hypot(dx, dy)
+
+		if chord > 0:
+			d1 = abs((x1 - x0) * dy - (y1 - y0) * dx) / chord
+			d2 = abs((x2 - x0) * dy - (y2 - y0) * dx) / chord
+		else:
+			d1, d2 = math.hypot(x1 - x0, y1 - y0), math.hypot(x2 - x0, y2 - y0)
+
+		if depth >= maxDepth or max(d1, d2) <= tolerance:
+			points.append((x3, y3, t1))
+			continue
+
+		# - Split at half: De Casteljau. Second half goes first as the stack is LIFO
+		x12, y12 = (x0 + x1)*.5, (y0 + y1)*.5
+		x23, y23 = (x1 + x2)*.5, (y1 + y2)*.5
+		x34, y34 = (x2 + x3)*.5, (y2 + y3)*.5
+		x123, y123 = (x12 + x23)*.5, (y12 + y23)*.5
+		x234, y234 = (x23 + x34)*.5, (y23 + y34)*.5
+		xm, ym = (x123 + x234)*.5, (y123 + y234)*.5
+		tm = (t0 + t1)*.5
+
+		stack.append((xm, ym, x234, y234, x34, y34, x3, y3, tm, t1, depth + 1))
+		stack.append((x0, y0, x12, y12, x123, y123, xm, ym, t0, tm, depth + 1))
+
+	return points
+
+def bezierRoots(v0, v1, v2, v3, tolerance=1e-12):
+	'''Returns the times (0 <= t <= 1) at which a single (X, Y or projected) cubic Bezier coordinate becomes zero.
+	The curve is split at its extremes into monotonic parts, each holding one root at most, 
+	which are solved by bracketed (Illinois) regula falsi - no missed or spurious roots near tangents.
+
+	Arguments:
+		v0, v1, v2, v3 (int or float): Control values
+		tolerance (float): Relative tolerance for touching (tangent) roots
+	Returns:
+		list(float): Sorted times
+	'''
+	def value(t):
+		mt = 1 - t
+		return (mt * mt * mt * v0) + (3 * mt * mt * t * v1) + (3 * mt * t * t * v2) + (t * t * t * v3)
+
+	eps = tolerance * (1. + max(abs(v0), abs(v1), abs(v2), abs(v3)))
+	breaks = [0.] + sorted(cubicExtremeTimes(v0, v1, v2, v3)) + [1.]
+	roots = []
+
+	for a, b in zip(breaks[:-1], breaks[1:]):
+		fa, fb = value(a), value(b)
+
+		if abs(fa) <= eps:
+			roots.append(a)
+
+		elif fa * fb < 0 and abs(fb) > eps:
+			side = 0
+			
+			for iteration in range(100):
+				t = (a * fb - b * fa) / (fb - fa)
+				ft = value(t)
+
+				if abs(ft) <= eps or b - a < 1e-15: break
+
+				if ft * fb > 0:
+					b, fb = t, ft
+					if side == -1: fa *= .5
+					side = -1
+				else:
+					a, fa = t, ft
+					if side == 1: fb *= .5
+					side = 1
+
+			roots.append(t)
+
+	if abs(value(1.)) <= eps:
+		roots.append(1.)
+
+	return [t for i, t in enumerate(roots) if i == 0 or t - roots[i - 1] > 1e-9]
+
+def curveIntersections(curveA, curveB, tolerance=1e-3, maxDepth=48):
+	'''Finds the intersections of two cubic Beziers by recursive subdivision with bounding box culling:
+	pairs of parts whose control boxes do not overlap are dropped, the bigger part of the rest is split.
+	Each hit is then polished by Newton iteration.
+
+	Arguments:
+		curveA, curveB (tuple(x0, y0, x1, y1, x2, y2, x3, y3)): Control point coordinates
+		tolerance (float): Subdivision stops at parts smaller than that
+		maxDepth (int): Subdivision limit
+	Returns:
+		list[tuple(tA, tB, x, y)]: Sorted by tA
+	'''
+	def box(c):
+		return min(c[0::2]), min(c[1::2]), max(c[0::2]), max(c[1::2])
+
+	def split(c):
+		x0, y0, x1, y1, x2, y2, x3, y3 = c
+		x12, y12 = (x0 + x1)*.5, (y0 + y1)*.5
+		x23, y23 = (x1 + x2)*.5, (y1 + y2)*.5
+		x34, y34 = (x2 + x3)*.5, (y2 + y3)*.5
+		x123, y123 = (x12 + x23)*.5, (y12 + y23)*.5
+		x234, y234 = (x23 + x34)*.5, (y23 + y34)*.5
+		xm, ym = (x123 + x234)*.5, (y123 + y234)*.5
+		return (x0, y0, x12, y12, x123, y123, xm, ym), (xm, ym, x234, y234, x34, y34, x3, y3)
+
+	def point(c, t):
+		mt = 1 - t
+		a, b, d, e = mt*mt*mt, 3*mt*mt*t, 3*mt*t*t, t*t*t
+		return a*c[0] + b*c[2] + d*c[4] + e*c[6], a*c[1] + b*c[3] + d*c[5] + e*c[7]
+
+	def speed(c, t):
+		mt = 1 - t
+		a, b, d = 3*mt*mt, 6*mt*t, 3*t*t
+		return a*(c[2] - c[0]) + b*(c[4] - c[2]) + d*(c[6] - c[4]), a*(c[3] - c[1]) + b*(c[5] - c[3]) + d*(c[7] - c[5])
+
+	curveA, curveB = tuple(map(float, curveA)), tuple(map(float, curveB))
+	stack = [(curveA, 0., 1., curveB, 0., 1., 0)]
+	hits = []
+
+	while len(stack):
+		partA, a0, a1, partB, b0, b1, depth = stack.pop()
+		axmin, aymin, axmax, aymax = box(partA)
+		bxmin, bymin, bxmax, bymax = box(partB)
+
+		if axmax < bxmin or bxmax < axmin or aymax < bymin or bymax < aymin:
+			continue
+
+		sizeA, sizeB = max(axmax - axmin, aymax - aymin), max(bxmax - bxmin, bymax - bymin)
+
+		if depth >= maxDepth or max(sizeA, sizeB) <= tolerance:
+			hits.append(((a0 + a1)*.5, (b0 + b1)*.5))
+			continue
+
+		if sizeA >= sizeB:
+			(leftA, rightA), am = split(partA), (a0 + a1)*.5
+			stack.append((leftA, a0, am, partB, b0, b1, depth + 1))
+			stack.append((rightA, am, a1, partB, b0, b1, depth + 1))
+		else:
+			(leftB, rightB), bm = split(partB), (b0 + b1)*.5
+			stack.append((partA, a0, a1, leftB, b0, bm, depth + 1))
+			stack.append((partA, a0, a1, rightB, bm, b1, depth + 1))
+
+	# - Polish: Newton on A(ta) - B(tb) = 0 and merge hits that meet at the same place
+	result = []
+
+	for subdivided in sorted(hits):
+		ta, tb = subdivided
+
+		for iteration in range(8):
+			(xa, ya), (xb, yb) = point(curveA, ta), point(curveB, tb)
+			(dxa, dya), (dxb, dyb) = speed(curveA, ta), speed(curveB, tb)
+			det = -dxa*dyb + dya*dxb
+			
+			if det == 0: break
+			
+			fx, fy = xa - xb, ya - yb
+			ta_new = min(max(ta - (-dyb*fx + dxb*fy)/det, 0.), 1.)
+			tb_new = min(max(tb - (-dya*fx + dxa*fy)/det, 0.), 1.)
+			converged = abs(ta_new - ta) < 1e-12 and abs(tb_new - tb) < 1e-12
+			ta, tb = ta_new, tb_new
+
+			if converged: break
+
+		(x, y), (xb, yb) = point(curveA, ta), point(curveB, tb)
+
+		if abs(x - xb) > tolerance or abs(y - yb) > tolerance: # Polishing went astray (near tangent curves)
+			ta, tb = subdivided
+			x, y = point(curveA, ta)
+
+		if not any(abs(x - hit[2]) <= tolerance and abs(y - hit[3]) <= tolerance for hit in result):
+			result.append((ta, tb, x, y))
+
+	return sorted(result)
+
+def cubicBounds(x0, y0, x1, y1, x2, y2, x3, y3):
+	'''Returns the tight (curve aware) bounding box of a cubic Bezier: its end points and extremes, not the control points.
+
+	Arguments:
+		x0, y0 ... x3, y3 (int or float): Control point coordinates
+	Returns:
+		tuple(xmin, ymin, xmax, ymax)
+	'''
+	xs, ys = [x0, x3], [y0, y3]
+
+	for t in cubicExtremeTimes(x0, x1, x2, x3) + cubicExtremeTimes(y0, y1, y2, y3):
+		mt = 1 - t
+		xs.append((mt * mt * mt * x0) + (3 * mt * mt * t * x1) + (3 * mt * t * t * x2) + (t * t * t * x3))
+		ys.append((mt * mt * mt * y0) + (3 * mt * mt * t * y1) + (3 * mt * t * t * y2) + (t * t * t * y3))
+
+	return (min(xs), min(ys), max(xs), max(ys))
+
+# -- Splines ----------------------------------------------------------------
+def hobbyVelocity(theta, phi, tension=1.):
+	'''Hobby's velocity (relative handle length) for handle leaving at angle [theta] into a segment ending at angle [phi]'''
+	st, ct = math.sin(theta), math.cos(theta)
+	sp, cp = math.sin(phi), math.cos(phi)
+	numerator = 2 + math.sqrt(2) * (st - sp/16.) * (sp - st/16.) * (ct - cp)
+	denominator = 3 * (1 + .5*(math.sqrt(5) - 1) * ct + .5*(3 - math.sqrt(5)) * cp)
+	return min(4., numerator / (denominator * tension)) # Capped as in MetaPost
+
+def solveTridiagonal(sub, diag, sup, rhs, cyclic=False):
+	'''Solves tridiagonal system of linear equations in linear time (Thomas algorithm). 
+	Cyclic (periodic) systems are reduced to two ordinary ones (Sherman-Morrison).
+
+	Arguments:
+		sub, diag, sup, rhs (list(float)): Sub-diagonal (sub[0] unused or corner for cyclic), main diagonal, 
+			super-diagonal (sup[-1] unused or corner for cyclic) and right-hand side
+		cyclic (bool): sub[0] couples the first to the last unknown and sup[-1] the last to the first
+	Returns:
+		list(float)
+	'''
+	count = len(diag)
+
+	if not cyclic or count < 3:
+		if cyclic: # Two unknowns: both corners fold on the diagonals
+			sup, sub = [sup[0] + sub[0]], [0., sub[1] + sup[1]]
+
+		c, d = [0.]*count, [0.]*count
+		c[0], d[0] = (sup[0] / diag[0] if count > 1 else 0.), rhs[0] / diag[0]
+
+		for i in range(1, count):
+			m = diag[i] - sub[i] * c[i - 1]
+			c[i] = sup[i] / m if i < count - 1 else 0.
+			d[i] = (rhs[i] - sub[i] * d[i - 1]) / m
+
+		for i in range(count - 2, -1, -1):
+			d[i] -= c[i] * d[i + 1]
+
+		return d
+
+	# - Sherman-Morrison: A = B + u*v^T with u = (gamma, 0 .. 0, sup[-1]) and v = (1, 0 .. 0, sub[0]/gamma)
+	gamma = -diag[0]
+	newDiag = list(diag)
+	newDiag[0] -= gamma
+	newDiag[-1] -= sub[0] * sup[-1] / gamma
+	
+	x = solveTridiagonal(sub, newDiag, sup, rhs)
+	z = solveTridiagonal(sub, newDiag, sup, [gamma] + [0.]*(count - 2) + [sup[-1]])
+	factor = (x[0] + sub[0] * x[-1] / gamma) / (1 + z[0] + sub[0] * z[-1] / gamma)
+
+	return [xi - factor * zi for xi, zi in zip(x, z)]
+
+def hobbySpline(points, closed=True, tension=1., curl=1., directions=None):
+	'''Builds John Hobby's (MetaFont/MetaPost) spline through all given knots at once. 
+	The angles at all knots are found by solving a single tridiagonal (cyclic for closed contours) 
+	system of mock curvature continuity equations in linear time, then all handles are placed.
+	Ends of open contours are either curled or have fixed tangent directions (MetaPost {dir} end conditions).
+
+	Arguments:
+		points (list[tuple(x,y)] or objects with .x and .y): Knots (on-curve points) in contour order
+		closed (bool): Closed contour - spline continues from the last knot to the first
+		tension (float or list(float)): Tension (1 - default, .75 - minimal, bigger - tighter) for all or per knot
+		curl (float or tuple(float, float)): Curl at the start and end knot of open contours (1 - default, 0 - straight-ish ends)
+		directions (tuple(start, end)): Fixed tangent directions (tuple(dx,dy) or None for curl) at the start and end knot of open contours
+	Returns:
+		list[tuple((x0,y0), (x1,y1), (x2,y2), (x3,y3))]: Cubic segments in contour order (suitable for CurveBatch). 
+			Closed contours have one more segment - the one from the last knot back to the first.
+	'''
+	from cmath import exp, phase
+	
+	knots = [complex(*CurveBatch._getXY(point)) for point in points]
+	count = len(knots)
+	segmentCount = count if closed else count - 1
+	tensions = [float(tension)]*count if isinstance(tension, (int, float)) else [float(value) for value in tension]
+	curlStart, curlEnd = (curl, curl) if isinstance(curl, (int, float)) else curl
+	dirStart, dirEnd = (None, None) if directions is None or closed else [complex(*direction) if direction is not None and any(direction) else None for direction in directions]
+
+	assert len(tensions) == count, 'Tensions (%s) do not match knots (%s)' %(len(tensions), count)
+	
+	if segmentCount < 1: 
+		return []
+
+	deltas = [knots[(k + 1) % count] - knots[k] for k in range(segmentCount)]
+	lengths = [abs(delta) for delta in deltas]
+	assert all(lengths), 'Coinciding consecutive knots!'
+	alphas = [1./value for value in tensions] # Reciprocal tensions as in Knuth's notation
+	
+	# - Turning angles at knots (psi[k] for knot k), zero at the ends of open contours
+	psi = [0.]*count
+	for k in range(count if closed else count - 1):
+		if closed or k > 0:
+			psi[k] = phase(deltas[k] / deltas[k - 1])
+
+	# - Mock curvature continuity equations for the outgoing angles (theta) at all knots
+	sub, diag, sup, rhs = [0.]*count, [0.]*count, [0.]*count, [0.]*count
+
+	def curlRatio(gamma, alpha, beta):
+		return ((3 - alpha)*alpha*alpha*gamma + beta**3) / (alpha**3*gamma + (3 - beta)*beta*beta)
+
+	for k in range(count):
+		if not closed and k == 0:
+			if dirStart is not None: # Given direction: theta is fixed relative to the first chord
+				diag[0], rhs[0] = 1., phase(dirStart / deltas[0])
+			else:
+				ratio = curlRatio(curlStart, alphas[0], alphas[1])
+				diag[0], sup[0], rhs[0] = 1., ratio, -ratio * psi[1]
+			continue
+
+		if not closed and k == count - 1:
+			if dirEnd is not None: # Given direction: psi is zero at the end, so theta is fixed relative to the last chord
+				diag[k], rhs[k] = 1., phase(dirEnd / deltas[-1])
+			else:
+				ratio = curlRatio(curlEnd, alphas[-1], alphas[-2])
+				sub[k], diag[k], rhs[k] = ratio, 1., 0.
+			continue
+
+		prev, next = (k - 1) % count, (k + 1) % count
+		A = alphas[prev] / (alphas[k]**2 * lengths[prev])
+		B = (3 - alphas[prev]) / (alphas[k]**2 * lengths[prev])
+		C = (3 - alphas[next]) / (alphas[k]**2 * lengths[k])
+		D = alphas[next] / (alphas[k]**2 * lengths[k])
+
+		sub[k], diag[k], sup[k] = A, B + C, D
+		rhs[k] = -B * psi[k] - D * psi[next]
+
+	if not closed and count == 2 and dirStart is None and dirEnd is None:
+		theta = [0., 0.] # Two curled knots: the system is singular for equal curls, the spline is the straight chord
+	else:
+		theta = solveTridiagonal(sub, diag, sup, rhs, cyclic=closed)
+
+	# - Place handles
+	segments = []
+
+	for k in range(segmentCount):
+		next = (k + 1) % count
+		phi = -psi[next] - theta[next] # Incoming angle at the next knot
+		u = knots[k] + deltas[k] * exp(1j * theta[k]) * hobbyVelocity(theta[k], phi, tensions[k])
+		v = knots[next] - deltas[k] * exp(-1j * phi) * hobbyVelocity(phi, theta[k], tensions[next])
+		segments.append(tuple((point.real, point.imag) for point in (knots[k], u, v, knots[next])))
+
+	return segments
+
 # - Classes --------------------------------------------------------------------
 class bounds(object):
-	def __init__(self, tupleList):
+	'''Axis aligned bounding box.
+
+	Constructor:
+		bounds(list[tuple(x,y)]): Box of the given points
+		bounds(): Empty box (zero sized at origin)
+		bounds.fromBox(xmin, ymin, xmax, ymax)
+		bounds.union(list[bounds]): Box enclosing all given boxes (contour boxes into layer box, layer boxes into glyph box and etc.)
+
+	Attributes:
+		.x, .y, .xmax, .ymax, .width, .height (int or float)
+	'''
+	def __init__(self, tupleList=None):
 		self.x, self.xmax = 0, 0
 		self.y, self.ymax = 0, 0
 		self.width, self.height = 0, 0
-		self.refresh(tupleList)
+		
+		if tupleList is not None:
+			self.refresh(tupleList)
+
+	def __repr__(self):
+		return '<%s: (%s, %s, %s, %s)>' %(self.__class__.__name__, self.x, self.y, self.xmax, self.ymax)
+
+	@classmethod
+	def fromBox(cls, xmin, ymin, xmax, ymax):
+		newBounds = cls()
+		newBounds.setBox(xmin, ymin, xmax, ymax)
+		return newBounds
+
+	@classmethod
+	def union(cls, boundsList):
+		'''Merge list of boxes (bounds objects or (xmin, ymin, xmax, ymax) tuples) into one'''
+		boxes = [item.asTuple() if isinstance(item, bounds) else tuple(item) for item in boundsList]
+		assert len(boxes), 'Cannot merge empty list of bounds!'
+		xmins, ymins, xmaxs, ymaxs = zip(*boxes)
+		return cls.fromBox(min(xmins), min(ymins), max(xmaxs), max(ymaxs))
 
 	def recalc(self, tupleList):
 		from operator import itemgetter
@@ -179,70 +783,186 @@ class bounds(object):
 
 	def refresh(self, tupleList):
 		min_x_tup, min_y_tup, max_x_tup, max_y_tup = self.recalc(tupleList)
-		self.x = min_x_tup[0]
-		self.y = min_y_tup[1]
-		self.xmax = max_x_tup[0]
-		self.ymax = max_y_tup[1]
+		self.setBox(min_x_tup[0], min_y_tup[1], max_x_tup[0], max_y_tup[1])
+
+	def setBox(self, xmin, ymin, xmax, ymax):
+		self.x, self.y = xmin, ymin
+		self.xmax, self.ymax = xmax, ymax
 		self.width = abs(self.xmax - self.x)
 		self.height = abs(self.ymax - self.y)
-		
+
+	def asTuple(self):
+		'''Returns (xmin, ymin, xmax, ymax)'''
+		return (self.x, self.y, self.xmax, self.ymax)
+
+	def merge(self, other):
+		'''Expand this box (in place) to enclose [other] bounds or (xmin, ymin, xmax, ymax) tuple. Returns self'''
+		xmin, ymin, xmax, ymax = other.asTuple() if isinstance(other, bounds) else other
+		self.setBox(min(self.x, xmin), min(self.y, ymin), max(self.xmax, xmax), max(self.ymax, ymax))
+		return self
+
+	def contains(self, x, y):
+		return self.x <= x <= self.xmax and self.y <= y <= self.ymax
+
 class biDict(dict):
 	'''
 	Bi-directioanl dictionary partly based on Basj answer st:
 	https://stackoverflow.com/questions/3318625/efficient-bidirectional-hash-table-in-python
+	
+	Attributes:
+		.inverse (dict{value: set(keys)}): Reverse lookup, kept in sync on every change - O(1) per key
 	'''
 	def __init__(self, *args, **kwargs):
-		super(biDict, self).__init__(*args, **kwargs)
-
+		super(biDict, self).__init__()
 		self.inverse = {}
-
-		for key, value in self.iteritems():
-			self.inverse.setdefault(value,[]).append(key) 
+		self.update(*args, **kwargs)
 
 	def __setitem__(self, key, value):
 		if key in self:
-			self.inverse[self[key]].remove(key) 
+			self.__unlink(key)
 
 		super(biDict, self).__setitem__(key, value)
-		self.inverse.setdefault(value,[]).append(key)        
+		self.inverse.setdefault(value, set()).add(key)
 
 	def __delitem__(self, key):
-		self.inverse.setdefault(self[key],[]).remove(key)
+		self.__unlink(key)
+		super(biDict, self).__delitem__(key)
 
-		if self[key] in self.inverse and not self.inverse[self[key]]: 
-			del self.inverse[self[key]]
+	def __unlink(self, key):
+		value = self[key]
+		self.inverse[value].discard(key)
 
-		super(biDict, self).__delitem__(key)
+		if not self.inverse[value]:
+			del self.inverse[value]
+
+	def update(self, *args, **kwargs):
+		for key, value in dict(*args, **kwargs).items():
+			self[key] = value
+
+	def setdefault(self, key, value=None):
+		if key not in self:
+			self[key] = value
+
+		return self[key]
+
+	def pop(self, key, *default):
+		if key not in self and len(default):
+			return default[0]
+
+		value = self[key]
+		del self[key]
+		return value
+
+	def popitem(self):
+		key, value = super(biDict, self).popitem()
+		super(biDict, self).__setitem__(key, value)
+		del self[key]
+		return key, value
+
+	def clear(self):
+		super(biDict, self).clear()
+		self.inverse.clear()
+
+	def copy(self):
+		return self.__class__(self)
+
+	def getKeys(self, value):
+		'''Returns the keys holding given value: set() - O(1)'''
+		return self.inverse.get(value, set())
 
 class extBiDict(dict):
 	'''
-	Bi-directioanl dictionary with lists for values
+	Bi-directioanl dictionary with lists for values (multimap), ex. kerning groups: {group name: [glyph names]}
+	
+	Attributes:
+		.inverse (dict{item: set(keys)}): Reverse lookup of every list item, kept in sync on every change
+	
+	Notes:
+		Values are stored as lists. Use add() and discard() (or assign a new list) to change them -
+		in place changes of a stored list (ex. append) are not seen by the inverse.
 	'''
 	def __init__(self, *args, **kwargs):
-		super(extBiDict, self).__init__(*args, **kwargs)
-
+		super(extBiDict, self).__init__()
 		self.inverse = {}
-
-		for key, value in self.iteritems():
-			assert isinstance(value, list), 'Value for key %s is not of type list()' %key
-
-			for item in value:
-				self.inverse.setdefault(item,[]).append(key) 
+		self.update(*args, **kwargs)
 
 	def __setitem__(self, key, value):
+		assert isinstance(value, (list, tuple, set, frozenset)), 'Value for key %s is not of type list()' %key
+		
 		if key in self:
-			self.inverse[self[key]].remove(key) 
+			self.__unlink(key)
 
+		value = list(value)
 		super(extBiDict, self).__setitem__(key, value)
-		self.inverse.setdefault(value,[]).append(key)        
+
+		for item in value:
+			self.inverse.setdefault(item, set()).add(key)
 
 	def __delitem__(self, key):
-		self.inverse.setdefault(self[key],[]).remove(key)
+		self.__unlink(key)
+		super(extBiDict, self).__delitem__(key)
 
-		if self[key] in self.inverse and not self.inverse[self[key]]: 
-			del self.inverse[self[key]]
+	def __unlink(self, key):
+		for item in self[key]:
+			keys = self.inverse.get(item)
 
-		super(extBiDict, self).__delitem__(key)
+			if keys is not None:
+				keys.discard(key)
+
+				if not keys:
+					del self.inverse[item]
+
+	def update(self, *args, **kwargs):
+		'''Bulk update from a dictionary (ex. group dict) or (key, list) pairs'''
+		for key, value in dict(*args, **kwargs).items():
+			self[key] = value
+
+	def setdefault(self, key, value=None):
+		if key not in self:
+			self[key] = [] if value is None else value
+
+		return self[key]
+
+	def pop(self, key, *default):
+		if key not in self and len(default):
+			return default[0]
+
+		value = self[key]
+		del self[key]
+		return value
+
+	def clear(self):
+		super(extBiDict, self).clear()
+		self.inverse.clear()
+
+	def copy(self):
+		return self.__class__(self)
+
+	def add(self, key, item):
+		'''Add an item to the list of given key (created if missing)'''
+		value = self.setdefault(key)
+
+		if item not in self.inverse or key not in self.inverse[item]:
+			value.append(item)
+			self.inverse.setdefault(item, set()).add(key)
+
+	def discard(self, key, item):
+		'''Remove an item from the list of given key, if present'''
+		if key in self.inverse.get(item, ()):
+			self[key].remove(item)
+			self.inverse[item].discard(key)
+
+			if not self.inverse[item]:
+				del self.inverse[item]
+
+	def getKeys(self, item):
+		'''Returns the keys whose lists contain given item: set() - O(1)'''
+		return self.inverse.get(item, set())
+
+	def getKey(self, item, default=None):
+		'''Returns a single key (the first in sorted order) whose list contains given item, or default'''
+		keys = self.inverse.get(item)
+		return min(keys) if keys else default
 		
 # -- General font classes ------------------------------------------------------
 class fontFamilly():
@@ -331,73 +1051,591 @@ class geoAxis(object):
 		self.data = { int(ratfrac(stem - minAxisPos, maxAxisStem - minAxisPos, max(self.masters.keys()))):stem for stem in self.stems}
 		self.instances = sorted(self.data.keys())
 
-# -- Custom Data types -------------------------------------------------------------------
-class coordArray(object):
-	def __init__(self, *argv):
-		multiCheck = lambda t, type: all([isinstance(i, type) for i in t])
-
-		if not len(argv):		
-			self.x, self.y = [[],[]]
+# -- Interpolation -------------------------------------------------------------
+class designspaceModel(object):
+	'''N-dimensional designspace interpolation model (master supports and delta weights, as in OpenType font variations).
+	Generalizes linInterp and bilinInterp to any number of axes and any master layout (not only corners).
+	The model depends only on the master locations, so it is built once per designspace; the deltas are solved once per glyph 
+	from flat coordinate arrays (ex. coordArray layout: all X followed by all Y) and any location is then a single dot product.
+
+	Constructor:
+		designspaceModel(list[dict{axis: value}]): Normalized master locations (-1..0..1), one of them at the default (all zero)
+		designspaceModel(list[dict{axis: value}], axes): Master locations in axis units, axes - dict{axis: tuple(minimum, default, maximum)}
+		designspaceModel(..., axisOrder=list[axis], useNumpy=False): Axis priority when ordering the masters; Force pure Python processing
+
+	Attributes:
+		.locations (list[dict]): Normalized master locations in model order
+		.mapping (list[int]): Model index of every master as given
+		.supports (list[dict{axis: tuple(lower, peak, upper)}]): Region of influence of every master
+		.deltaWeights (list[dict{int: float}]): Sparse weights of the previous deltas contained in every master
+
+	Example:
+		>>> model = designspaceModel([{'wght':100}, {'wght':900}, {'wght':400, 'wdth':50}], {'wght':(100, 100, 900), 'wdth':(50, 100, 100)})
+		>>> deltas = model.getDeltas([light_coords, bold_coords, condensed_coords])
+		>>> model.interpolate(deltas, {'wght':600, 'wdth':75})
+	'''
+	def __init__(self, locations, axes=None, axisOrder=None, useNumpy=None):
+		self.useNumpy = np is not None and (useNumpy is None or bool(useNumpy))
+		self.axes = axes
 
-		elif len(argv) == 2 and multiCheck(argv, list):
-			self.x, self.y = argv
+		if axes is not None:
+			locations = [normalizeLocation(location, axes) for location in locations]
+		else:
+			locations = [dict((axis, float(value)) for axis, value in location.items() if value != 0) for location in locations]
 
-		elif len(argv) == 1 and len(argv[0]) % 2 == 0: # and isinstance(argv[0], list):
-			split = len(argv[0])/2
-			self.x = argv[0][0:split]
-			self.y = argv[0][split:]
+		if {} not in locations:
+			raise ValueError('Base master (default location) missing')
 
-		self.type = []
+		if len(set(tuple(sorted(location.items())) for location in locations)) != len(locations):
+			raise ValueError('Duplicate master locations')
 
-	def __getitem__(self, i):
-		return (self.x[i], self.y[i])
+		self.axisOrder = list(axisOrder) if axisOrder is not None else []
+		self.axisNames = sorted(set(axis for location in locations for axis in location))
+		self.locations = sorted(locations, key=self.__sortKey(locations))
+		self.mapping = [self.locations.index(location) for location in locations]
+		self.reverseMapping = [locations.index(location) for location in self.locations]
 
-	def __getslice__(i, j):
-		return self.__class__(self.x[i:j], self.y[i:j])
+		self.__computeSupports()
+		self.__computeDeltaWeights()
 
 	def __len__(self):
-		return len(self.x)
+		return len(self.locations)
 
-	def __setitem__(self, i, coordTuple):
-		self.x[i], self.y[i] = coordTuple
+	def __repr__(self):
+		return '<%s: Masters=%s; Axes=%s>' %(self.__class__.__name__, len(self.locations), self.axisNames)
 
-	def __str__(self):
-		return str(zip(self.x, self.y))
+	# - Internal -------------------------------
+	def __sortKey(self, locations):
+		# - Values of the masters lying on a single axis
+		axisPoints = {}
 
-	def __repr__(self):
-		return '<Coordinate Array: Lenght=%s;>' %len(self.x)
+		for location in locations:
+			if len(location) == 1:
+				axis, value = list(location.items())[0]
+				axisPoints.setdefault(axis, set([0.])).add(value)
 
-	def append(self, coordTuple, nodeType=-1):
-		x, y = coordTuple
-		self.x.append(x)
-		self.y.append(y)
-		self.type.append(nodeType)
+		def sign(value):
+			return -1 if value < 0 else (1 if value > 0 else 0)
 
-	def extend(self, coordList):
-		if isinstance(coordList, self.__class__):
-			self.x.extend(coordList.x)
-			self.y.extend(coordList.y)
+		def key(location):
+			onPointAxes = [axis for axis, value in location.items() if value in axisPoints.get(axis, ())]
+			orderedAxes = [axis for axis in self.axisOrder if axis in location] + sorted(axis for axis in location if axis not in self.axisOrder)
+			
+			return (len(location), 
+					-len(onPointAxes), 
+					tuple(self.axisOrder.index(axis) if axis in self.axisOrder else 0x10000 for axis in orderedAxes),
+					tuple(orderedAxes),
+					tuple(sign(location[axis]) for axis in orderedAxes),
+					tuple(abs(location[axis]) for axis in orderedAxes))
 
-		elif isinstance(coordList, list):
-			self.x.extend(coordList[0])
-			self.y.extend(coordList[1])
+		return key
 
-	def insert(self, index, coordTuple):
-		x, y = coordTuple
-		self.x.insert(index, x)
-		self.y.insert(index, y)
+	def __computeSupports(self):
+		minValue, maxValue = {}, {}
 
-	def remove(self, coordTuple):
+		for location in self.locations:
+			for axis, value in location.items():
+				minValue[axis] = min(value, minValue.get(axis, value))
+				maxValue[axis] = max(value, maxValue.get(axis, value))
+
+		regions = [dict((axis, (0., value, maxValue[axis]) if value > 0 else (minValue[axis], value, 0.)) for axis, value in location.items()) for location in self.locations]
+		self.supports = []
+
+		for mid, region in enumerate(regions):
+			regionAxes = set(region.keys())
+
+			# - Split the region by the previous masters lying inside it, along the axis with the largest range ratio
+			for previous in regions[:mid]:
+				if set(previous.keys()) != regionAxes:
+					continue
+
+				if not all(previous[axis][1] == peak or lower < previous[axis][1] < upper for axis, (lower, peak, upper) in region.items()):
+					continue
+
+				bestAxes, bestRatio = {}, -1
+
+				for axis in previous.keys():
+					value = previous[axis][1]
+					lower, peak, upper = region[axis]
+
+					if value < peak:
+						ratio, triple = (value - peak)/(lower - peak), (value, peak, upper)
+					elif value > peak:
+						ratio, triple = (value - peak)/(upper - peak), (lower, peak, value)
+					else:
+						continue
+
+					if ratio > bestRatio:
+						bestAxes, bestRatio = {}, ratio
+
+					if ratio == bestRatio:
+						bestAxes[axis] = triple
+
+				region.update(bestAxes)
+
+			self.supports.append(region)
+
+		# - Flat support table for batch evaluation: (masters, axes)
+		if self.useNumpy:
+			table = [[region.get(axis, (0., 0., 0.)) for axis in self.axisNames] for region in self.supports]
+			self._lower, self._peak, self._upper = np.array(table, dtype=float).reshape(len(self.supports), len(self.axisNames), 3).transpose(2, 0, 1)
+
+	def __computeDeltaWeights(self):
+		self.deltaWeights = []
+
+		for mid, location in enumerate(self.locations):
+			weights = {}
+
+			for sid, support in enumerate(self.supports[:mid]):
+				scalar = supportScalar(location, support)
+
+				if scalar:
+					weights[sid] = scalar
+
+			self.deltaWeights.append(weights)
+
+	def _newArray(self, values):
+		return np.array(values, dtype=float) if self.useNumpy else array('d', values)
+
+	# - Model ----------------------------------
+	def normalize(self, location):
+		'''Normalizes a location given in axis units (if the model was built with axes), otherwise returns it unchanged'''
+		return normalizeLocation(location, self.axes) if self.axes is not None else location
+
+	def getScalars(self, location):
+		'''Returns the weights of all master deltas (in model order) at given location'''
+		location = self.normalize(location)
+		return [supportScalar(location, support) for support in self.supports]
+
+	def getScalarMatrix(self, locations):
+		'''Returns the weights of all master deltas at many locations in a single call.
+		Returns:
+			numpy.ndarray of shape (locations, masters) or list[list[float]] without NumPy
+		'''
+		locations = [self.normalize(location) for location in locations]
+
+		if not self.useNumpy:
+			return [[supportScalar(location, support) for support in self.supports] for location in locations]
+
+		values = np.array([[location.get(axis, 0.) for axis in self.axisNames] for location in locations], dtype=float).reshape(len(locations), 1, len(self.axisNames))
+		lower, peak, upper = self._lower[None], self._peak[None], self._upper[None]
+		ignore = (peak == 0.) | (lower > peak) | (peak > upper) | ((lower < 0.) & (upper > 0.)) | (values == peak)
+		
+		with np.errstate(divide='ignore', invalid='ignore'):
+			factors = np.where(values < peak, (values - lower)/(peak - lower), (values - upper)/(peak - upper))
+
+		factors = np.where((values <= lower) | (upper <= values), 0., factors)
+		return np.where(ignore, 1., factors).prod(axis=2)
+
+	def getDeltas(self, masterValues):
+		'''Solves the deltas of one glyph (or any other data) - done once, then used for any location.
+		Arguments:
+			masterValues (list): One flat sequence of numbers per master (same length, masters in given order)
+		Returns:
+			numpy.ndarray of shape (masters, values) or list[array('d')] without NumPy, in model order
+		'''
+		deltas = []
+
+		for mid, weights in enumerate(self.deltaWeights):
+			delta = self._newArray(masterValues[self.reverseMapping[mid]])
+
+			if self.useNumpy:
+				for sid, weight in weights.items():
+					delta -= deltas[sid]*weight
+			elif len(weights):
+				delta = array('d', [value - sum(deltas[sid][i]*weight for sid, weight in weights.items()) for i, value in enumerate(delta)])
+
+			deltas.append(delta)
+
+		return np.array(deltas, dtype=float) if self.useNumpy else deltas
+
+	def interpolate(self, deltas, location):
+		'''Evaluates the glyph [deltas] (see getDeltas) at given location. Returns a flat array of values.'''
+		scalars = self.getScalars(location)
+
+		if self.useNumpy:
+			return np.dot(scalars, deltas)
+
+		result = array('d', [0.])*len(deltas[0])
+
+		for scalar, delta in zip(scalars, deltas):
+			if scalar:
+				result = array('d', [value + scalar*item for value, item in zip(result, delta)])
+
+		return result
+
+	def interpolateMany(self, deltas, locations):
+		'''Evaluates the glyph [deltas] (see getDeltas) at many locations in a single call. 
+		Returns:
+			numpy.ndarray of shape (locations, values) or list[array('d')] without NumPy
+		'''
+		if self.useNumpy:
+			return np.dot(self.getScalarMatrix(locations), deltas)
+
+		return [self.interpolate(deltas, location) for location in locations]
+
+	def interpolateMasters(self, masterValues, location):
+		'''Shortcut: solves the deltas and evaluates them at a single location'''
+		return self.interpolate(self.getDeltas(masterValues), location)
+
+class instanceAxis(object):
+	'''An axis of an instance grid: stem values of the instances along the axis and their axis positions.
+	Stems and positions are computed once, on first use (memoized).
+
+	Constructor:
+		instanceAxis(name, begin, end, steps): Linear progression of stems from begin to end
+		instanceAxis(..., progression='geometric'): 'linear', 'geometric', callable(begin, end, steps) returning the stems, or an explicit list of stems (custom)
+		instanceAxis(..., minimum=0, maximum=1000): Axis positions of the begin and end stem
+		instanceAxis(..., rounded=True): Round the stems to integers before the positions are derived from them (as fontFamilly does)
+
+	Attributes:
+		.stems (tuple(float)): Stem values of the instances
+		.positions (tuple(float)): Axis positions of the instances, proportional to the stems
+	'''
+	def __init__(self, name, begin, end, steps=2, progression='linear', minimum=0, maximum=1000, rounded=False):
+		self.name = name
+		self.begin, self.end = float(begin), float(end)
+		self.steps = len(progression) if isinstance(progression, (list, tuple)) else int(steps)
+		self.progression = progression
+		self.minimum, self.maximum = minimum, maximum
+		self.rounded = rounded
+		self.__stems, self.__positions = None, None
+
+	def __len__(self):
+		return self.steps
+
+	def __getitem__(self, index):
+		return (self.positions[index], self.stems[index])
+
+	def __repr__(self):
+		return '<%s: %s; Steps=%s; Progression=%s>' %(self.__class__.__name__, self.name, self.steps, self.progression if isinstance(self.progression, str) else 'custom')
+
+	@property
+	def stems(self):
+		if self.__stems is None:
+			if isinstance(self.progression, (list, tuple)):
+				stems = self.progression
+			elif self.steps < 2:
+				stems = [self.begin][:self.steps]
+			elif callable(self.progression):
+				stems = self.progression(self.begin, self.end, self.steps)
+			elif self.progression == 'geometric':
+				stems = geospread(self.begin, self.end, self.steps)
+			else:
+				stems = linspread(self.begin, self.end, self.steps)
+
+			self.__stems = tuple(float(round(stem) if self.rounded else stem) for stem in stems)
+
+		return self.__stems
+
+	@property
+	def positions(self):
+		if self.__positions is None:
+			begin, end = (self.stems[0], self.stems[-1]) if len(self.stems) else (0., 0.)
+
+			if end == begin: # No stem progression: spread evenly
+				positions = linspread(self.minimum, self.maximum, self.steps) if self.steps > 1 else [self.minimum]*self.steps
+			else:
+				positions = [self.minimum + ratfrac(stem - begin, end - begin, self.maximum - self.minimum) for stem in self.stems]
+
+			self.__positions = tuple(positions)
+
+		return self.__positions
+
+class instanceGrid(object):
+	'''Instance grid planner: the cartesian product of any number of instance axes (weight, width, optical size, grade...).
+	Instances are generated lazily (one at a time, by index or in batches) - the grid is never materialized.
+	Batches of locations can be handed directly to designspaceModel.interpolateMany.
+
+	Constructor:
+		instanceGrid(list[instanceAxis]): The last axis changes fastest
+
+	Example:
+		>>> grid = instanceGrid([instanceAxis('wght', 56, 178, 7, 'geometric'), instanceAxis('wdth', 0, 1000, 3)])
+		>>> for location, stems in grid: ...
+		>>> for start, values in grid.interpolate(model, deltas, 256): ...
+	'''
+	def __init__(self, axes):
+		self.axes = list(axes)
+
+	def __len__(self):
+		count = 1
+
+		for axis in self.axes:
+			count *= len(axis)
+
+		return count if len(self.axes) else 0
+
+	def __repr__(self):
+		return '<%s: Axes=%s; Instances=%s>' %(self.__class__.__name__, [axis.name for axis in self.axes], len(self))
+
+	def __getitem__(self, index):
+		'''Returns the instance at given flat index: tuple(dict{axis: position}, dict{axis: stem})'''
+		if index < 0: index += len(self)
+		if not 0 <= index < len(self): raise IndexError('instanceGrid index out of range')
+
+		indices = []
+
+		for axis in reversed(self.axes):
+			index, axisIndex = divmod(index, len(axis))
+			indices.append(axisIndex)
+
+		return self._instance(reversed(indices))
+
+	def __iter__(self):
+		from itertools import product
+		
+		for indices in product(*[xrange(len(axis)) for axis in self.axes]):
+			yield self._instance(indices)
+
+	def _instance(self, indices):
+		location, stems = {}, {}
+
+		for axis, axisIndex in zip(self.axes, indices):
+			location[axis.name], stems[axis.name] = axis[axisIndex]
+
+		return location, stems
+
+	def locations(self, start=0, stop=None):
+		'''Lazily generates the instance locations dict{axis: position} within given flat index range'''
+		from itertools import islice
+		
+		for location, stems in islice(iter(self), start, stop):
+			yield location
+
+	def batches(self, size=256):
+		'''Lazily generates the instance locations in lists of given size'''
+		batch = []
+
+		for location, stems in self:
+			batch.append(location)
+
+			if len(batch) == size:
+				yield batch
+				batch = []
+
+		if len(batch):
+			yield batch
+
+	def interpolate(self, model, deltas, size=256):
+		'''Evaluates the glyph [deltas] (see designspaceModel.getDeltas) at all instances, one batch at a time.
+		Locations are expected in the axis units of the model (see designspaceModel axes).
+
+		Yields:
+			tuple(int, values): Flat index of the first instance in the batch, results of designspaceModel.interpolateMany
+		'''
+		start = 0
+
+		for batch in self.batches(size):
+			yield start, model.interpolateMany(deltas, batch)
+			start += len(batch)
+
+# -- Custom Data types -------------------------------------------------------------------
+class arrayView(object):
+	'''Zero-copy window over a typed array (array.array). 
+	Reads and writes go straight to the underlying array. Slicing a view returns another view.
+	Note: Views are valid as long as the underlying array is not resized.
+
+	Constructor:
+		arrayView(array, start, stop)
+	'''
+	__slots__ = ('base', 'start', 'stop')
+
+	def __init__(self, base, start=0, stop=None):
+		self.base = base
+		self.start = start
+		self.stop = len(base) if stop is None else stop
+
+	def __len__(self):
+		return self.stop - self.start
+
+	def __index(self, i):
+		if i < 0: i += len(self)
+		if not 0 <= i < len(self): raise IndexError('arrayView index out of range')
+		return self.start + i
+
+	def __getitem__(self, i):
+		if isinstance(i, slice):
+			start, stop, step = i.indices(len(self))
+
+			if step != 1:
+				return self.base[self.start + start:self.start + stop:step] # Copy
+
+			return self.__class__(self.base, self.start + start, self.start + max(start, stop))
+
+		return self.base[self.__index(i)]
+
+	def __setitem__(self, i, value):
+		if isinstance(i, slice):
+			start, stop, step = i.indices(len(self))
+			self.base[self.start + start:self.start + stop:step] = array(self.base.typecode, value)
+		else:
+			self.base[self.__index(i)] = value
+
+	def __iter__(self):
+		from itertools import islice
+		return islice(self.base, self.start, self.stop)
+
+	def __repr__(self):
+		return '<%s: %s>' %(self.__class__.__name__, self.tolist())
+
+	def tolist(self):
+		return self.base[self.start:self.stop].tolist()
+
+	@property
+	def typecode(self):
+		return self.base.typecode
+
+	def asNumpy(self):
+		'''Zero-copy NumPy view of the window'''
+		return np.frombuffer(self.base, dtype=self.base.typecode)[self.start:self.stop]
+
+class coordArray(object):
+	'''Coordinate array: X, Y coordinates and node types kept in contiguous typed arrays.
+
+	Constructor:
+		coordArray(): Empty array
+		coordArray(list(x), list(y)): X and Y coordinate sequences
+		coordArray(list(x), list(y), list(type)): X, Y and node type sequences
+		coordArray(list(x...x, y...y)): Flat list holding all X followed by all Y coordinates
+
+	Attributes:
+		.x, .y (array('d')): Coordinates. Support the buffer protocol, see asNumpy()
+		.type (array('b')): Node types
+
+	Notes:
+		Slicing returns a zero-copy view (coordArray over arrayView) that shares the data with the original array.
+		Resizing a view (append, extend, insert, pop, remove) detaches it first: it becomes an independent copy.
+		Bounds are cached and invalidated by every mutating method. Call invalidate() after writing into .x or .y directly.
+	'''
+	def __init__(self, *argv):
+		self.__state = [0] # Mutation counter - shared with all views
+		self.__bounds = (-1, None)
+
+		if not len(argv):
+			x, y, nodeTypes = [], [], []
+
+		elif len(argv) in (2, 3):
+			x, y = argv[:2]
+			nodeTypes = argv[2] if len(argv) == 3 else []
+
+		elif len(argv) == 1:
+			if len(argv[0]) % 2:
+				raise ValueError('coordArray: Flat coordinate list of odd length (%s) - expected all X followed by all Y' %len(argv[0]))
+
+			split = len(argv[0])/2
+			x, y, nodeTypes = argv[0][0:split], argv[0][split:], []
+
+		else:
+			raise ValueError('coordArray: Expected up to 3 arguments, got %s' %len(argv))
+
+		self.x, self.y = array('d', x), array('d', y)
+		self.type = array('b', nodeTypes)
+
+	@classmethod
+	def _view(cls, parent, start, stop):
+		view = cls()
+		view.x = arrayView(parent.x, start, stop) if isinstance(parent.x, array) else parent.x[start:stop]
+		view.y = arrayView(parent.y, start, stop) if isinstance(parent.y, array) else parent.y[start:stop]
+		typeCount = len(parent.type)
+		view.type = arrayView(parent.type, min(start, typeCount), min(stop, typeCount)) if isinstance(parent.type, array) else parent.type[start:stop]
+		view._coordArray__state = parent._coordArray__state
+		return view
+
+	def __getitem__(self, i):
+		if isinstance(i, slice):
+			start, stop, step = i.indices(len(self))
+			
+			if step == 1:
+				return self._view(self, start, max(start, stop))
+
+			return self.__class__(self.x[i], self.y[i], self.type[i])
+
+		return (self.x[i], self.y[i])
+
+	def __len__(self):
+		return len(self.x)
+
+	def __setitem__(self, i, coordTuple):
+		self.x[i], self.y[i] = coordTuple
+		self.invalidate()
+
+	def __iter__(self):
+		from itertools import izip
+		return izip(self.x, self.y)
+
+	def __str__(self):
+		return str(zip(self.x, self.y))
+
+	def __repr__(self):
+		return '<Coordinate Array: Lenght=%s;>' %len(self.x)
+
+	def invalidate(self):
+		'''Mark array as changed - drops cached data (bounds)'''
+		self.__state[0] += 1
+
+	def __detach(self):
+		'''Views can not be resized: copy the viewed data into own arrays (no longer shared with the original)'''
+		if isinstance(self.x, arrayView) or isinstance(self.y, arrayView) or isinstance(self.type, arrayView):
+			self.x, self.y, self.type = array('d', self.x), array('d', self.y), array('b', self.type)
+			self.__state = [0]
+			self.__bounds = (-1, None)
+
+	def append(self, coordTuple, nodeType=-1):
+		self.__detach()
+		x, y = coordTuple
+		self.x.append(x)
+		self.y.append(y)
+		self.type.append(nodeType)
+		self.invalidate()
+
+	def extend(self, coordList):
+		self.__detach()
+
+		if isinstance(coordList, self.__class__):
+			self.x.extend(coordList.x)
+			self.y.extend(coordList.y)
+			self.type.extend(coordList.type)
+
+		elif isinstance(coordList, list):
+			self.x.extend(coordList[0])
+			self.y.extend(coordList[1])
+			self.type.extend(coordList[2] if len(coordList) > 2 else [-1]*len(coordList[0]))
+
+		self.invalidate()
+
+	def insert(self, index, coordTuple, nodeType=-1):
+		self.__detach()
+		x, y = coordTuple
+		self.x.insert(index, x)
+		self.y.insert(index, y)
+		self.type.insert(index, nodeType)
+		self.invalidate()
+
+	def index(self, coordTuple):
 		x, y = coordTuple
-		self.x.remove(x)
-		self.y.remove(y)
 
-	def pop(self, index=None):
-		return (self.x.pop(index), self.y.pop(index))
+		for i in range(len(self.x)):
+			if self.x[i] == x and self.y[i] == y:
+				return i
+
+		raise ValueError('coordArray.index(x): %s not in array' %(coordTuple,))
+
+	def remove(self, coordTuple):
+		self.pop(self.index(coordTuple))
+
+	def pop(self, index=-1):
+		self.__detach()
+		if len(self.type) == len(self.x): self.type.pop(index)
+		coordTuple = (self.x.pop(index), self.y.pop(index))
+		self.invalidate()
+		return coordTuple
 
 	def reverse(self):
-		self.x.reverse()
-		self.y.reverse()
+		for data in (self.x, self.y, self.type): # In place - views write through
+			data[:] = data[::-1]
+
+		self.invalidate()
 
 	def asPairs(self):
 		return [zip(self.x, self.y)]
@@ -405,23 +1643,50 @@ class coordArray(object):
 	def asList(self):
 		return [self.x, self.y]
 
+	def asNumpy(self):
+		'''Zero-copy NumPy views (X, Y) over the coordinate data. 
+		Note: Views are valid as long as the array is not resized (append, insert, pop...).
+		'''
+		asNumpy = lambda data: data.asNumpy() if isinstance(data, arrayView) else np.frombuffer(data, dtype=float)
+		return asNumpy(self.x), asNumpy(self.y)
+
 	def flatten(self):
-		return self.x + self.y
+		return array('d', self.x) + array('d', self.y)
 
 	def bounds(self):
-		return (min(self.x), min(self.y), max(self.x), max(self.y))
+		'''Returns cached (xmin, ymin, xmax, ymax) bounds'''
+		version, bounds = self.__bounds
+
+		if version != self.__state[0]:
+			bounds = (min(self.x), min(self.y), max(self.x), max(self.y))
+			self.__bounds = (self.__state[0], bounds)
+
+		return bounds
 
 	def items(self):
 		return zip(self.x, self.y, self.type)
 
+	def iterPairs(self):
+		'''Iterate over (x, y) pairs without building a list'''
+		from itertools import izip
+		return izip(self.x, self.y)
+
+	def iterItems(self):
+		'''Iterate over (x, y, type) triples without building a list'''
+		from itertools import izip
+		return izip(self.x, self.y, self.type)
+
 
 # -- Geometry classes --------------------------------------------------------------------
 # --- Transformations --------------------------------------------------------------------
 class transform(object):
-	'''	Affine transformations '''
+	'''	Affine transformations 
+	Coefficients are stored (cached) as a tuple of floats (xx, xy, yx, yy, dx, dy) where:
+	x' = xx*x + yx*y + dx; y' = xy*x + yy*y + dy
+	'''
 
 	def __init__(self, xx=1.0, xy=0.0, yx=0.0, yy=1.0, dx=0.0, dy=0.0):
-		self.__affine = map(float, (xx, xy, yx, yy, dx, dy))
+		self.__affine = (float(xx), float(xy), float(yx), float(yy), float(dx), float(dy))
 
 	def __normSinCos(self, v):
 		EPSILON = 1e-15
@@ -438,9 +1703,55 @@ class transform(object):
 
 	def applyTransformation(self, x, y):
 		x, y = float(x), float(y)
-		xx, xy, yx, yy, dx, dy = map(float, self.__affine)
+		xx, xy, yx, yy, dx, dy = self.__affine
 		return (xx * x + yx * y + dx, xy * x + yy * y + dy)
 
+	def apply_many(self, xs, ys, inPlace=False):
+		'''Apply the transformation to many points at once.
+		Arguments:
+			xs, ys (list, array('d') or numpy.ndarray): X and Y coordinates
+			inPlace (bool): Write the results back into [xs] and [ys] (they should be mutable)
+		Returns:
+			tuple(xs, ys): Transformed coordinates (numpy.ndarray for NumPy input, array('d') otherwise)
+		'''
+		xx, xy, yx, yy, dx, dy = self.__affine
+
+		if np is not None and isinstance(xs, np.ndarray) and isinstance(ys, np.ndarray):
+			new_xs = xx * xs + yx * ys + dx
+			new_ys = xy * xs + yy * ys + dy
+
+			if inPlace:
+				xs[:], ys[:] = new_xs, new_ys
+				return xs, ys
+
+			return new_xs, new_ys
+
+		new_xs = array('d', [xx * x + yx * y + dx for x, y in zip(xs, ys)])
+		new_ys = array('d', [xy * x + yy * y + dy for x, y in zip(xs, ys)])
+
+		if inPlace:
+			xs[:] = new_xs if isinstance(xs, array) else list(new_xs)
+			ys[:] = new_ys if isinstance(ys, array) else list(new_ys)
+			return xs, ys
+
+		return new_xs, new_ys
+
+	def apply_array(self, coordArray, inPlace=False):
+		'''Apply the transformation to a brain.coordArray.
+		Arguments:
+			coordArray (coordArray): Coordinate array
+			inPlace (bool): Modify the given array instead of returning a new one
+		Returns:
+			coordArray
+		'''
+		new_xs, new_ys = self.apply_many(coordArray.x, coordArray.y, inPlace)
+
+		if inPlace:
+			coordArray.invalidate()
+			return coordArray
+		
+		return coordArray.__class__(new_xs, new_ys, coordArray.type)
+
 	def translate(self, dx, dy):
 		return self.transform((1.0, 0.0, 0.0, 1.0, float(dx), float(dy)))
 
@@ -459,7 +1770,7 @@ class transform(object):
 
 	def transform(self, other):
 		xx1, xy1, yx1, yy1, dx1, dy1 = map(float, other)
-		xx2, xy2, yx2, yy2, dx2, dy2 = map(float, self.__affine)
+		xx2, xy2, yx2, yy2, dx2, dy2 = self.__affine
 		return self.__class__(
 				xx1 * xx2 + xy1 * yx2,
 				xx1 * xy2 + xy1 * yy2,
@@ -469,7 +1780,7 @@ class transform(object):
 				xy2 * dx1 + yy2 * dy1 + dy2)
 
 	def reverseTransform(self, other):
-		xx1, xy1, yx1, yy1, dx1, dy1 = map(float, self.__affine)
+		xx1, xy1, yx1, yy1, dx1, dy1 = self.__affine
 		xx2, xy2, yx2, yy2, dx2, dy2 = map(float, other)
 		return self.__class__(
 				xx1 * xx2 + xy1 * yx2,
@@ -491,6 +1802,32 @@ class transform(object):
 
 		return self.__class__(xx, xy, yx, yy, dx, dy)
 
+	@classmethod
+	def compose(cls, *transformations):
+		'''Compose a chain of transformations into a single matrix. Transformations are applied in the order given.
+		Arguments:
+			*transformations: transform objects, six element affine sequences or operation tuples 
+			as ('translate', dx, dy), ('scale', sx, sy), ('rotate', angle), ('skew', ax, ay)
+		Returns:
+			transform
+
+		Example: transform.compose(('translate', -100, 0), ('skew', 12, 0), ('translate', 100, 0))
+		'''
+		result = cls()
+
+		for item in transformations:
+			if len(item) and isinstance(item[0], basestring):
+				item = getattr(cls(), item[0])(*item[1:])
+
+			result = result.reverseTransform(item)
+
+		return result
+
+	def asQTransform(self):
+		'''Returns QTransform with the same coefficients'''
+		from PythonQt.QtGui import QTransform
+		return QTransform(*self.__affine)
+
 	def __len__(self):
 		return 6
 
@@ -501,9 +1838,7 @@ class transform(object):
 		return self.__affine[i:j]
 
 	def __cmp__(self, other):
-		xx1, xy1, yx1, yy1, dx1, dy1 = map(float(self.__affine))
-		xx2, xy2, yx2, yy2, dx2, dy2 = map(float(other))
-		return cmp((xx1, xy1, yx1, yy1, dx1, dy1), (xx2, xy2, yx2, yy2, dx2, dy2))
+		return cmp(self.__affine, tuple(map(float, other)))
 
 	def __hash__(self):
 		return hash(self.__affine)
@@ -513,91 +1848,75 @@ class transform(object):
 
 # --- Abstractions -----------------------------------------------------------------------
 class _Point(object): 
-	def __init__(self, *argv):
-		from typerig.brain import transform
+	'''Compact 2D point/vector. 
+	Angle and transformation are created lazily on first access, arithmetic has fast paths for point-point and point-scalar operations.
+	'''
+	__slots__ = ('x', 'y', 'magnitude', '_angle', '_transform')
 
-		multiCheck = lambda t, type: all([isinstance(i, type) for i in t])
+	def __init__(self, *argv):
+		if len(argv) == 2:
+			self.x, self.y = argv
 
-		if len(argv):
-			if isinstance(argv[0], self.__class__):
+		elif len(argv) == 1:
+			if isinstance(argv[0], _Point):
 				self.x, self.y = argv[0].x, argv[0].y
-
-			if multiCheck(argv, float) or multiCheck(argv, int) :
-				self.x, self.y = argv[0], argv[1]
-			
-			if multiCheck(argv, tuple) or multiCheck(argv, list) :
+			else:
 				self.x, self.y = argv[0]
 		else:
 			self.x, self.y = 0., 0.
 
-		self.setAngle(0)
-		self.setTransform()
+	@classmethod
+	def _new(cls, x, y):
+		'''Internal! Fast constructor bypassing argument parsing'''
+		newPoint = object.__new__(cls)
+		newPoint.x, newPoint.y = x, y
+		return newPoint
 
 	# -- Operators
 	def __add__(self, other):
-		if isinstance(other, self.__class__):
-			return self.__class__(self.x + other.x, self.y + other.y)
+		if isinstance(other, _Point):
+			return self._new(self.x + other.x, self.y + other.y)
 		
-		elif isinstance(other, int):
-			return self.__class__(self.x + other, self.y + other)
-
-		elif isinstance(other, float):
-			return self.__class__(self.x + other, self.y + other)
+		elif isinstance(other, (int, float)):
+			return self._new(self.x + other, self.y + other)
 		
 		elif isinstance(other, tuple):
-			return self.__class__(self.x + other[0], self.y + other[1])
+			return self._new(self.x + other[0], self.y + other[1])
 		
-		elif isinstance(other, list):
-			pass
-
-		elif isinstance(other, str):
+		elif isinstance(other, (list, str)):
 			pass
 
 		else:
 			print 'ERRO\t Cannot evaluate Coordinate Object <<%s,%s>> with %s' %(self.x, self.y, type(other))
 
 	def __sub__(self, other):
-		if isinstance(other, self.__class__):
-			return self.__class__(self.x - other.x, self.y - other.y)
+		if isinstance(other, _Point):
+			return self._new(self.x - other.x, self.y - other.y)
 		
-		elif isinstance(other, int):
-			return self.__class__(self.x - other, self.y - other)
-
-		elif isinstance(other, float):
-			return self.__class__(self.x - other, self.y - other)
+		elif isinstance(other, (int, float)):
+			return self._new(self.x - other, self.y - other)
 		
 		elif isinstance(other, tuple):
-			return self.__class__(self.x - other[0], self.y - other[1])
+			return self._new(self.x - other[0], self.y - other[1])
 		
-		elif isinstance(other, list):
-			pass
-
-		elif isinstance(other, str):
+		elif isinstance(other, (list, str)):
 			pass
 
 		else:
 			print 'ERRO\t Cannot evaluate Coordinate Object <<%s,%s>> with %s' %(self.x, self.y, type(other))
 
 	def __mul__(self, other):
-		if isinstance(other, self.__class__):
-			a = complex(self.x , self.y)
-			b = complex(other.x, other.y)
-			product = a * b
-			return self.__class__(product.real, product.imag)
-		
-		elif isinstance(other, int):
-			return self.__class__(self.x * other, self.y * other)
+		if isinstance(other, (int, float)):
+			return self._new(self.x * other, self.y * other)
 
-		elif isinstance(other, float):
-			return self.__class__(self.x * other, self.y * other)
+		elif isinstance(other, _Point):
+			product = complex(self.x, self.y) * complex(other.x, other.y)
+			return self._new(product.real, product.imag)
 		
 		elif isinstance(other, tuple):
-			return self.__class__(self.x * other[0], self.y * other[1])
+			return self._new(self.x * other[0], self.y * other[1])
 		
-		elif isinstance(other, list):
-			pass
-
-		elif isinstance(other, str):
+		elif isinstance(other, (list, str)):
 			pass
 
 		else:
@@ -606,25 +1925,20 @@ class _Point(object):
 	__rmul__ = __mul__
 
 	def __div__(self, other):
-		if isinstance(other, self.__class__):
-			a = complex(self.x , self.y)
-			b = complex(other.x, other.y)
-			product = a / b
-			return self.__class__(product.real, product.imag)
-		
-		elif isinstance(other, int):
-			return self.__class__(self.x / other, self.y / other)
+		if isinstance(other, int):
+			return self._new(self.x / other, self.y / other)
 
 		elif isinstance(other, float):
-			return self.__class__(self.x // other, self.y // other)
+			return self._new(self.x // other, self.y // other)
+
+		elif isinstance(other, _Point):
+			product = complex(self.x, self.y) / complex(other.x, other.y)
+			return self._new(product.real, product.imag)
 		
 		elif isinstance(other, tuple):
-			return self.__class__(self.x // other[0], self.y // other[1])
+			return self._new(self.x // other[0], self.y // other[1])
 		
-		elif isinstance(other, list):
-			pass
-
-		elif isinstance(other, str):
+		elif isinstance(other, (list, str)):
 			pass
 
 		else:
@@ -638,59 +1952,61 @@ class _Point(object):
 
 	def __and__(self, other):
 		'''self & other: Used as for Scalar product'''
-		if isinstance(other, self.__class__):
+		if isinstance(other, _Point):
 			return self.x * other.x + self.y * other.y
 		
-		elif isinstance(other, int):
-			return self.x * other + self.y * other
-
-		elif isinstance(other, float):
+		elif isinstance(other, (int, float)):
 			return self.x * other + self.y * other
 		
 		elif isinstance(other, tuple):
 			return self.x * other[0] + self.y * other[1]
-		
-		elif isinstance(other, list):
-			pass
-
-		elif isinstance(other, str):
-			pass
 
 	def __or__(self, other):
 		'''self | other: Used as for Cross product'''
-		if isinstance(other, self.__class__):
+		if isinstance(other, _Point):
 			return self.x * other.y - self.y * other.x
 		
-		elif isinstance(other, int):
-			return self.x * other - self.y * other
-
-		elif isinstance(other, float):
+		elif isinstance(other, (int, float)):
 			return self.x * other - self.y * other
 		
 		elif isinstance(other, tuple):
 			return self.x * other[1] - self.y * other[0]
-		
-		elif isinstance(other, list):
-			pass
-
-		elif isinstance(other, str):
-			pass
 
 	def __abs__(self):
-		from math import sqrt
-		return sqrt(self.x**2 + self.y**2)
+		from math import hypot
+		return hypot(self.x, self.y)
 
 	def __repr__(self):
 		return '<Point: %s,%s>' %(self.x, self.y)
 
+	# -- Lazy attributes
+	@property
+	def angle(self):
+		return getattr(self, '_angle', 0)
+
+	@angle.setter
+	def angle(self, angle):
+		self._angle = angle
+
+	@property
+	def transform(self):
+		transformObject = getattr(self, '_transform', None)
+
+		if transformObject is None:
+			transformObject = self._transform = transform()
+
+		return transformObject
+
+	@transform.setter
+	def transform(self, transformObject):
+		self._transform = transformObject
+
 	# -- Setters 
 	def setAngle(self, angle):
-		self.angle = angle
+		self._angle = angle
 
 	def setTransform(self, transformObject=None):
-		from typerig.brain import transform
-		
-		self.transform = transform() if transformObject is None else transformObject
+		self._transform = transformObject # None: default (identity) transformation created on first access
 	
 	# -- Getters
 	def getMagnitude(self):
@@ -883,91 +2199,141 @@ class _Curve(object):
 		slices = [(x1,y1), (x12,y12), (x123,y123), (x1234,y1234), (x234,y234), (x34,y34), (x4,y4)] 
 		
 		if resultInt:
-			return map(lambda x, y : (int(x), int(y)), slices)
+			return [(int(x), int(y)) for x, y in slices]
 		else:
 			return slices
 
-	def solveDistance2Start(self, distance, timeStep = .01 ):
-		'''Returns [time] at which the given [distance] to [FIRST curve node] is met. 
-		Probing is executred withing [timeStep] in range from 0 to 1. The finer the step the preciser the results.
+	def getDerivative(self, time):
+		'''Returns the first derivative (tangent vector) of the curve at given [time]
+		Output: tuple (dx, dy)
 		'''
+		rtime = 1 - time
+		a, b, c = 3*rtime*rtime, 6*rtime*time, 3*time*time
+		dx = a*(self.p1.x - self.p0.x) + b*(self.p2.x - self.p1.x) + c*(self.p3.x - self.p2.x)
+		dy = a*(self.p1.y - self.p0.y) + b*(self.p2.y - self.p1.y) + c*(self.p3.y - self.p2.y)
+		return (dx, dy)
 
+	def getSpeed(self, time):
+		'''Returns the magnitude of the first derivative of the curve at given [time]'''
 		from math import hypot
-		
-		measure = 0
-		time = 0
+		return hypot(*self.getDerivative(time))
 
-		while measure < distance and time < 1:
-			cNode = self.getNode(time, False)
-			measure = hypot(-self.p0.x + cNode[0], -self.p0.y + cNode[1])
-			#print 'S', measure, time			
-			time += timeStep
-
-		return time
+	def _quadLength(self, t0, t1, order=16):
+		'''Arc length of the curve between times [t0] and [t1] using fixed order Gauss-Legendre quadrature'''
+		from math import hypot
 
-	def solveDistance2End(self, distance, timeStep = .01 ):
-		'''Returns [time] at which the given [distance] to [LAST curve node] is met. 
-		Probing is executred withing [timeStep] in range from 0 to 1. The finer the step the preciser the results.
+		nodes, weights = gaussLegendre(order)
+		half, mid = .5*(t1 - t0), .5*(t1 + t0)
+		
+		d0x, d0y = self.p1.x - self.p0.x, self.p1.y - self.p0.y
+		d1x, d1y = self.p2.x - self.p1.x, self.p2.y - self.p1.y
+		d2x, d2y = self.p3.x - self.p2.x, self.p3.y - self.p2.y
+		length = 0.
+
+		for node, weight in zip(nodes, weights):
+			time = mid + half*node
+			rtime = 1 - time
+			a, b, c = 3*rtime*rtime, 6*rtime*time, 3*time*time
+			length += weight*hypot(a*d0x + b*d1x + c*d2x, a*d0y + b*d1y + c*d2y)
+
+		return length*half
+
+	def getLength(self, t0=0., t1=1., tolerance=1e-6):
+		'''Returns the arc length of the curve between times [t0] and [t1].
+		Uses adaptive Gauss-Legendre quadrature, bisecting until the result is within given [tolerance].
 		'''
+		def adaptive(t0, t1, whole, depth):
+			tm = .5*(t0 + t1)
+			left, right = self._quadLength(t0, tm), self._quadLength(tm, t1)
+			
+			if depth >= 12 or abs(left + right - whole) <= tolerance:
+				return left + right
 
-		from math import hypot
-		
-		measure = 0
-		time = 1
+			return adaptive(t0, tm, left, depth + 1) + adaptive(tm, t1, right, depth + 1)
 
-		while measure < distance and time > 0:
-			cNode = self.getNode(time, False)
-			measure = hypot(-self.p3.x + cNode[0], -self.p3.y + cNode[1])
-			#print 'E', measure, time
-			time -= timeStep
+		if t0 == t1: return 0.
+		return adaptive(t0, t1, self._quadLength(t0, t1), 0)
 
-		return time
+	def getArcLengthTable(self, samples=32):
+		'''Returns the arc length lookup table (arcLengthTable) of the curve. 
+		The table is cached and rebuilt only if the curve has changed or the number of [samples] differs.
+		'''
+		signature = (samples, self.p0.x, self.p0.y, self.p1.x, self.p1.y, self.p2.x, self.p2.y, self.p3.x, self.p3.y)
+		table = getattr(self, '_arcLengthTable', None)
 
-	def getExtremes(self): # (x0, y0, x1, y1, x2, y2, x3, y3)
-		'''Finds curve extremes and returns [(extreme_01_x, extreme_01_y, extreme_01_t)...(extreme_n_x, extreme_n_y, extreme_n_t)]'''
+		if table is None or table.signature != signature:
+			table = arcLengthTable(self, samples)
+			table.signature = signature
+			self._arcLengthTable = table
 
-		tvalues, points = [], []
-		x0, y0 = self.p0.x, self.p0.y
-		x1, y1 = self.p1.x, self.p1.y
-		x2, y2 = self.p2.x, self.p2.y
-		x3, y3 = self.p3.x, self.p3.y
+		return table
 
-		for i in range(0,2):
-			if i == 0:
-				b = float(6 * x0 - 12 * x1 + 6 * x2)
-				a = float(-3 * x0 + 9 * x1 - 9 * x2 + 3 * x3)
-				c = float(3 * x1 - 3 * x0)
+	def solveLength(self, distance, tolerance=1e-6, useTable=True):
+		'''Returns [time] at which the given arc length [distance] measured along the curve from its [FIRST node] is met.
+		Inverse is solved by Newton iteration safeguarded by bisection within the given [tolerance].
+		The (cached) arc length lookup table is used for bracketing when [useTable] is set.
+		'''
+		if useTable:
+			table = self.getArcLengthTable()
+			length = table.length
+		else:
+			length = self.getLength(tolerance=tolerance*.1)
+		
+		if distance <= 0: return 0.
+		if distance >= length: return 1.
 
-			else:
-				b = float(6 * y0 - 12 * y1 + 6 * y2)
-				a = float(-3 * y0 + 9 * y1 - 9 * y2 + 3 * y3)
-				c = float(3 * y1 - 3 * y0)
+		if useTable:
+			lo, hi, base = table.getBracket(distance)
+			time = table.getTime(distance)
+		else:
+			lo, hi, base = 0., 1., 0.
+			time = float(distance)/length
+		
+		anchor = lo
 
-			if abs(a) < 1e-12:        # Numerical robustness
-				if abs(b) < 1e-12:    # Numerical robustness
-					continue
+		for iteration in range(50):
+			error = base + self.getLength(anchor, time, tolerance*.1) - distance
 
-				t = -c / b
+			if abs(error) <= tolerance: break
 
-				if 0 < t and t < 1:
-					tvalues.append(t)
+			if error > 0: 
+				hi = time
+			else: 
+				lo = time
 
-				continue
+			speed = self.getSpeed(time)
+			newTime = time - error/speed if speed > 0 else lo - 1.
+			time = newTime if lo < newTime < hi else .5*(lo + hi) # Fallback to bisection
 
-			b2ac = float(b * b - 4 * c * a)
+		return time
 
-			if b2ac < 0:
-				continue
-			else:
-				sqrtb2ac = math.sqrt(b2ac)
+	def solveLengths(self, distances, tolerance=1e-6):
+		'''Batch version of solveLength: returns list of [time] for every arc length distance given, using a single lookup table'''
+		self.getArcLengthTable()
+		return [self.solveLength(distance, tolerance) for distance in distances]
+
+	def solveDistance2Start(self, distance, tolerance=1e-6):
+		'''Returns [time] at which the given [distance] along the curve from its [FIRST curve node] is met. 
+		Exact (within [tolerance]) inverse arc length solution.
+		'''
+		return self.solveLength(distance, tolerance)
+
+	def solveDistance2End(self, distance, tolerance=1e-6):
+		'''Returns [time] at which the given [distance] along the curve from its [LAST curve node] is met. 
+		Exact (within [tolerance]) inverse arc length solution.
+		'''
+		return self.solveLength(self.getArcLengthTable().length - distance, tolerance)
+
+	def getExtremes(self): # (x0, y0, x1, y1, x2, y2, x3, y3)
+		'''Finds curve extremes and returns [(extreme_01_x, extreme_01_y, extreme_01_t)...(extreme_n_x, extreme_n_y, extreme_n_t)]'''
 
-			t1 = (-b + sqrtb2ac) / (2 * a)
-			if 0 < t1 and t1 < 1:
-				tvalues.append(t1)
+		points = []
+		x0, y0 = self.p0.x, self.p0.y
+		x1, y1 = self.p1.x, self.p1.y
+		x2, y2 = self.p2.x, self.p2.y
+		x3, y3 = self.p3.x, self.p3.y
 
-			t2 = (-b - sqrtb2ac) / (2 * a)
-			if 0 < t2 and t2 < 1:
-				tvalues.append(t2)
+		tvalues = cubicExtremeTimes(x0, x1, x2, x3) + cubicExtremeTimes(y0, y1, y2, y3)
 
 		for j in range(0,len(tvalues)):
 			t = tvalues[j]
@@ -979,71 +2345,54 @@ class _Curve(object):
 
 		return points
 
+	def getBounds(self):
+		'''Returns the tight bounding box (end points and extremes) of the curve as bounds object'''
+		return bounds.fromBox(*cubicBounds(self.p0.x, self.p0.y, self.p1.x, self.p1.y, self.p2.x, self.p2.y, self.p3.x, self.p3.y))
+
+	def intersectLine(self, line, bounded=False):
+		'''Find where the curve crosses given [line] (_Line or pair of points).
+
+		Arguments:
+			line (_Line or tuple((x0,y0), (x1,y1)))
+			bounded (bool): Only the line segment between its two points counts, not the infinite line
+		Returns:
+			list[tuple(x, y, t)]: Sorted by curve time t
+		'''
+		hits = CurveBatch([self.asList()], useNumpy=False).intersectLine(*(line.p0, line.p1) if isinstance(line, _Line) else line, bounded=bounded)
+		return zip(*hits[2:4] + hits[1:2])
+
+	def intersectCurve(self, other):
+		'''Find where the curve crosses [other] curve.
+		Returns:
+			list[tuple(x, y, t_self, t_other)]: Sorted by t_self
+		'''
+		controlsA = [value for point in self.asList() for value in (point.x, point.y)]
+		controlsB = [value for point in other.asList() for value in (point.x, point.y)]
+		return [(x, y, tA, tB) for tA, tB, x, y in curveIntersections(controlsA, controlsB)]
+
 
 	def solveParallelT(self, vector, fullOutput = False):
 		'''Finds the t value along a cubic Bezier where a tangent (1st derivative) is parallel with the direction vector.
 		vector: a pair of values representing the direction of interest (magnitude is ignored).
-		returns 0.0 <= t <= 1.0 or None
+		returns 0.0 < t < 1.0 or None (no or more than one solution); fullOutput - list of all solutions sorted by time
 		
-		# Solving the dot product of cubic beziers first derivate to the vector given B'(t) x V. Two vectors are perpendicular if their dot product is zero. 
-		# So if you could find the (1) perpendicular of V it will be collinear == tangent of the curve so the equation to be solved is:
-		# B'(t) x V(x,y) = 0; -(a*t^2 + b*t + c)*x + (g*t^2 + h*t + i)*y = 0 solved for t, where a,b,c are coefs for X and g,h,i for Y B'(t) derivate of curve
-		# 
-		# Inspired by answer given by 'unutbu' on the stackoverflow question: http://stackoverflow.com/questions/20825173/how-to-find-a-point-if-any-on-quadratic-bezier-with-a-given-tangent-direction
-		# Recoded and recalculated for qubic beziers. Used 'Rearrange It' app at http://www.wolframalpha.com/widgets/view.jsp?id=4be4308d0f9d17d1da68eea39de9b2ce was invaluable.
-		#
-		# DOTO: Fix calculation optimization error - will yield false positive result in cases #1 and #2 if vector is 45 degrees
+		# The tangent B'(t) is parallel to V(x,y) when their cross product is zero: B'(t) x V = 0.
+		# That is the derivative of the curve projected on the normal of V: s(t) = B(t) x V = x*By(t) - y*Bx(t),
+		# so the tangent points are simply the extremes of the 1D cubic s(t), solved by the (cancellation free) cubicExtremeTimes.
+		# Note: Older versions solved B'(t) . V mirrored and yielded false positives for 45 degree vectors.
 		'''
-		from math import sqrt
-
-		def polyCoef(p): # Helper function
-			a = float(-3 * p[0] + 9 * p[1] - 9 * p[2] + 3 * p[3])
-			b = float(6 * p[0] - 12 * p[1] + 6 * p[2])
-			c = float(3 * p[1] - 3 * p[0])
-			return a, b, c
-
-		# - Get Coefs
-		x , y = vector[0], vector[1]
-		a, b, c = polyCoef([self.p0.x, self.p1.x, self.p2.x, self.p3.x])
-		g, h, i = polyCoef([self.p0.y, self.p1.y, self.p2.y, self.p3.y])
+		x, y = float(vector[0]), float(vector[1])
+		s0, s1, s2, s3 = [x*p.y - y*p.x for p in (self.p0, self.p1, self.p2, self.p3)]
 
-		# -- Support eq
-		bx_hy = float(b*x - h*y)
-		cx_iy = float(c*x - i*y)
-		ax_gy = float(a*x - g*i)
-
-		if x == 0 and y != 0 and g == 0 and h != 0 : #1 Optimisation
-			t = -i/h
-			return t
-
-		elif x != 0 and a == (g*y)/x and bx_hy != 0: #2 Optimisation
-			t = -cx_iy/bx_hy
-			return t
+		if max(abs(s1 - s0), abs(s2 - s0), abs(s3 - s0)) <= 1e-9*(1. + max(abs(s0), abs(s1), abs(s2), abs(s3))):
+			tc = [] # Straight curve parallel to the vector - every t is a solution
+		else:
+			tc = sorted(cubicExtremeTimes(s0, s1, s2, s3))
 
-		elif ax_gy != 0: #3 Regular result
-			longPoly = float(bx_hy*bx_hy - 4*cx_iy*ax_gy)
-			
-			if longPoly > 0:
-				sqrtLongPoly = sqrt(longPoly)
-				
-				numrPos = sqrtLongPoly - bx_hy
-				numrNeg = -sqrtLongPoly - bx_hy
-				
-				dnom = 2*ax_gy
+		if fullOutput:
+			return tc
 
-				ts = [numrPos/dnom, numrNeg/dnom] # solved t's for numrPos and numrNeg
-				tc = [t for t in ts if 0 <= t <= 1] # get correct t
-				
-				if fullOutput:
-					return ts
-				else:
-					if len(tc) and len(tc) < 2:
-						return tc[0]
-					else:
-						return None # Undefined point of intersection - two t's		
-				
-			else:
-				return None
+		return tc[0] if len(tc) == 1 else None # Undefined point of tangency - two t's
 
 	def eqProportionalHandles(self, proportion=.3):
 		'''Equalizes handle length to given float(proportion)'''
@@ -1087,7 +2436,7 @@ class _Curve(object):
 		def hobby(theta, phi):
 			st, ct = sin(theta), cos(theta)
 			sp, cp = sin(phi), cos(phi)
-			velocity = (2 + sqrt(2) * (st - 1/16*sp) * (sp - 1/16*st) * (ct - cp)) / (3 * (1 + 0.5*(sqrt(5) - 1) * ct + 0.5*(3 - sqrt(5)) * cp))
+			velocity = (2 + sqrt(2) * (st - sp/16.) * (sp - st/16.) * (ct - cp)) / (3 * (1 + 0.5*(sqrt(5) - 1) * ct + 0.5*(3 - sqrt(5)) * cp))
 			return velocity
 
 		def controls(z0, w0, alpha, beta, w1, z1):
@@ -1136,7 +2485,7 @@ class _Curve(object):
 		def hobby(theta, phi):
 			st, ct = sin(theta), cos(theta)
 			sp, cp = sin(phi), cos(phi)
-			velocity = (2 + sqrt(2) * (st - 1/16*sp) * (sp - 1/16*st) * (ct - cp)) / (3 * (1 + 0.5*(sqrt(5) - 1) * ct + 0.5*(3 - sqrt(5)) * cp))
+			velocity = (2 + sqrt(2) * (st - sp/16.) * (sp - st/16.) * (ct - cp)) / (3 * (1 + 0.5*(sqrt(5) - 1) * ct + 0.5*(3 - sqrt(5)) * cp))
 			return velocity
 
 		def getCurvature(z0, w0, u, v, w1, z1):
@@ -1263,30 +2612,1014 @@ class _Curve(object):
 		return self.__class__(self.p0, self.p1, self.p2, self.p3)
 
 
+class arcLengthTable(object):
+	'''Arc length lookup table of a cubic curve: cumulative arc lengths sampled at equally spaced times.
+	Used for fast bracketing of inverse arc length queries.
+
+	Constructor:
+		arcLengthTable(_Curve, samples)
+
+	Attributes:
+		.times (list(float)): Sampled times
+		.lengths (list(float)): Cumulative arc length at every sampled time
+		.length (float): Total arc length of the curve
+	'''
+	def __init__(self, curve, samples=32):
+		self.signature = None
+		self.times = [float(i)/samples for i in range(samples + 1)]
+		self.lengths = [0.]
+
+		for i in range(samples):
+			self.lengths.append(self.lengths[-1] + curve.getLength(self.times[i], self.times[i + 1]))
+
+		self.length = self.lengths[-1]
+
+	def __repr__(self):
+		return '<%s: Samples=%s; Length=%s>' %(self.__class__.__name__, len(self.times) - 1, self.length)
+
+	def _locate(self, distance):
+		from bisect import bisect_right
+		return min(max(bisect_right(self.lengths, distance) - 1, 0), len(self.times) - 2)
+
+	def getBracket(self, distance):
+		'''Returns (time_lo, time_hi, length_at_time_lo) of the table interval containing given arc length [distance]'''
+		index = self._locate(distance)
+		return self.times[index], self.times[index + 1], self.lengths[index]
+
+	def getTime(self, distance):
+		'''Approximate (linear within table interval) time at given arc length [distance]'''
+		index = self._locate(distance)
+		lo, base = self.times[index], self.lengths[index]
+		span = self.lengths[index + 1] - base
+		return lo + (self.times[index + 1] - lo)*(distance - base)/span if span > 0 else lo
+
+# --- Batch processing -------------------------------------------------------------------
+class CurveBatch(object):
+	'''Batch of cubic Bezier segments stored as contiguous float arrays. 
+	Evaluates, slices and solves extremes for all segments in a single (vectorized) call.
+	Uses NumPy when available, pure Python (array.array) otherwise. Results match the scalar _Curve methods.
+
+	Constructor:
+		CurveBatch(): Empty batch
+		CurveBatch(list[_Curve])
+		CurveBatch(list[tuple(p0, p1, p2, p3)]): Where points are (x,y) tuples/lists or objects with .x and .y attributes (_Point, Coord, flNode)
+		CurveBatch(..., useNumpy=False): Force pure Python processing
+
+	Attributes:
+		.x0, .y0, .x1, .y1, .x2, .y2, .x3, .y3 (array('d') or numpy.ndarray): Control point coordinates of all segments
+		.useNumpy (bool): Vectorized processing via NumPy
+	'''
+	_fields = ('x0', 'y0', 'x1', 'y1', 'x2', 'y2', 'x3', 'y3')
+
+	def __init__(self, data=None, useNumpy=None):
+		self.useNumpy = np is not None and (useNumpy is None or bool(useNumpy))
+		columns = [[] for field in self._fields]
+
+		if data is not None:
+			for item in data:
+				points = item.asList() if isinstance(item, _Curve) else item
+
+				for pid in range(4):
+					x, y = self._getXY(points[pid])
+					columns[2*pid].append(x)
+					columns[2*pid + 1].append(y)
+
+		self._setColumns(columns)
+
+	@classmethod
+	def fromArrays(cls, x0, y0, x1, y1, x2, y2, x3, y3, useNumpy=None):
+		'''Build a batch directly from eight coordinate sequences of equal length'''
+		newBatch = cls(useNumpy=useNumpy)
+		newBatch._setColumns([x0, y0, x1, y1, x2, y2, x3, y3])
+		return newBatch
+
+	@classmethod
+	def concat(cls, batches, useNumpy=None):
+		'''Join many batches (ex. the segments of all contours of all glyphs) into one'''
+		newBatch = cls(useNumpy=useNumpy)
+
+		if len(batches):
+			columns = zip(*[batch._columns() for batch in batches])
+			
+			if newBatch.useNumpy:
+				newBatch._setColumns([np.concatenate(column) for column in columns])
+			else:
+				newBatch._setColumns([[value for values in column for value in values] for column in columns])
+
+		return newBatch
+
+	# - Internal -------------------------------
+	@staticmethod
+	def _getXY(point):
+		if isinstance(point, (tuple, list)):
+			return float(point[0]), float(point[1])
+		
+		return float(point.x), float(point.y)
+
+	def _newArray(self, values):
+		return np.array(values, dtype=float) if self.useNumpy else array('d', values)
+
+	def _setColumns(self, columns):
+		for field, values in zip(self._fields, columns):
+			setattr(self, field, self._newArray(values))
+
+	def _columns(self):
+		return [getattr(self, field) for field in self._fields]
+
+	def _times(self, time):
+		'''Expand scalar time to one time per curve'''
+		if isinstance(time, (int, float)):
+			return [float(time)]*len(self)
+
+		assert len(time) == len(self), 'Times given (%s) do not match curves in batch (%s)' %(len(time), len(self))
+		return time
+
+	def _deCasteljau(self, time):
+		'''Returns all intermediate points of the De Casteljau subdivision of every curve at given time'''
+		x1, y1, x2, y2, x3, y3, x4, y4 = self._columns()
+
+		if self.useNumpy:
+			t = np.asarray(time, dtype=float)
+			
+			x12 = (x2 - x1)*t + x1
+			y12 = (y2 - y1)*t + y1
+			x23 = (x3 - x2)*t + x2
+			y23 = (y3 - y2)*t + y2
+			x34 = (x4 - x3)*t + x3
+			y34 = (y4 - y3)*t + y3
+			x123 = (x23 - x12)*t + x12
+			y123 = (y23 - y12)*t + y12
+			x234 = (x34 - x23)*t + x23
+			y234 = (y34 - y23)*t + y23
+			x1234 = (x234 - x123)*t + x123
+			y1234 = (y234 - y123)*t + y123
+
+			return (x1, y1, x12, y12, x123, y123, x1234, y1234, x234, y234, x34, y34, x4, y4)
+
+		result = [array('d') for i in range(14)]
+		
+		for t, x1, y1, x2, y2, x3, y3, x4, y4 in zip(self._times(time), x1, y1, x2, y2, x3, y3, x4, y4):
+			x12 = (x2 - x1)*t + x1
+			y12 = (y2 - y1)*t + y1
+			x23 = (x3 - x2)*t + x2
+			y23 = (y3 - y2)*t + y2
+			x34 = (x4 - x3)*t + x3
+			y34 = (y4 - y3)*t + y3
+			x123 = (x23 - x12)*t + x12
+			y123 = (y23 - y12)*t + y12
+			x234 = (x34 - x23)*t + x23
+			y234 = (y34 - y23)*t + y23
+			x1234 = (x234 - x123)*t + x123
+			y1234 = (y234 - y123)*t + y123
+
+			for column, value in zip(result, (x1, y1, x12, y12, x123, y123, x1234, y1234, x234, y234, x34, y34, x4, y4)):
+				column.append(value)
+
+		return tuple(result)
+
+	# - Basics ---------------------------------
+	def __len__(self):
+		return len(self.x0)
+
+	def __getitem__(self, index):
+		x0, y0, x1, y1, x2, y2, x3, y3 = [float(column[index]) for column in self._columns()]
+		return _Curve((_Point(x0, y0), _Point(x1, y1), _Point(x2, y2), _Point(x3, y3)))
+
+	def __iter__(self):
+		for index in range(len(self)):
+			yield self[index]
+
+	def __repr__(self):
+		return '<%s: Curves=%s; NumPy=%s>' %(self.__class__.__name__, len(self), self.useNumpy)
+
+	def append(self, curve):
+		'''Append a single curve (_Curve or tuple of four points). Note: Prefer bulk construction when using NumPy!'''
+		self.extend([curve])
+
+	def extend(self, curves):
+		'''Append a list of curves or another CurveBatch'''
+		other = curves if isinstance(curves, self.__class__) else self.__class__(curves, useNumpy=self.useNumpy)
+
+		for field, values in zip(self._fields, other._columns()):
+			if self.useNumpy:
+				setattr(self, field, np.concatenate((getattr(self, field), np.asarray(values, dtype=float))))
+			else:
+				getattr(self, field).extend(values)
+
+	def asList(self):
+		'''Returns list of point quadruples [((x0,y0), (x1,y1), (x2,y2), (x3,y3))...]'''
+		x0, y0, x1, y1, x2, y2, x3, y3 = [list(column) for column in self._columns()]
+		return [((x0[i], y0[i]), (x1[i], y1[i]), (x2[i], y2[i]), (x3[i], y3[i])) for i in range(len(x0))]
+
+	def asCurves(self):
+		'''Returns list of _Curve objects'''
+		return list(self)
+
+	# - Evaluation -----------------------------
+	def getNodes(self, time):
+		'''Returns Base Node coordinates of every curve at given [time].
+		
+		Arguments:
+			time (float or list(float)): Single time for all curves or one time per curve
+		Returns:
+			tuple(xs, ys): X and Y coordinate arrays
+		'''
+		x0, y0, x1, y1, x2, y2, x3, y3 = self._columns()
+
+		if self.useNumpy:
+			time = np.asarray(time, dtype=float)
+			rtime = 1 - time
+			x = (rtime**3)*x0 + 3*(rtime**2)*time*x1 + 3*rtime*(time**2)*x2 + (time**3)*x3
+			y = (rtime**3)*y0 + 3*(rtime**2)*time*y1 + 3*rtime*(time**2)*y2 + (time**3)*y3
+			return x, y
+
+		xs, ys = array('d'), array('d')
+
+		for time, x0, y0, x1, y1, x2, y2, x3, y3 in zip(self._times(time), x0, y0, x1, y1, x2, y2, x3, y3):
+			rtime = 1 - time
+			xs.append((rtime**3)*x0 + 3*(rtime**2)*time*x1 + 3*rtime*(time**2)*x2 + (time**3)*x3)
+			ys.append((rtime**3)*y0 + 3*(rtime**2)*time*y1 + 3*rtime*(time**2)*y2 + (time**3)*y3)
+
+		return xs, ys
+
+	def getLengths(self, order=16, intervals=8):
+		'''Returns the arc lengths of all curves using composite Gauss-Legendre quadrature 
+		of given [order] over equally spaced time [intervals].
+		'''
+		from math import hypot
+		nodes, weights = gaussLegendre(order)
+		scale = .5/intervals
+		times = [(k + .5*(node + 1.))/intervals for k in range(intervals) for node in nodes]
+		weights = [scale*weight for k in range(intervals) for weight in weights]
+		x0, y0, x1, y1, x2, y2, x3, y3 = self._columns()
+
+		if self.useNumpy:
+			time = np.asarray(times)[:, None]
+			rtime = 1 - time
+			a, b, c = 3*rtime*rtime, 6*rtime*time, 3*time*time
+			dx = a*(x1 - x0) + b*(x2 - x1) + c*(x3 - x2)
+			dy = a*(y1 - y0) + b*(y2 - y1) + c*(y3 - y2)
+			return np.dot(np.asarray(weights), np.hypot(dx, dy))
+
+		lengths = array('d')
+		coefs = [(weight, 3*(1 - time)**2, 6*(1 - time)*time, 3*time**2) for time, weight in zip(times, weights)]
+		
+		for x0, y0, x1, y1, x2, y2, x3, y3 in zip(x0, y0, x1, y1, x2, y2, x3, y3):
+			d0x, d0y, d1x, d1y, d2x, d2y = x1 - x0, y1 - y0, x2 - x1, y2 - y1, x3 - x2, y3 - y2
+			lengths.append(sum([w*hypot(a*d0x + b*d1x + c*d2x, a*d0y + b*d1y + c*d2y) for w, a, b, c in coefs]))
+
+		return lengths
+
+	def split(self, time):
+		'''Split every curve at given [time].
+
+		Arguments:
+			time (float or list(float)): Single time for all curves or one time per curve
+		Returns:
+			tuple(CurveBatch, CurveBatch): Curves before and after the given time
+		'''
+		x1, y1, x12, y12, x123, y123, x1234, y1234, x234, y234, x34, y34, x4, y4 = self._deCasteljau(time)
+		before = self.__class__.fromArrays(x1, y1, x12, y12, x123, y123, x1234, y1234, useNumpy=self.useNumpy)
+		after = self.__class__.fromArrays(x1234, y1234, x234, y234, x34, y34, x4, y4, useNumpy=self.useNumpy)
+		return before, after
+
+	def sliceNodes(self, time, resultInt=True):
+		'''Returns integer/float coordinates of every curve sliced at given [time] as _Curve.sliceNode does.
+		Output: list of lists [(Start), (Start_BCP_out), (Slice_BCP_in), (Slice), (Slice_BCP_out), (End_BCP_in), (End)] of tuples (x,y)
+		'''
+		columns = [list(column) for column in self._deCasteljau(time)]
+		convert = int if resultInt else float
+		
+		return [[(convert(columns[2*pid][cid]), convert(columns[2*pid + 1][cid])) for pid in range(7)] for cid in range(len(self))]
+
+	# - Extremes -------------------------------
+	@staticmethod
+	def _npExtremeTimes(p0, p1, p2, p3):
+		'''Vectorized cubicExtremeTimes: returns [linear, first, second] root arrays, NaN or outside (0, 1) where missing'''
+		b = 6 * p0 - 12 * p1 + 6 * p2
+		a = -3 * p0 + 9 * p1 - 9 * p2 + 3 * p3
+		c = 3 * p1 - 3 * p0
+
+		isLinear = np.abs(a) < 1e-12
+		
+		with np.errstate(divide='ignore', invalid='ignore'):
+			tLinear = np.where(isLinear & (np.abs(b) >= 1e-12), -c / b, np.nan)
+			b2ac = b * b - 4 * c * a
+			sqrtb2ac = np.sqrt(np.where(b2ac < 0, np.nan, b2ac))
+			q = -.5 * (b + np.where(b >= 0, sqrtb2ac, -sqrtb2ac))
+			qa, cq = q / a, c / q
+			t1 = np.where(isLinear, np.nan, np.where(b < 0, qa, cq))
+			t2 = np.where(isLinear, np.nan, np.where(b < 0, cq, qa))
+
+		return [tLinear, t1, t2]
+
+	def getExtremeTimes(self):
+		'''Finds the extremes of all curves.
+		Returns:
+			tuple(indices, times): Flat arrays of curve indices and the times of their extremes, 
+			ordered by curve and then as _Curve.getExtremes does (X first, then Y).
+		'''
+		if not self.useNumpy:
+			indices, times = array('l'), array('d')
+
+			for cid, (x0, y0, x1, y1, x2, y2, x3, y3) in enumerate(zip(*self._columns())):
+				tvalues = cubicExtremeTimes(x0, x1, x2, x3) + cubicExtremeTimes(y0, y1, y2, y3)
+				indices.extend([cid]*len(tvalues))
+				times.extend(tvalues)
+
+			return indices, times
+
+		x0, y0, x1, y1, x2, y2, x3, y3 = self._columns()
+		candidates = np.column_stack(self._npExtremeTimes(x0, x1, x2, x3) + self._npExtremeTimes(y0, y1, y2, y3)) if len(self) else np.empty((0, 6))
+		
+		with np.errstate(invalid='ignore'):
+			valid = (candidates > 0) & (candidates < 1)
+
+		indices, columns = np.nonzero(valid) # Row-major: keeps the order of the scalar method
+		return indices, candidates[indices, columns]
+
+	def getExtremes(self):
+		'''Finds the extremes of all curves.
+		Returns:
+			list of lists [(extreme_01_x, extreme_01_y, extreme_01_t)...] per curve, as _Curve.getExtremes does
+		'''
+		indices, times = self.getExtremeTimes()
+		xs, ys = self._getPoints(indices, times)
+		result = [[] for cid in range(len(self))]
+
+		for cid, x, y, t in zip(list(indices), list(xs), list(ys), list(times)):
+			result[cid].append((int(x), int(y), float(t)))
+
+		return result
+
+	def getParallelTimes(self, vectors):
+		'''Finds the tangent points of all curves for one or more directions in a single call: 
+		times where the tangent is parallel to a vector, as _Curve.solveParallelT(vector, fullOutput=True) does.
+		The curves are projected on the normal of every vector and the extremes of the projections solved at once.
+
+		Arguments:
+			vectors (tuple(x,y) or list[tuple(x,y)]): Direction vector(s) (magnitude is ignored)
+		Returns:
+			tuple(indices, vectorIndices, times): Flat arrays ordered by curve, vector and time
+		'''
+		if hasattr(vectors, 'x') or (len(vectors) and isinstance(vectors[0], (int, float))):
+			vectors = [vectors] # Single vector given
+
+		vectors = [self._getXY(vector) for vector in vectors]
+		x0, y0, x1, y1, x2, y2, x3, y3 = self._columns()
+
+		if not self.useNumpy:
+			indices, vectorIndices, times = array('l'), array('l'), array('d')
+
+			for cid, points in enumerate(zip(x0, y0, x1, y1, x2, y2, x3, y3)):
+				for vid, (x, y) in enumerate(vectors):
+					s0, s1, s2, s3 = [x*points[2*pid + 1] - y*points[2*pid] for pid in range(4)]
+
+					if max(abs(s1 - s0), abs(s2 - s0), abs(s3 - s0)) <= 1e-9*(1. + max(abs(s0), abs(s1), abs(s2), abs(s3))):
+						continue # Straight curve parallel to the vector
+
+					tvalues = sorted(cubicExtremeTimes(s0, s1, s2, s3))
+					indices.extend([cid]*len(tvalues))
+					vectorIndices.extend([vid]*len(tvalues))
+					times.extend(tvalues)
+
+			return indices, vectorIndices, times
+
+		if not len(self) or not len(vectors):
+			return np.empty(0, dtype=int), np.empty(0, dtype=int), np.empty(0)
+
+		# - Projections of all curves on the normals of all vectors: shape (curves, vectors)
+		vx, vy = np.array(vectors, dtype=float).T
+		s0, s1, s2, s3 = [vx*y[:, None] - vy*x[:, None] for x, y in ((x0, y0), (x1, y1), (x2, y2), (x3, y3))]
+		scale = 1. + np.max(np.abs([s0, s1, s2, s3]), axis=0)
+		isFlat = np.max(np.abs([s1 - s0, s2 - s0, s3 - s0]), axis=0) <= 1e-9*scale
+		candidates = np.stack(self._npExtremeTimes(s0, s1, s2, s3), axis=-1)
+
+		with np.errstate(invalid='ignore'):
+			valid = (candidates > 0) & (candidates < 1) & ~isFlat[:, :, None]
+
+		indices, vectorIndices, columns = np.nonzero(valid)
+		times = candidates[indices, vectorIndices, columns]
+		order = np.lexsort((times, vectorIndices, indices))
+
+		return indices[order], vectorIndices[order], times[order]
+
+	def _getPoints(self, indices, times):
+		'''Evaluates curves at given [indices] (repeating allowed) each at its own time'''
+		if self.useNumpy:
+			x0, y0, x1, y1, x2, y2, x3, y3 = [column[indices] for column in self._columns()]
+			t = times
+			mt = 1 - t
+			xs = (mt * mt * mt * x0) + (3 * mt * mt * t * x1) + (3 * mt * t * t * x2) + (t * t * t * x3)
+			ys = (mt * mt * mt * y0) + (3 * mt * mt * t * y1) + (3 * mt * t * t * y2) + (t * t * t * y3)
+			return xs, ys
+
+		columns = self._columns()
+		xs, ys = array('d'), array('d')
+
+		for cid, t in zip(indices, times):
+			x0, y0, x1, y1, x2, y2, x3, y3 = [column[cid] for column in columns]
+			mt = 1 - t
+			xs.append((mt * mt * mt * x0) + (3 * mt * mt * t * x1) + (3 * mt * t * t * x2) + (t * t * t * x3))
+			ys.append((mt * mt * mt * y0) + (3 * mt * mt * t * y1) + (3 * mt * t * t * y2) + (t * t * t * y3))
+
+		return xs, ys
+
+	# - Equalizers -----------------------------
+	def eqProportionalHandles(self, proportion=.3):
+		'''Equalizes handle length of all curves to given float(proportion) of their control polygon, as _Curve.eqProportionalHandles does.
+		Returns new CurveBatch.
+		'''
+		x0, y0, x1, y1, x2, y2, x3, y3 = self._columns()
+
+		if self.useNumpy:
+			distance = (np.hypot(x0 - x1, y0 - y1) + np.hypot(x1 - x2, y1 - y2) + np.hypot(x2 - x3, y2 - y3)) * proportion
+			phi1 = np.where((x1 == x0) & (y1 == y0), np.arctan2(y2 - y0, x2 - x0), np.arctan2(y1 - y0, x1 - x0))
+			phi2 = np.where((x2 == x3) & (y2 == y3), np.arctan2(y1 - y3, x1 - x3), np.arctan2(y2 - y3, x2 - x3))
+			
+			return self.__class__.fromArrays(x0, y0, x0 + np.cos(phi1)*distance, y0 + np.sin(phi1)*distance, 
+											 x3 + np.cos(phi2)*distance, y3 + np.sin(phi2)*distance, x3, y3, useNumpy=True)
+
+		columns = [array('d') for field in self._fields]
+
+		for x0, y0, x1, y1, x2, y2, x3, y3 in zip(x0, y0, x1, y1, x2, y2, x3, y3):
+			distance = (math.hypot(x0 - x1, y0 - y1) + math.hypot(x1 - x2, y1 - y2) + math.hypot(x2 - x3, y2 - y3)) * proportion
+			phi1 = math.atan2(y2 - y0, x2 - x0) if (x1 == x0 and y1 == y0) else math.atan2(y1 - y0, x1 - x0)
+			phi2 = math.atan2(y1 - y3, x1 - x3) if (x2 == x3 and y2 == y3) else math.atan2(y2 - y3, x2 - x3)
+
+			for column, value in zip(columns, (x0, y0, x0 + math.cos(phi1)*distance, y0 + math.sin(phi1)*distance, x3 + math.cos(phi2)*distance, y3 + math.sin(phi2)*distance, x3, y3)):
+				column.append(value)
+
+		return self.__class__.fromArrays(*columns, useNumpy=False)
+
+	def eqTunni(self):
+		'''Makes proportional handles keeping curvature and on-curve point positions (Eduardo Tunni's method) for all curves, 
+		as _Curve.eqTunni does. Curves with parallel handles (no crossing) are left unchanged.
+		Returns new CurveBatch.
+		'''
+		x0, y0, x1, y1, x2, y2, x3, y3 = self._columns()
+
+		if self.useNumpy:
+			with np.errstate(divide='ignore', invalid='ignore'):
+				# - Crossing of the handle lines
+				dAx, dAy, prodA = x2 - x3, y2 - y3, x2*y3 - x3*y2
+				dBx, dBy, prodB = x1 - x0, y1 - y0, x1*y0 - x0*y1
+				det = dAx*dBy - dBx*dAy
+				cx, cy = (dBx*prodA - dAx*prodB)/det, (dBy*prodA - dAy*prodB)/det
+				
+				# - Mean proportion of the handles to the crossing
+				proportion = (np.hypot(x3 - x2, y3 - y2)/np.hypot(x3 - cx, y3 - cy) + np.hypot(x0 - x1, y0 - y1)/np.hypot(x0 - cx, y0 - cy))*.5
+				nx1, ny1 = x0 + proportion*(cx - x0), y0 + proportion*(cy - y0)
+				nx2, ny2 = x3 + proportion*(cx - x3), y3 + proportion*(cy - y3)
+				valid = (det != 0) & np.isfinite(nx1) & np.isfinite(ny1) & np.isfinite(nx2) & np.isfinite(ny2)
+
+			return self.__class__.fromArrays(x0, y0, np.where(valid, nx1, x1), np.where(valid, ny1, y1), 
+											 np.where(valid, nx2, x2), np.where(valid, ny2, y2), x3, y3, useNumpy=True)
+
+		columns = [array('d') for field in self._fields]
+
+		for x0, y0, x1, y1, x2, y2, x3, y3 in zip(x0, y0, x1, y1, x2, y2, x3, y3):
+			dAx, dAy, prodA = x2 - x3, y2 - y3, x2*y3 - x3*y2
+			dBx, dBy, prodB = x1 - x0, y1 - y0, x1*y0 - x0*y1
+			det = dAx*dBy - dBx*dAy
+			result = (x0, y0, x1, y1, x2, y2, x3, y3)
+
+			if det != 0:
+				cx, cy = (dBx*prodA - dAx*prodB)/det, (dBy*prodA - dAy*prodB)/det
+				toCrossA, toCrossB = math.hypot(x3 - cx, y3 - cy), math.hypot(x0 - cx, y0 - cy)
+
+				if toCrossA != 0 and toCrossB != 0:
+					proportion = (math.hypot(x3 - x2, y3 - y2)/toCrossA + math.hypot(x0 - x1, y0 - y1)/toCrossB)*.5
+					result = (x0, y0, x0 + proportion*(cx - x0), y0 + proportion*(cy - y0), x3 + proportion*(cx - x3), y3 + proportion*(cy - y3), x3, y3)
+
+			for column, value in zip(columns, result):
+				column.append(value)
+
+		return self.__class__.fromArrays(*columns, useNumpy=False)
+
+	def eqHobbySpline(self, curvature=(.9,.9)):
+		'''Applies John Hobby's mock-curvature-smoothness by given curvature - tuple(float,float) or (float) 
+		to all curves, as _Curve.eqHobbySpline does. Degenerate curves are left unchanged.
+		Returns new CurveBatch.
+		'''
+		alpha, beta = curvature if isinstance(curvature, tuple) else (curvature, curvature)
+		x0, y0, x1, y1, x2, y2, x3, y3 = self._columns()
+
+		if self.useNumpy:
+			def hobby(theta, phi):
+				st, ct, sp, cp = np.sin(theta), np.cos(theta), np.sin(phi), np.cos(phi)
+				return (2 + math.sqrt(2) * (st - sp/16.) * (sp - st/16.) * (ct - cp)) / (3 * (1 + .5*(math.sqrt(5) - 1) * ct + .5*(3 - math.sqrt(5)) * cp))
+
+			with np.errstate(divide='ignore', invalid='ignore'):
+				rad0, rad1 = np.arctan2(x1 - x0, y1 - y0), np.arctan2(x3 - x2, y3 - y2)
+				w0, w1 = np.sin(rad0) + 1j*np.cos(rad0), np.sin(rad1) + 1j*np.cos(rad1)
+				z0, z1 = x0 + 1j*y0, x3 + 1j*y3
+				theta, phi = np.angle(w0/(z1 - z0)), np.angle((z1 - z0)/w1)
+				u = z0 + np.exp(1j*theta) * (z1 - z0) * hobby(theta, phi) / alpha
+				v = z1 - np.exp(-1j*phi) * (z1 - z0) * hobby(phi, theta) / beta
+				valid = np.isfinite(u) & np.isfinite(v)
+
+			return self.__class__.fromArrays(x0, y0, np.where(valid, u.real, x1), np.where(valid, u.imag, y1), 
+											 np.where(valid, v.real, x2), np.where(valid, v.imag, y2), x3, y3, useNumpy=True)
+
+		from cmath import exp, phase
+		columns = [array('d') for field in self._fields]
+
+		def hobby(theta, phi):
+			st, ct, sp, cp = math.sin(theta), math.cos(theta), math.sin(phi), math.cos(phi)
+			return (2 + math.sqrt(2) * (st - sp/16.) * (sp - st/16.) * (ct - cp)) / (3 * (1 + .5*(math.sqrt(5) - 1) * ct + .5*(3 - math.sqrt(5)) * cp))
+
+		for x0, y0, x1, y1, x2, y2, x3, y3 in zip(x0, y0, x1, y1, x2, y2, x3, y3):
+			result = (x0, y0, x1, y1, x2, y2, x3, y3)
+			z0, z1 = complex(x0, y0), complex(x3, y3)
+
+			if z0 != z1:
+				rad0, rad1 = math.atan2(x1 - x0, y1 - y0), math.atan2(x3 - x2, y3 - y2)
+				w0, w1 = complex(math.sin(rad0), math.cos(rad0)), complex(math.sin(rad1), math.cos(rad1))
+				theta, phi = phase(w0/(z1 - z0)), phase((z1 - z0)/w1)
+				u = z0 + exp(1j*theta) * (z1 - z0) * hobby(theta, phi) / alpha
+				v = z1 - exp(-1j*phi) * (z1 - z0) * hobby(phi, theta) / beta
+				result = (x0, y0, u.real, u.imag, v.real, v.imag, x3, y3)
+
+			for column, value in zip(columns, result):
+				column.append(value)
+
+		return self.__class__.fromArrays(*columns, useNumpy=False)
+
+	# - Intersections --------------------------
+	def intersectLine(self, p0, p1, bounded=False):
+		'''Intersect all curves with one probe line through points [p0] and [p1] in a single call.
+
+		Arguments:
+			p0, p1 (tuple(x,y) or objects with .x and .y): Points defining the line
+			bounded (bool): Only the line segment between p0 and p1 counts, not the infinite line
+		Returns:
+			tuple(indices, times, xs, ys, positions): Flat arrays ordered by curve and time. 
+			Positions are the hits along the line: 0 at p0, 1 at p1. A line crossing a node between 
+			two curves is reported once (at the start of the next curve), a line touching it - not at all.
+		'''
+		(px, py), (qx, qy) = self._getXY(p0), self._getXY(p1)
+		dx, dy = qx - px, qy - py
+		length2 = dx*dx + dy*dy
+		assert length2 > 0, 'Probe line points should not coincide!'
+		nx, ny = -dy/math.sqrt(length2), dx/math.sqrt(length2)
+		x0, y0, x1, y1, x2, y2, x3, y3 = self._columns()
+
+		if self.useNumpy:
+			# - Signed distances of control points to the line: roots of the resulting 1D curves are the hits
+			v0, v1, v2, v3 = [nx*(x - px) + ny*(y - py) for x, y in ((x0, y0), (x1, y1), (x2, y2), (x3, y3))]
+			
+			def value(t):
+				mt = 1 - t
+				return (mt * mt * mt * v0[:, None]) + (3 * mt * mt * t * v1[:, None]) + (3 * mt * t * t * v2[:, None]) + (t * t * t * v3[:, None])
+
+			eps = 1e-12 * (1. + np.max(np.abs([v0, v1, v2, v3]), axis=0))[:, None]
+			
+			# -- Split each curve at its extremes into monotonic parts holding one root at most
+			critical = np.column_stack(self._npExtremeTimes(v0, v1, v2, v3))
+			
+			with np.errstate(invalid='ignore'):
+				critical = np.where((critical > 0) & (critical < 1), critical, 1.)
+			
+			breaks = np.sort(np.column_stack((np.zeros(len(self)), critical, np.ones(len(self)))), axis=1)
+			lo, hi = breaks[:, :-1], breaks[:, 1:]
+			flo, fhi = value(lo), value(hi)
+			
+			isStart = (np.abs(flo) <= eps) & (lo < hi)
+			isInner = (flo * fhi < 0) & (np.abs(fhi) > eps) & ~isStart
+			isEnd = np.zeros(lo.shape, dtype=bool)
+			isEnd[:, -1] = np.abs(fhi[:, -1]) <= eps[:, 0]
+
+			# -- Bisection, all brackets at once
+			cid, iid = np.nonzero(isInner)
+			a, b, fa = lo[cid, iid], hi[cid, iid], flo[cid, iid]
+			c0, c1, c2, c3 = v0[cid], v1[cid], v2[cid], v3[cid]
+
+			for iteration in range(60):
+				t = .5*(a + b)
+				mt = 1 - t
+				ft = (mt * mt * mt * c0) + (3 * mt * mt * t * c1) + (3 * mt * t * t * c2) + (t * t * t * c3)
+				left = ft * fa > 0
+				a, fa = np.where(left, t, a), np.where(left, ft, fa)
+				b = np.where(left, b, t)
+
+			indices = np.concatenate((np.nonzero(isStart)[0], cid, np.nonzero(isEnd)[0]))
+			times = np.concatenate((lo[isStart], .5*(a + b), hi[isEnd]))
+			order = np.lexsort((times, indices))
+			indices, times = indices[order], times[order]
+			
+			if len(times):
+				unique = np.concatenate(([True], (indices[1:] != indices[:-1]) | (times[1:] - times[:-1] > 1e-9)))
+				indices, times = indices[unique], times[unique]
+		
+		else:
+			indices, times = array('l'), array('d')
+			
+			for index, (x0, y0, x1, y1, x2, y2, x3, y3) in enumerate(zip(x0, y0, x1, y1, x2, y2, x3, y3)):
+				roots = bezierRoots(nx*(x0 - px) + ny*(y0 - py), nx*(x1 - px) + ny*(y1 - py), nx*(x2 - px) + ny*(y2 - py), nx*(x3 - px) + ny*(y3 - py))
+				indices.extend([index]*len(roots))
+				times.extend(roots)
+
+		keep = self._joinHits(indices, times, (px, py), (nx, ny))
+
+		if keep is not None:
+			if self.useNumpy:
+				indices, times = indices[np.array(keep, dtype=bool)], times[np.array(keep, dtype=bool)]
+			else:
+				indices, times = array('l', [index for index, flag in zip(indices, keep) if flag]), array('d', [time for time, flag in zip(times, keep) if flag])
+
+		xs, ys = self._getPoints(indices, times)
+
+		if self.useNumpy:
+			positions = ((xs - px)*dx + (ys - py)*dy)/length2
+			
+			if bounded:
+				inside = (positions >= -1e-9) & (positions <= 1 + 1e-9)
+				indices, times, xs, ys, positions = indices[inside], times[inside], xs[inside], ys[inside], positions[inside]
+
+			return indices, times, xs, ys, positions
+
+		positions = array('d', [((x - px)*dx + (y - py)*dy)/length2 for x, y in zip(xs, ys)])
+
+		if bounded:
+			inside = [i for i, position in enumerate(positions) if -1e-9 <= position <= 1 + 1e-9]
+			return tuple(array(item.typecode, [item[i] for i in inside]) for item in (indices, times, xs, ys, positions))
+
+		return indices, times, xs, ys, positions
+
+	def _joinHits(self, indices, times, origin, normal, tolerance=1e-9):
+		'''A line through a node is hit twice: at the end (t=1) of one curve and at the start (t=0) of the curve that follows.
+		Joins where the line crosses the outline are kept once (at the start of the next curve), 
+		joins where it only touches the outline are dropped.
+
+		Returns:
+			list(bool) or None: Keep flag for every hit; None if there are no joins to merge
+		'''
+		(px, py), (nx, ny) = origin, normal
+		starts = {}
+
+		for hid, (index, time) in enumerate(zip(indices, times)):
+			if time <= tolerance:
+				starts.setdefault((self.x0[index], self.y0[index]), []).append((int(index), hid))
+
+		if not len(starts):
+			return None
+
+		keep = [True]*len(times)
+
+		def distances(index):
+			return [nx*(getattr(self, 'x%s' %pid)[index] - px) + ny*(getattr(self, 'y%s' %pid)[index] - py) for pid in range(4)]
+
+		def side(values):
+			eps = tolerance * (1. + max(abs(value) for value in values))
+			return next((1 if value > 0 else -1 for value in values if abs(value) > eps), 0)
+
+		for hid, (index, time) in enumerate(zip(indices, times)):
+			if time < 1. - tolerance:
+				continue
+
+			index = int(index)
+			following = starts.get((self.x3[index], self.y3[index]), [])
+			following = [item for item in following if item[0] != index and keep[item[1]]]
+
+			if not len(following):
+				continue
+
+			next_index, next_hid = min(following, key=lambda item: (item[0] != index + 1, item[0]))
+			keep[hid] = False # Counted once, at the start of the next curve
+			
+			sideIn, sideOut = side(distances(index)[2::-1]), side(distances(next_index)[1:])
+
+			if sideIn != 0 and sideIn == sideOut: 
+				keep[next_hid] = False # Touching, not crossing
+
+		return keep
+
+	def getStems(self, p0, p1, owners=None):
+		'''Measure stems (ink runs) along one probe line for all curves in a single call. 
+		Hits are sorted along the line per owner and paired as (in, out) - non overlapping closed contours assumed.
+
+		Arguments:
+			p0, p1 (tuple(x,y) or objects with .x and .y): Points defining the (infinite) probe line
+			owners (list): Owner (ex. glyph name) of every curve; None - all curves belong to one owner
+		Returns:
+			dict{owner: list[float]}: Stem widths in the order met along the line
+		'''
+		from itertools import groupby
+		
+		(px, py), (qx, qy) = self._getXY(p0), self._getXY(p1)
+		length = math.hypot(qx - px, qy - py)
+		indices, times, xs, ys, positions = self.intersectLine(p0, p1)
+		getOwner = (lambda index: None) if owners is None else owners.__getitem__
+		hits = sorted(zip([getOwner(index) for index in indices], list(positions)))
+		stems = {} if owners is None else dict.fromkeys(set(owners))
+
+		for owner, ownerHits in groupby(hits, lambda hit: hit[0]):
+			crossings = [position for owner, position in ownerHits]
+			stems[owner] = [(crossings[i + 1] - crossings[i])*length for i in range(0, len(crossings) - 1, 2)]
+
+		for owner, widths in stems.items():
+			if widths is None: stems[owner] = []
+
+		return stems
+
+	# - Bounds ---------------------------------
+	def getBounds(self):
+		'''Returns the tight (curve aware) bounding boxes of all curves: end points and extremes, not the control points.
+		Returns:
+			tuple(xmin, ymin, xmax, ymax): Arrays with one value per curve
+		'''
+		x0, y0, x1, y1, x2, y2, x3, y3 = self._columns()
+		indices, times = self.getExtremeTimes()
+		xs, ys = self._getPoints(indices, times)
+
+		if self.useNumpy:
+			xmin, ymin = np.minimum(x0, x3), np.minimum(y0, y3)
+			xmax, ymax = np.maximum(x0, x3), np.maximum(y0, y3)
+
+			np.minimum.at(xmin, indices, xs)
+			np.minimum.at(ymin, indices, ys)
+			np.maximum.at(xmax, indices, xs)
+			np.maximum.at(ymax, indices, ys)
+			return xmin, ymin, xmax, ymax
+
+		xmin, ymin = array('d', map(min, x0, x3)), array('d', map(min, y0, y3))
+		xmax, ymax = array('d', map(max, x0, x3)), array('d', map(max, y0, y3))
+
+		for cid, x, y in zip(indices, xs, ys):
+			if x < xmin[cid]: xmin[cid] = x
+			if x > xmax[cid]: xmax[cid] = x
+			if y < ymin[cid]: ymin[cid] = y
+			if y > ymax[cid]: ymax[cid] = y
+
+		return xmin, ymin, xmax, ymax
+
+class contourBounds(bounds):
+	'''Tight (curve aware) bounding box of a contour, built from its cubic segments instead of its control points.
+	Keeps a box per segment, so moving nodes re-solves only the segments that use them and
+	the contour box is updated without a full rescan (unless a segment lying on the box edge moves inwards).
+
+	Constructor:
+		contourBounds(list[points], list[onCurve], closed=True): Nodes in contour order as (x,y) tuples/lists 
+			or objects with .x and .y attributes (_Point, Coord, flNode); onCurve - one bool per node.
+			Lines, quadratic (one off-curve) and cubic (two off-curves) segments are supported.
+		contourBounds(..., useNumpy=False): Force pure Python processing
+
+	Attributes:
+		.x, .y, .xmax, .ymax, .width, .height (float): Contour box
+		.segments (list[tuple(int)]): Node indices of every segment
+		.batch (CurveBatch): Segments as cubic curves
+		.segmentBounds (list): (xmin, ymin, xmax, ymax) arrays with one value per segment
+	'''
+	def __init__(self, points, onCurve, closed=True, useNumpy=None):
+		super(contourBounds, self).__init__()
+		
+		assert len(points) == len(onCurve), 'Points (%s) and on-curve flags (%s) do not match' %(len(points), len(onCurve))
+		coords = [CurveBatch._getXY(point) for point in points]
+		self.nodeX, self.nodeY = array('d', [x for x, y in coords]), array('d', [y for x, y in coords])
+		self.closed = closed
+		self.segments = contourSegments(onCurve, closed)
+		self.nodeSegments = [[] for point in points]
+
+		for sid, segment in enumerate(self.segments):
+			for nid in set(segment):
+				self.nodeSegments[nid].append(sid)
+
+		columns = zip(*[self._getControls(segment) for segment in self.segments])
+		self.batch = CurveBatch.fromArrays(*(columns or [[]]*8), useNumpy=useNumpy)
+		self.segmentBounds = list(self.batch.getBounds())
+		self.refreshBox()
+
+	def __repr__(self):
+		return '<%s: (%s, %s, %s, %s) segments=%s>' %(self.__class__.__name__, self.x, self.y, self.xmax, self.ymax, len(self.segments))
+
+	# - Internal -------------------------------
+	def _getControls(self, segment):
+		'''Returns the cubic control points (x0, y0 ... x3, y3) of a segment (tuple of node indices)'''
+		nx, ny = self.nodeX, self.nodeY
+		
+		if len(segment) == 2: # Line
+			p0, p3 = segment
+			return (nx[p0], ny[p0], nx[p0], ny[p0], nx[p3], ny[p3], nx[p3], ny[p3])
+
+		if len(segment) == 3: # Quadratic: degree elevation
+			p0, q, p3 = segment
+			return (nx[p0], ny[p0], 
+					nx[p0] + 2.*(nx[q] - nx[p0])/3, ny[p0] + 2.*(ny[q] - ny[p0])/3, 
+					nx[p3] + 2.*(nx[q] - nx[p3])/3, ny[p3] + 2.*(ny[q] - ny[p3])/3, 
+					nx[p3], ny[p3])
+
+		return tuple(value for nid in segment for value in (nx[nid], ny[nid]))
+
+	# - Box ------------------------------------
+	def refreshBox(self):
+		'''Full rescan of the segment boxes (the curves are not solved again)'''
+		if not len(self.segments):
+			self.setBox(0, 0, 0, 0)
+			return
+
+		xmin, ymin, xmax, ymax = self.segmentBounds
+
+		if self.batch.useNumpy:
+			self.setBox(float(xmin.min()), float(ymin.min()), float(xmax.max()), float(ymax.max()))
+		else:
+			self.setBox(min(xmin), min(ymin), max(xmax), max(ymax))
+
+	def updateSegments(self, segmentIndices):
+		'''Re-solve the boxes of given segments after their nodes were changed and update the contour box'''
+		columns = self.batch._columns()
+		rescan = False
+
+		for sid in set(segmentIndices):
+			controls = self._getControls(self.segments[sid])
+
+			for column, value in zip(columns, controls):
+				column[sid] = value
+
+			newBox = cubicBounds(*controls)
+			oldBox = [float(item[sid]) for item in self.segmentBounds]
+
+			for item, value in zip(self.segmentBounds, newBox):
+				item[sid] = value
+
+			# - Segment that defined a box edge moved inwards: the edge is unknown now
+			if (oldBox[0] == self.x and newBox[0] > self.x) or (oldBox[1] == self.y and newBox[1] > self.y) or \
+			   (oldBox[2] == self.xmax and newBox[2] < self.xmax) or (oldBox[3] == self.ymax and newBox[3] < self.ymax):
+				rescan = True
+			
+			elif not rescan:
+				self.merge(newBox)
+
+		if rescan:
+			self.refreshBox()
+
+	def moveNode(self, index, x, y):
+		'''Set new position of node at [index] and update the box incrementally'''
+		self.nodeX[index], self.nodeY[index] = x, y
+		self.updateSegments(self.nodeSegments[index])
+
+	def moveNodes(self, changes):
+		'''Set new positions of many nodes given as iterable of (index, x, y) and update the box incrementally'''
+		segmentIndices = []
+
+		for index, x, y in changes:
+			self.nodeX[index], self.nodeY[index] = x, y
+			segmentIndices += self.nodeSegments[index]
+
+		self.updateSegments(segmentIndices)
+
+# --- Contour analysis -------------------------------------------------------------------
+class sweepIntersections(object):
+	'''Sweep-line detector of contour overlaps and self-intersections.
+	Curves are flattened adaptively and the resulting edges are swept along X: every edge is tested 
+	only against the edges whose X extent it overlaps (the active set), not against all other segments.
+
+	Constructor:
+		sweepIntersections(list[contourBounds], tolerance=.5)
+		sweepIntersections(list[tuple(points, onCurve, closed)], tolerance=.5): As contourBounds takes them
+
+	Attributes:
+		.contours (list[contourBounds]): Contours tested
+		.tolerance (float): Flattening tolerance
+		.edges (list[tuple]): Flattened edges (x0, y0, x1, y1, xmin, ymin, xmax, ymax, contour_index, segment_index, t0, t1, edge_order)
+	'''
+	def __init__(self, contours, tolerance=.5):
+		self.contours = [item if isinstance(item, contourBounds) else contourBounds(*item) for item in contours]
+		self.tolerance = tolerance
+		self.edgeCount = []
+		self.edges = self._getEdges()
+
+	def __repr__(self):
+		return '<%s: Contours=%s; Edges=%s>' %(self.__class__.__name__, len(self.contours), len(self.edges))
+
+	def _getEdges(self):
+		edges = []
+
+		for cid, contour in enumerate(self.contours):
+			order = 0
+			
+			for sid, segment in enumerate(contour.segments):
+				x0, y0, x1, y1, x2, y2, x3, y3 = contour._getControls(segment)
+
+				if len(segment) == 2:
+					points = [(x0, y0, 0.), (x3, y3, 1.)]
+				else:
+					points = flattenCubic(x0, y0, x1, y1, x2, y2, x3, y3, self.tolerance)
+
+				for (xa, ya, ta), (xb, yb, tb) in zip(points[:-1], points[1:]):
+					if xa == xb and ya == yb: continue # Zero length
+					edges.append((xa, ya, xb, yb, min(xa, xb), min(ya, yb), max(xa, xb), max(ya, yb), cid, sid, ta, tb, order))
+					order += 1
+
+			self.edgeCount.append(order)
+
+		return edges
+
+	def _isAdjacent(self, edgeA, edgeB):
+		'''Consecutive edges of the same contour share a node - it is not an intersection'''
+		if edgeA[8] != edgeB[8]: 
+			return False
+
+		delta = abs(edgeA[12] - edgeB[12])
+		return delta == 1 or (self.contours[edgeA[8]].closed and delta == self.edgeCount[edgeA[8]] - 1)
+
+	def getIntersections(self, firstOnly=False):
+		'''Finds all intersecting segments.
+		
+		Arguments:
+			firstOnly (bool): Stop at the first intersection found
+		Returns:
+			list[tuple((contour_A, segment_A, t_A), (contour_B, segment_B, t_B), (x, y))]: 
+				Sorted, with approximate segment times (within flattening tolerance)
+		'''
+		from heapq import heappush, heappop
+		
+		edges = self.edges
+		active, expiry = set(), []
+		found = {}
+		
+		for eid in sorted(range(len(edges)), key=lambda eid: edges[eid][4]):
+			edge = edges[eid]
+			x0, y0, x1, y1, xmin, ymin, xmax, ymax = edge[:8]
+
+			# - Drop edges left behind by the sweep
+			while len(expiry) and expiry[0][0] < xmin:
+				active.discard(heappop(expiry)[1])
+
+			for oid in active:
+				other = edges[oid]
+
+				if other[7] < ymin or other[5] > ymax or self._isAdjacent(edge, other): 
+					continue
+
+				hit = segmentIntersection(x0, y0, x1, y1, *other[:4])
+				
+				if hit is None: 
+					continue
+
+				u, v = hit
+				x, y = x0 + u*(x1 - x0), y0 + u*(y1 - y0)
+				itemA = (edge[8], edge[9], edge[10] + u*(edge[11] - edge[10]))
+				itemB = (other[8], other[9], other[10] + v*(other[11] - other[10]))
+				
+				if itemB[:2] < itemA[:2]: 
+					itemA, itemB = itemB, itemA
+
+				# - Hits at a flattened vertex are found by both edges meeting there
+				key = (itemA[:2], itemB[:2], int(round(x/self.tolerance)), int(round(y/self.tolerance)))
+				found.setdefault(key, (itemA, itemB, (x, y)))
+
+				if firstOnly: 
+					return found.values()
+
+			active.add(eid)
+			heappush(expiry, (xmax, eid))
+
+		return sorted(found.values())
+
+	def getPairs(self):
+		'''Returns sorted list of intersecting segment pairs [((contour_A, segment_A), (contour_B, segment_B))...]'''
+		return sorted(set((itemA[:2], itemB[:2]) for itemA, itemB, position in self.getIntersections()))
+
+	def hasIntersections(self):
+		return len(self.getIntersections(True)) > 0
+
 # --- Real world ----------------------------------------------------------------------
 class Coord(_Point): # Dumb Name but avoids name collision with FL6/FL5 Point object
-	def __init__(self, *argv):
-		from fontlab import flNode
-		from PythonQt.QtCore import QPointF, QPoint
+	__slots__ = ('parent',)
 
-		self.angle = 0
+	def __init__(self, *argv):
 		self.parent = argv
-		multiCheck = lambda t, type: all([isinstance(i, type) for i in t])
 
-		if isinstance(argv[0], self.__class__):
+		# - Fast path: numbers, points, tuples and lists
+		if len(argv) == 2 and isinstance(argv[0], (int, float)) and isinstance(argv[1], (int, float)):
+			self.x, self.y = argv
+			return
+
+		if isinstance(argv[0], _Point):
 			self.x, self.y = argv[0].x, argv[0].y
+			return
 
-		if multiCheck(argv, float) or multiCheck(argv, int) :
-			self.x, self.y = argv[0], argv[1]
+		if isinstance(argv[0], (tuple, list)):
+			self.x, self.y = argv[0]
+			return
 		
-		if multiCheck(argv, flNode):
+		# - Fontlab and Qt objects
+		from fontlab import flNode
+		from PythonQt.QtCore import QPointF, QPoint
+
+		if isinstance(argv[0], flNode):
 			self.x, self.y = argv[0].x, argv[0].y
 						
-		if multiCheck(argv, QPointF) or multiCheck(argv, QPoint):
+		elif isinstance(argv[0], (QPointF, QPoint)):
 			self.x, self.y = argv[0].x(), argv[0].y()
-		
-		if multiCheck(argv, tuple) or multiCheck(argv, list) :
-			self.x, self.y = argv[0]
+
+	@classmethod
+	def _new(cls, x, y):
+		newCoord = object.__new__(cls)
+		newCoord.x, newCoord.y = x, y
+		newCoord.parent = (x, y)
+		return newCoord
 		
 	def __repr__(self):
 		return '<Coord: %s,%s>' %(self.x, self.y)
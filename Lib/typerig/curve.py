@@ -8,7 +8,7 @@
 # No warranties. By using this you agree
 # that you use it at your own risk!
 
-__version__ = '0.3.0'
+__version__ = '0.4.0'
 
 # - Dependencies -------------------------
 import fontlab as fl6
@@ -101,3 +101,100 @@ class eCurveEx(object):
 			return self.curve
 		else:
 			return self.__riseCurveWaring()
+
+class eCurveBatch(object):
+	'''Font-wide curve equalizer: all cubic segments of the given glyphs and layers are extracted into one brain.CurveBatch, 
+	equalized in a single (vectorized) call and written back with one update per glyph.
+
+	Constructor:
+		eCurveBatch(list[pGlyph or eGlyph], list[str] layers=None): If layers is None the active layer of every glyph is used
+
+	Attributes:
+		.glyphs (list[pGlyph])
+		.layers (list[str] or [None])
+		.timings (dict{glyph_name: float}): Seconds spent on every glyph (extraction and write back) by the last run
+		.mathTime (float): Seconds spent on the vectorized equalization by the last run
+	'''
+	methods = {	'tunni': 'eqTunni', 
+				'prop': 'eqProportionalHandles', 
+				'hobby': 'eqHobbySpline'}
+
+	def __init__(self, glyphs, layers=None):
+		self.glyphs = glyphs
+		self.layers = layers if layers is not None else [None]
+		self.timings = {}
+		self.mathTime = 0.
+
+	def __repr__(self):
+		return '<%s Glyphs=%s; Layers=%s;>' % (self.__class__.__name__, len(self.glyphs), len(self.layers))
+
+	def _extract(self, glyph):
+		'''Returns the handle nodes [(bcp_out, bcp_in)...] and control point columns of all cubic segments of a glyph'''
+		from typerig.brain import contourSegments
+		handles, columns = [], [[] for i in range(8)]
+
+		for layer in self.layers:
+			for contour in glyph.contours(layer):
+				nodes = contour.nodes()
+
+				for segment in contourSegments([node.isOn() for node in nodes], contour.closed):
+					if len(segment) != 4: continue
+					
+					handles.append((nodes[segment[1]], nodes[segment[2]]))
+
+					for pid, nid in enumerate(segment):
+						columns[2*pid].append(float(nodes[nid].x))
+						columns[2*pid + 1].append(float(nodes[nid].y))
+
+		return handles, columns
+
+	def apply(self, method, *args, **kwargs):
+		'''Equalize all curves by given method.
+
+		Args:
+			method (str): 'tunni', 'prop' (proportional handles) or 'hobby'
+			*args, **kwargs: Passed to the method: proportion (float) for 'prop', curvature (tuple(float,float)) for 'hobby'
+
+		Returns:
+			dict{glyph_name: float}: Per glyph timings (see .timings)
+		'''
+		from time import time
+		from typerig.brain import CurveBatch
+		
+		assert method in self.methods, 'Unknown method: %s. Use one of: %s' %(method, ', '.join(self.methods.keys()))
+		
+		# - Extract
+		self.timings, glyphHandles, glyphColumns = {}, [], []
+
+		for glyph in self.glyphs:
+			start = time()
+			handles, columns = self._extract(glyph)
+			glyphHandles.append(handles)
+			glyphColumns.append(columns)
+			self.timings[glyph.name] = time() - start
+
+		# - Process: all curves of all glyphs at once
+		start = time()
+		columns = [[value for columns in glyphColumns for value in columns[field]] for field in range(8)]
+		result = getattr(CurveBatch.fromArrays(*columns), self.methods[method])(*args, **kwargs)
+		x1, y1, x2, y2 = [list(column) for column in result._columns()[2:6]]
+		self.mathTime = time() - start
+
+		# - Write back
+		offset = 0
+
+		for glyph, handles in zip(self.glyphs, glyphHandles):
+			start = time()
+
+			for cid, (bcp_out, bcp_in) in enumerate(handles, offset):
+				bcp_out.x, bcp_out.y = x1[cid], y1[cid]
+				bcp_in.x, bcp_in.y = x2[cid], y2[cid]
+
+			offset += len(handles)
+
+			if len(handles): 
+				glyph.update()
+
+			self.timings[glyph.name] += time() - start
+
+		return self.timings
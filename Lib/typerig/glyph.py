@@ -8,7 +8,7 @@
 # No warranties. By using this you agree
 # that you use it at your own risk!
 
-__version__ = '0.28.0'
+__version__ = '0.31.1'
 
 # - Dependencies -------------------------
 import fontlab as fl6
@@ -87,9 +87,12 @@ class eGlyph(pGlyph):
 		'''
 
 		if expand == 0:
-			return self.contours(layer)[contourId].breakContour(nodeId)
+			newContour = self.contours(layer)[contourId].breakContour(nodeId)
 		else:
-			return self.contours(layer)[contourId].breakContourExpanded(nodeId, expand)
+			newContour = self.contours(layer)[contourId].breakContourExpanded(nodeId, expand)
+
+		self.invalidate()
+		return newContour
 
 	def splitContour(self, scnPairs=None, layers=None, expand=0, close=False):
 		'''Split Contour at given node and combinations of compatible layers. Extrapolate line endings and close contour if needed.
@@ -120,6 +123,7 @@ class eGlyph(pGlyph):
 
 				if tempContour is not None:
 					self.layer(layerName).shapes[sID].addContour(tempContour, True)
+					self.invalidate()
 
 			if close: # Close all opened contours
 				for contour in self.contours(layerName):
@@ -127,6 +131,134 @@ class eGlyph(pGlyph):
 						contour.closed = True
 						contour.update()
 
+	# - Curves ---------------------------------------------
+	def eqHobbyContours(self, contours=None, layers=None, tension=1., curl=1., update=False):
+		'''Apply John Hobby's spline to whole contours: all handles are solved at once (brain.hobbySpline), not segment by segment.
+		Closed contours built only of curves are solved as cycles, runs of curves between lines (corners) as open splines
+		with end directions fixed by the existing handles at the corners.
+
+		Args:
+			contours (list(int)): Contour indices. If None all contours are processed
+			layers tuple(bool): Bool control tuple(active_layer, masters, masks, services). Note If all are set to False only the active layer is used.
+			tension (float): Hobby tension (1 - default, .75 - minimal, bigger - tighter)
+			curl (float): Curl at the ends of open runs that have retracted handles
+			update (bool): Update the glyph (send notification to the editor) when done
+
+		Returns:
+			None
+		'''
+		from typerig.brain import contourSegments, hobbySpline
+
+		for layerName in self._prepareLayers(layers):
+			layer_contours = self.contours(layerName)
+
+			for cid in (range(len(layer_contours)) if contours is None else contours):
+				contour = layer_contours[cid]
+				nodes = contour.nodes()
+				segments = contourSegments([node.isOn() for node in nodes], contour.closed)
+				isCurve = [len(segment) == 4 for segment in segments]
+
+				if not any(isCurve):
+					continue
+
+				# - Runs of consecutive curve segments
+				if all(isCurve) and contour.closed:
+					runs = [(segments, True)]
+				else:
+					shift = isCurve.index(False) + 1 if contour.closed else 0 # Start after a corner
+					runs, current = [], []
+
+					for segment, curve in zip(segments[shift:] + segments[:shift], isCurve[shift:] + isCurve[:shift]):
+						if curve:
+							current.append(segment)
+						elif len(current):
+							runs.append((current, False))
+							current = []
+
+					if len(current):
+						runs.append((current, False))
+
+				for run, closed in runs:
+					knots = [nodes[segment[0]] for segment in run] + ([] if closed else [nodes[run[-1][-1]]])
+					directions = None
+
+					if not closed: # Keep the tangents at the corners bounding the run; retracted handles fall back to curl
+						first, last = run[0], run[-1]
+						directions = ((nodes[first[1]].x - nodes[first[0]].x, nodes[first[1]].y - nodes[first[0]].y),
+									  (nodes[last[3]].x - nodes[last[2]].x, nodes[last[3]].y - nodes[last[2]].y))
+
+					for segment, (p0, bcp_out, bcp_in, p3) in zip(run, hobbySpline(knots, closed, tension, curl, directions)):
+						nodes[segment[1]].x, nodes[segment[1]].y = bcp_out
+						nodes[segment[2]].x, nodes[segment[2]].y = bcp_in
+
+		if update:
+			self.update() # Also drops the outline cache
+		else:
+			self.invalidate()
+
+	def addExtremesAtAngle(self, angles=None, contours=None, layers=None):
+		'''Insert nodes at the points where the curves are tangent to given direction(s) - extremes at angle.
+		All curve segments of a layer are solved at once (brain.CurveBatch.getParallelTimes).
+
+		Args:
+			angles (list(float)): Tangent directions in degrees (0 - horizontal, 90 - vertical). If None: horizontal and the Italic angle slant (90 - italicAngle)
+			contours (list(int)): Contour indices. If None all contours are processed
+			layers tuple(bool): Bool control tuple(active_layer, masters, masks, services). Note If all are set to False only the active layer is used.
+
+		Returns:
+			dict{layer name: int(number of inserted nodes)}
+		'''
+		from math import cos, sin, radians
+		from typerig.brain import CurveBatch, contourSegments
+
+		if angles is None:
+			angles = sorted(set([0., 90. - self.italicAngle()]))
+
+		vectors = [(cos(radians(angle)), sin(radians(angle))) for angle in angles]
+		inserted = {}
+
+		for layerName in self._prepareLayers(layers):
+			layer_contours = self.contours(layerName)
+			curves, owners = [], []
+
+			# - Collect all curve segments of the layer
+			for cid in (range(len(layer_contours)) if contours is None else contours):
+				contour = layer_contours[cid]
+				nodes = contour.nodes()
+
+				for segment in contourSegments([node.isOn() for node in nodes], contour.closed):
+					if len(segment) == 4:
+						curves.append([nodes[nid] for nid in segment])
+						owners.append((cid, contour.getT(nodes[segment[0]])))
+
+			indices, vectorIndices, times = CurveBatch(curves).getParallelTimes(vectors)
+
+			# - Contour times per curve, duplicates from different directions removed
+			curveTimes = {}
+
+			for index, time in zip(list(indices), list(times)):
+				time = round(float(time), 6)
+
+				if 0. < time < 1.: # Tangent points (almost) at the nodes are not inserted
+					curveTimes.setdefault(int(index), set()).add(time)
+
+			# - Insert from the end of every contour, so that the times of the remaining insertions stay valid
+			count = 0
+
+			for index in sorted(curveTimes.keys(), key=lambda index: owners[index], reverse=True):
+				cid, start = owners[index]
+				previous = 1.
+
+				for time in sorted(curveTimes[index], reverse=True):
+					layer_contours[cid].insertNodeTo(start + time/previous) # Segment [0, previous] is rescaled to [0, 1] by the prior insertion
+					previous = time
+					count += 1
+
+			inserted[layerName] = count
+
+		self.invalidate()
+		return inserted
+
 
 	# - Guidelines -----------------------------------------
 	def dropGuide(self, nodes=None, layers=None, name='*DropGuideline', tag='', color='darkMagenta', flip=(1,1), style='gsGlyphGuideline'):
@@ -15,6 +15,8 @@ import fontlab as fl6
 import fontgate as fgt
 import PythonQt as pqt
 import FL as legacy
+from time import time
+from array import array
 #from struct import calcsize
 
 # - Init
@@ -317,20 +319,40 @@ class pNode(object):
 		return self.fl.distanceTo(self.getPrev().position)
 
 	def insertAfter(self, time):
+		pGlyph.cacheEpoch += 1
 		return self.contour.insertNodeTo(self.getTime() + time)
 
 	def insertBefore(self, time):
+		pGlyph.cacheEpoch += 1
 		return self.contour.insertNodeTo(self.getPrevOn(False).getTime() + time)
 
+	def _segmentCurve(self, segmentNodes):
+		'''Internal! Returns brain._Curve for given four segment nodes'''
+		from typerig.brain import _Curve, _Point
+		return _Curve([_Point(float(node.x), float(node.y)) for node in segmentNodes])
+
 	def insertAfterDist(self, distance):
+		'''Insert node after the current one at given [distance] measured along the segment (exact for curves)'''
 		from typerig.brain import ratfrac
+		segmentNodes = self.getSegmentNodes()
+
+		if segmentNodes is not None and len(segmentNodes) == 4:
+			return self.insertAfter(self._segmentCurve(segmentNodes).solveDistance2Start(distance))
+
 		return self.insertAfter(ratfrac(distance, self.distanceToNext(), 1))
 
 	def insertBeforeDist(self, distance):
+		'''Insert node before the current one at given [distance] measured along the segment (exact for curves)'''
 		from typerig.brain import ratfrac
+		segmentNodes = self.getPrevOn(False).getSegmentNodes()
+
+		if segmentNodes is not None and len(segmentNodes) == 4:
+			return self.insertBefore(self._segmentCurve(segmentNodes).solveDistance2End(distance))
+
 		return self.insertBefore(1 - ratfrac(distance, self.distanceToPrev(), 1))
 
 	def remove(self):
+		pGlyph.cacheEpoch += 1
 		self.contour.removeOne(self.fl)
 
 	def update(self):
@@ -451,6 +473,7 @@ class pContour(object):
 		return '<%s (%s, %s) nodes=%s ccw=%s closed=%s>' % (self.__class__.__name__, self.x(), self.y(), len(self.nodes()), self.isCCW(), self.closed)
 
 	def reverse(self):
+		pGlyph.cacheEpoch += 1
 		self.fl.reverse()
 
 	def isCW(self):
@@ -620,6 +643,186 @@ class pShape(object):
 	
 
 
+class pEditBatch(object):
+	'''Deferred notification transaction: pGlyph.updateObject, pGlyph.changed and pFont.updateObject calls made while it is open are only recorded.
+	On close one deduplicated set of notifications is sent: an undo entry per updated glyph and font object, contour changes once per glyph 
+	and package content update once per font. Nested batches join the outermost one.
+
+	Constructor:
+		pEditBatch(undoMessage='TypeRig', verbose=True)
+
+	Example:
+		>>> with pFont().batch_edit('Smart Corner') as batch:
+		>>>		for glyph in glyphs: glyph.updateObject(glyph.fl)
+		>>> batch.report()
+	'''
+	active = None # The open (outermost) batch
+
+	def __init__(self, undoMessage='TypeRig', verbose=True):
+		self.undoMessage = undoMessage
+		self.verbose = verbose
+		self.glyphs = {} # flGlyph id: (pGlyph, flObject)
+		self.changedGlyphs = {} # flGlyph id: pGlyph - contour changes only (pGlyph.changed)
+		self.objects = {} # id: flObject - font level objects
+		self.glyphPackages = set() # fgFont ids of the updated glyphs
+		self.deferred = {'changesApplied':0, 'contoursChanged':0, 'packageUpdated':0}
+		self.sent = {'changesApplied':0, 'contoursChanged':0, 'packageUpdated':0}
+		self.time = 0.
+		self.__outer = False
+
+	def __enter__(self):
+		if pEditBatch.active is None:
+			pEditBatch.active = self
+			self.__outer = True
+
+		return pEditBatch.active
+
+	def __exit__(self, exc_type, exc_value, exc_traceback):
+		if self.__outer:
+			pEditBatch.active = None
+			self.commit() # Also on error: the editor has to see the changes made so far
+
+		return False
+
+	# - Record ----------------------------------------
+	def addGlyph(self, glyph, flObject):
+		self.deferred['changesApplied'] += 1
+		self.deferred['packageUpdated'] += 1
+		self.deferred['contoursChanged'] += len(glyph.contours())
+		self.glyphs.setdefault(glyph.id, (glyph, flObject))
+		self.glyphPackages.add(glyph.fl.fgPackage.id)
+
+	def addContours(self, glyph):
+		self.deferred['contoursChanged'] += len(glyph.contours())
+		self.changedGlyphs.setdefault(glyph.id, glyph)
+
+	def addFont(self, font, flObject):
+		self.deferred['changesApplied'] += 1
+		self.objects.setdefault(id(flObject), flObject)
+
+	# - Notify ----------------------------------------
+	def commit(self):
+		'''Send the recorded notifications'''
+		start = time()
+
+		# - Undo entries: once per updated glyph and font object
+		for flObject in [flObject for glyph, flObject in self.glyphs.values()] + self.objects.values():
+			fl6.flItems.notifyChangesApplied(self.undoMessage[:20], flObject, True)
+			self.sent['changesApplied'] += 1
+
+		# - Contours and packages
+		changedGlyphs = dict(self.changedGlyphs)
+		changedGlyphs.update({glyphId:glyph for glyphId, (glyph, flObject) in self.glyphs.items()})
+
+		for glyph in changedGlyphs.values():
+			for contour in glyph.contours():
+				contour.changed()
+				self.sent['contoursChanged'] += 1
+
+			glyph.invalidate()
+
+		for packageId in self.glyphPackages:
+			fl6.flItems.notifyPackageContentUpdated(packageId)
+			self.sent['packageUpdated'] += 1
+
+		self.time = time() - start
+		if self.verbose: print 'DONE:\t %s; Glyphs: %s' %(self.undoMessage, len(changedGlyphs))
+
+	def report(self):
+		'''Returns dict{'deferred', 'sent': notification counts; 'time': notification time; 'saved': estimated time saved} (seconds)'''
+		deferred, sent = sum(self.deferred.values()), sum(self.sent.values())
+		saved = self.time/sent*(deferred - sent) if sent else 0.
+		return {'deferred':dict(self.deferred), 'sent':dict(self.sent), 'time':self.time, 'saved':max(saved, 0.)}
+
+
+class SelectionSnapshot(object):
+	'''Node selection of a glyph layer, taken in a single walk over its shapes, contours and nodes.
+	The selection is read from the active layer and applied to the given layer by node index (as all pGlyph.selected* methods do).
+
+	Constructor:
+		SelectionSnapshot(pGlyph, layer=None, deep=True)
+
+	Attributes:
+		.nodes (list[flNode]): All nodes of the layer (see pGlyph.nodes)
+		.contours (list[flContour]), .shapes (list[flShape]): Contours and shapes of the layer (components if deep)
+		.shapeIndices, .contourIndices, .nodeIndices (list[int]): Per node: shape (None if not found), contour and in-contour index
+		.onCurve (list[bool]): Per node: on-curve flag
+		.times (list[int]): Per node: contour time (segment index) - see pGlyph.mapNodes2Times
+		.selected (list[int]): Indices of the selected nodes
+	'''
+	def __init__(self, glyph, layer=None, deep=True):
+		self.layer, self.deep = layer, deep
+		self.shapes = glyph.shapes(layer) if not deep else glyph.components(layer)
+		self.contours = glyph.contours(layer, deep=deep)
+		self.nodes, self.shapeIndices, self.contourIndices, self.nodeIndices, self.onCurve, self.times = [], [], [], [], [], []
+		
+		# - Shape of every contour: shapes hold the contours in layer order, otherwise search
+		contourShapes = [None]*len(self.contours)
+		position = 0
+
+		for sid, shape in enumerate(self.shapes):
+			for contour in shape.contours:
+				if position < len(self.contours) and self.contours[position] == contour:
+					contourShapes[position] = sid
+					position += 1
+
+				elif contour in self.contours:
+					contourShapes[self.contours.index(contour)] = sid
+
+		# - Nodes
+		for cid, contour_nodes in enumerate(glyph.contourNodes(layer, deep)):
+			countOn = -1
+
+			for nid, node in enumerate(contour_nodes):
+				isOn = node.isOn()
+				countOn += isOn
+
+				self.nodes.append(node)
+				self.shapeIndices.append(contourShapes[cid])
+				self.contourIndices.append(cid)
+				self.nodeIndices.append(nid)
+				self.onCurve.append(isOn)
+				self.times.append(countOn)
+
+		# - Selection at the active layer
+		activeNodes = self.nodes if layer is None else glyph.nodes(deep=deep)
+		self.selected = [index for index, node in enumerate(activeNodes) if node.selected]
+		self.__selectedOn = [index for index in self.selected if activeNodes[index].isOn()]
+
+	def __len__(self):
+		return len(self.selected)
+
+	def __repr__(self):
+		return '<%s nodes=%s selected=%s>' %(self.__class__.__name__, len(self.nodes), len(self.selected))
+
+	def indices(self, filterOn=False):
+		'''Indices of the selected nodes (only on-curve if filterOn)'''
+		return list(self.__selectedOn if filterOn else self.selected)
+
+	def getNodes(self, filterOn=False, extend=None):
+		'''Selected nodes: list[flNode] or list[extend(flNode)]'''
+		if extend is None:
+			return [self.nodes[index] for index in self.indices(filterOn)]
+
+		return [extend(self.nodes[index]) for index in self.indices(filterOn)]
+
+	def atContours(self, filterOn=False):
+		'''Selected nodes as list[tuple(contour index, node index)]'''
+		return [(self.contourIndices[index], self.nodeIndices[index]) for index in self.indices(filterOn)]
+
+	def shapeOrder(self, filterOn=False):
+		'''Indices of the selected nodes that belong to a shape, in shape order'''
+		return sorted((index for index in self.indices(filterOn) if self.shapeIndices[index] is not None), key=lambda index: (self.shapeIndices[index], index))
+
+	def atShapes(self, filterOn=False):
+		'''Selected nodes as list[tuple(shape index, contour index, node index)] in shape order'''
+		return [(self.shapeIndices[index], self.contourIndices[index], self.nodeIndices[index]) for index in self.shapeOrder(filterOn)]
+
+	def atTimes(self, filterOn=False):
+		'''Selected nodes as list[tuple(contour index, contour time)]'''
+		return [(self.contourIndices[index], self.times[index]) for index in self.indices(filterOn)]
+
+
 class pGlyph(object):
 	'''Proxy to flGlyph and fgGlyph combined into single entity.
 
@@ -634,8 +837,20 @@ class pGlyph(object):
 		.parent (fgFont)
 		.fg (fgGlyph)
 		.fl (flGlyph)
+		.cacheStats (dict): Outline cache counters - see cacheInfo()
 		...
+
+	Outline cache:
+		Shapes, contours, nodes and their index maps are cached per layer on first use and reused until the glyph changes 
+		(.version() - flGlyph.lastModified), .update() or .invalidate() is called. It is safe against topology edits made through 
+		this object (insert, remove, add shapes...) and through pNode (insertAfter/Before, remove) and pContour (reverse) - 
+		these bump pGlyph.cacheEpoch, which drops the caches of all glyphs. Topology edits (adding, removing or reordering nodes, 
+		contours or shapes, changing on/off-curve types) made directly on Fontlab objects (ex. flContour.insertNodeTo, removeOne, 
+		removeNodesBetween) should be followed by .invalidate() or .update(). Coordinates are read live from the cached nodes, 
+		so moving nodes never needs invalidation.
 	'''
+	cacheTotals = {'hits':0, 'misses':0, 'invalidations':0} # All glyphs
+	cacheEpoch = 0 # Bumped by the topology edits of pNode and pContour, which do not know their pGlyph
 
 	def __init__(self, *argv):
 		
@@ -678,6 +893,9 @@ class pGlyph(object):
 		self.unicode = self.fg.unicode
 		self.package = fl6.flPackage(self.fl.package)
 		self.builders = {}
+		self.cacheStats = {'hits':0, 'misses':0, 'invalidations':0}
+		self.__cache = {}
+		self.__cacheVersion = None
 
 	def __repr__(self):
 		return '<%s name=%s index=%s unicode=%s>' % (self.__class__.__name__, self.name, self.index, self.unicode)
@@ -701,6 +919,80 @@ class pGlyph(object):
 
 	def setMark(self, mark_color): self.fl.mark = mark_color; self.mark = self.fl.mark
 
+	# - Outline cache ----------------------------------------
+	def invalidate(self):
+		'''Drop the cached shapes, contours, nodes and maps of all layers'''
+		self.__cache = {}
+		self.__cacheVersion = None
+		self.cacheStats['invalidations'] += 1
+		pGlyph.cacheTotals['invalidations'] += 1
+
+	def _cached(self, layer, item, builder):
+		'''Returns the cached [item] of given layer, built by calling builder() on a miss.
+		Args:
+			layer (int or str): Layer index or name. If None returns ActiveLayer
+			item (hashable): Cache key within the layer
+			builder (function): Called without arguments, returns the value to be cached
+		'''
+		version = (self.fl.lastModified, pGlyph.cacheEpoch)
+
+		if version != self.__cacheVersion:
+			self.__cache = {}
+			self.__cacheVersion = version
+
+		# - Keyed by the layer reference as given (no layer lookup): index and name of the same layer are cached apart
+		layerCache = self.__cache.setdefault(layer if layer is not None else self.fl.activeLayer.name, {})
+
+		if item in layerCache:
+			self.cacheStats['hits'] += 1
+			pGlyph.cacheTotals['hits'] += 1
+		else:
+			self.cacheStats['misses'] += 1
+			pGlyph.cacheTotals['misses'] += 1
+			layerCache[item] = builder()
+
+		return layerCache[item]
+
+	def cacheInfo(self, total=False):
+		'''Outline cache counters.
+		Args:
+			total (bool): Counters of all glyphs instead of this one
+		Returns:
+			dict{'hits', 'misses', 'invalidations', 'hitRate' (float 0-1)}
+		'''
+		info = dict(pGlyph.cacheTotals if total else self.cacheStats)
+		calls = info['hits'] + info['misses']
+		info['hitRate'] = float(info['hits'])/calls if calls else 0.
+		return info
+
+	def contourNodes(self, layer=None, deep=True):
+		'''Return the nodes of every contour at given layer.
+		Args:
+			layer (int or str): Layer index or name. If None returns ActiveLayer
+		Returns:
+			list[list[flNode]]: Contour index -> nodes
+		'''
+		return [list(nodes) for nodes in self._cached(layer, ('contourNodes', deep), lambda: [contour.nodes() for contour in self.contours(layer, deep=deep)])]
+
+	def nodeMap(self, layer=None, deep=True):
+		'''Return the index maps of all nodes at given layer.
+		Args:
+			layer (int or str): Layer index or name. If None returns ActiveLayer
+		Returns:
+			tuple(list[tuple(int, int)], list[int]): Node index -> (Contour index, Node index within contour); Contour index -> index of its first node
+		'''
+		def builder():
+			nodeIndices, contourStarts = [], []
+
+			for cid, nodes in enumerate(self._cached(layer, ('contourNodes', deep), lambda: [contour.nodes() for contour in self.contours(layer, deep=deep)])):
+				contourStarts.append(len(nodeIndices))
+				nodeIndices.extend((cid, nid) for nid in range(len(nodes)))
+
+			return nodeIndices, contourStarts
+
+		nodeIndices, contourStarts = self._cached(layer, ('nodeMap', deep), builder)
+		return list(nodeIndices), list(contourStarts)
+
 	def nodes(self, layer=None, extend=None, deep=True):
 		'''Return all nodes at given layer.
 		Args:
@@ -710,12 +1002,12 @@ class pGlyph(object):
 			list[flNodes]
 		'''
 		# - Default
-		layer_contours = self.contours(layer, deep=deep)
+		layer_nodes = self._cached(layer, ('nodes', deep), lambda: [node for nodes in self.contourNodes(layer, deep) for node in nodes])
 
 		if extend is None:
-			return [node for contour in layer_contours for node in contour.nodes()]
+			return list(layer_nodes)
 		else:
-			return [extend(node) for contour in layer_contours for node in contour.nodes()]
+			return [extend(node) for node in layer_nodes]
 
 	def fg_nodes(self, layer=None):
 		'''Return all FontGate nodes at given layer.
@@ -733,17 +1025,22 @@ class pGlyph(object):
 		Returns:
 			list[flContours]
 		'''
-		layer_contours = self.layer(layer).getContours()
-		
-		# - Dig deeper in grouped components and shapebuilders (filters)
-		if deep:
-			glyph_components = self.components(layer)
+		def builder():
+			layer_contours = self.layer(layer).getContours()
+			
+			# - Dig deeper in grouped components and shapebuilders (filters)
+			if deep:
+				glyph_components = self.components(layer)
 
-			if len(glyph_components):
-				layer_contours = [contour for component in glyph_components for contour in component.contours]
+				if len(glyph_components):
+					layer_contours = [contour for component in glyph_components for contour in component.contours]
 
-		if extend is None:
 			return layer_contours
+
+		layer_contours = self._cached(layer, ('contours', deep), builder)
+
+		if extend is None:
+			return list(layer_contours)
 		else:
 			return [extend(contour) for contour in layer_contours]
 
@@ -812,10 +1109,12 @@ class pGlyph(object):
 		Returns:
 			list[flShapes]
 		'''
+		layer_shapes = self._cached(layer, 'shapes', lambda: self.layer(layer).shapes)
+
 		if extend is None:
-			return self.layer(layer).shapes
+			return list(layer_shapes)
 		else:
-			return [extend(shape) for shape in self.layer(layer).shapes]
+			return [extend(shape) for shape in layer_shapes]
 
 	def dereference(self, layer=None):
 		'''Remove all shape references but leave components.
@@ -833,6 +1132,7 @@ class pGlyph(object):
 		wLayer.removeAllShapes()
 		for clone in clones: wLayer.addShape(clone)
 
+		self.invalidate()
 		return clones
 
 	def containers(self, layer=None, extend=None):
@@ -857,6 +1157,8 @@ class pGlyph(object):
 		for container in self.containers(layer):
 			container.decomposite()
 
+		self.invalidate()
+
 	def getBuilders(self, layer=None, store=False):
 		shape_builders = {}
 
@@ -878,9 +1180,12 @@ class pGlyph(object):
 			flShape
 		'''
 		if clone:
-			return self.layer(layer).addShape(shape.cloneTopLevel())
+			newShape = self.layer(layer).addShape(shape.cloneTopLevel())
 		else:
-			return self.layer(layer).addShape(shape)
+			newShape = self.layer(layer).addShape(shape)
+
+		self.invalidate()
+		return newShape
 
 	def replaceShape(self, old_shape, new_shape, layer=None):
 		'''Repalce a shape at given layer.
@@ -891,6 +1196,7 @@ class pGlyph(object):
 			None
 		'''
 		self.layer(layer).replaceShape(old_shape, new_shape)
+		self.invalidate()
 
 	def removeShape(self, shape, layer=None, recursive=True):
 		'''Remove a new shape at given layer.
@@ -902,6 +1208,7 @@ class pGlyph(object):
 			None
 		'''
 		self.layer(layer).removeShape(shape, recursive)
+		self.invalidate()
 
 	def addShapeContainer(self, shapeList, layer=None, remove=True):
 		'''Add a new shape container* at given layer.
@@ -968,6 +1275,9 @@ class pGlyph(object):
 
 	def components(self, layer=None, extend=None):
 		'''Return all glyph components besides glyph.'''
+		if extend is None:
+			return list(self._cached(layer, 'components', lambda: [comp for pair in self.listGlyphComponents(layer) for comp in pair[1]]))
+
 		return [comp for pair in self.listGlyphComponents(layer, extend) for comp in pair[1]]
 
 	def getCompositionString(self, layer=None, legacy=True):
@@ -1017,6 +1327,8 @@ class pGlyph(object):
 		elif isinstance(layer, fgt.fgLayer):
 			self.fg.layers.append(layer)
 
+		self.invalidate()
+
 	def removeLayer(self, layer):
 		'''Removes a layer from glyph.
 		Args:
@@ -1025,6 +1337,7 @@ class pGlyph(object):
 			None
 		'''
 		self.fl.removeLayer(self.layer(layer))
+		self.invalidate()
 
 	def duplicateLayer(self, layer=None, newLayerName='New Layer', toBack=False):
 		'''Duplicates a layer with new name and adds it to glyph's layers.
@@ -1091,13 +1404,39 @@ class pGlyph(object):
 		# !TODO: Undo?
 		if fl:self.fl.update()
 		if fg:self.fg.update()
+		self.invalidate()
 	
+	def batch_edit(self, undoMessage='TypeRig', verbose=True):
+		'''Transaction deferring the update notifications of the glyph to its end - see pEditBatch.
+		Args:
+			undoMessage (string): Message of the undo/history items
+		Returns:
+			pEditBatch: Context manager (with glyph.batch_edit('Message'): ...)
+		'''
+		return pEditBatch(undoMessage, verbose)
+
+	def changed(self):
+		'''Notify the editor that the contours of the glyph changed - partial update, without undo/history item.
+		Inside a batch (see batch_edit) only recorded: the notifications are sent when the batch closes.
+		'''
+		if pEditBatch.active is not None: # Sent once when the batch closes
+			pEditBatch.active.addContours(self)
+			return
+
+		for contour in self.contours():
+			contour.changed()
+
 	def updateObject(self, flObject, undoMessage='TypeRig', verbose=True):
 		'''Updates a flObject sends notification to the editor as well as undo/history item.
+		Inside a batch (see batch_edit) only recorded: the notifications are sent when the batch closes.
 		Args:
 			flObject (flGlyph, flLayer, flShape, flNode, flContour): Object to be update and set undo state
 			undoMessage (string): Message to be added in undo/history list.'''
 		
+		if pEditBatch.active is not None: # Sent once when the batch closes
+			pEditBatch.active.addGlyph(self, flObject)
+			return
+
 		# - General way ---- pre 6774 worked fine!
 		fl6.flItems.notifyChangesApplied(undoMessage[:20], flObject, True)
 		if verbose: print 'DONE:\t %s' %undoMessage
@@ -1107,6 +1446,7 @@ class pGlyph(object):
 			contour.changed()
 		
 		fl6.flItems.notifyPackageContentUpdated(self.fl.fgPackage.id)
+		self.invalidate()
 		#fl6.Update()
 		
 		'''# - Type specific way 
@@ -1120,6 +1460,15 @@ class pGlyph(object):
 		'''
 
 	# - Glyph Selection -----------------------------------------------
+	def selection(self, layer=None, deep=True):
+		'''Return a snapshot of the node selection taken in a single pass. Query it instead of calling selected* methods repeatedly.
+		Args:
+			layer (int or str): Layer index or name. If None returns ActiveLayer
+		Returns:
+			SelectionSnapshot
+		'''
+		return SelectionSnapshot(self, layer, deep)
+
 	def selectedNodeIndices(self, filterOn=False, deep=True):
 		'''Return all indices of nodes selected at current layer.
 		Args:
@@ -1127,12 +1476,7 @@ class pGlyph(object):
 		Returns:
 			list[int]
 		'''
-		allNodes = self.nodes(deep=deep)
-
-		if not filterOn:
-			return [allNodes.index(node) for node in allNodes if node.selected]
-		else:
-			return [allNodes.index(node) for node in allNodes if node.selected and node.isOn()]
+		return self.selection(deep=deep).indices(filterOn)
 	
 	def selected(self, filterOn=False, deep=True):
 		'''Return all selected nodes indexes at current layer.
@@ -1151,11 +1495,11 @@ class pGlyph(object):
 		Returns:
 			list[flNode]
 		'''
-		return [self.nodes(layer, extend, deep)[nid] for nid in self.selectedNodeIndices(filterOn, deep)]
-		#return [node for node in self.nodes(layer, extend, deep) if node.selected]
+		return self.selection(layer, deep).getNodes(filterOn, extend)
 
 	def nodesForIndices(self, indices, layer=None, filterOn=False, extend=None, deep=True):
-		return [self.nodes(layer, extend, deep)[nid] for nid in indices]
+		layer_nodes = self.nodes(layer, extend, deep)
+		return [layer_nodes[nid] for nid in indices]
 	
 	def selectedAtContours(self, index=True, layer=None, filterOn=False, deep=False):	
 		'''Return all selected nodes and the contours they rest upon at current layer.
@@ -1166,12 +1510,18 @@ class pGlyph(object):
 			list[tuple(int, int)]: [(contourID, nodeID)..()] or 
 			list[tuple(flContour, flNode)]
 		'''
-		allContours = self.contours(layer)
+		snapshot = self.selection(layer, deep)
 		
-		if index:
-			return [(allContours.index(node.contour), node.index) for node in self.selectedNodes(layer, filterOn, deep=deep)]
-		else:
-			return [(node.contour, node) for node in self.selectedNodes(layer, filterOn, deep=deep)]
+		if not index:
+			return [(snapshot.contours[snapshot.contourIndices[nid]], snapshot.nodes[nid]) for nid in snapshot.indices(filterOn)]
+
+		# - Contour indices refer to all contours at layer (deep)
+		allContours = self.contours(layer)
+
+		if deep or snapshot.contours == allContours:
+			return snapshot.atContours(filterOn)
+
+		return [(allContours.index(snapshot.contours[cid]), nid) for cid, nid in snapshot.atContours(filterOn)]
 
 	def selectedAtShapes(self, index=True, filterOn=False, layer=None, deep=True):
 		'''Return all selected nodes and the shapes they belong at current layer.
@@ -1184,13 +1534,12 @@ class pGlyph(object):
 
 		!TODO: Make it working with layers as selectedAtContours(). This is legacy mode so other scripts would work!
 		'''
-		allContours = self.contours(layer=layer, deep=deep)
-		allShapes = self.shapes(layer) if not deep else self.components(layer)
+		snapshot = self.selection(layer, deep)
 
 		if index:
-			return [(allShapes.index(shape), allContours.index(contour), node.index) for shape in allShapes for contour in shape.contours for node in contour.nodes() if node in self.selectedNodes(layer=layer, filterOn=filterOn, deep=deep)]
+			return snapshot.atShapes(filterOn)
 		else:
-			return [(shape, contour, node) for shape in allShapes for contour in shape.contours for node in contour.nodes() if node in self.selectedNodes(layer=layer, filterOn=filterOn, deep=deep)]
+			return [(snapshot.shapes[snapshot.shapeIndices[nid]], snapshot.contours[snapshot.contourIndices[nid]], snapshot.nodes[nid]) for nid in snapshot.shapeOrder(filterOn)]
 
 	def selectedShapeIndices(self, select_all=False, deep=False):
 		'''Return all indices of nodes selected at current layer.
@@ -1202,7 +1551,7 @@ class pGlyph(object):
 		selection_mode = ['AnyNodeSelected', 'AllContourSelected'][select_all]
 		allShapes = self.shapes() if not deep else self.components()
 
-		return [allShapes.index(shape) for shape in allShapes if shape.hasSelected(selection_mode)]
+		return [sid for sid, shape in enumerate(allShapes) if shape.hasSelected(selection_mode)]
 		
 
 	def selectedShapes(self, layer=None, select_all=False, deep=False, extend=None):
@@ -1225,17 +1574,13 @@ class pGlyph(object):
 		Returns:
 			list[QPointF]
 		'''
-		pLayer = self.layer(layer)
+		snapshot = self.selection(layer, deep=False)
 		
 		if not applyTransform:
-			nodelist = self.selectedAtContours(filterOn=filterOn, deep=False)
-			#return [pLayer.getContours()[item[0]].nodes()[item[1]].position for item in nodelist]
-			return [self.contours(layer)[cid].nodes()[nid].position for cid, nid in nodelist]
+			return [snapshot.nodes[nid].position for nid in snapshot.indices(filterOn)]
 
 		else:
-			nodelist = self.selectedAtShapes(filterOn=filterOn, deep=False)
-			#return [pLayer.getShapes(1)[item[0]].transform.map(pLayer.getContours()[item[1]].nodes()[item[2]].position) for item in nodelist]
-			return [self.shapes(layer)[sid].transform.map(self.contours(layer)[cid].nodes()[nid].position) for sid, cid, nid in nodelist]
+			return [snapshot.shapes[snapshot.shapeIndices[nid]].transform.map(snapshot.nodes[nid].position) for nid in snapshot.shapeOrder(filterOn)] # Shape by shape, as selectedAtShapes
 
 	def selectedSegments(self, layer=None):
 		'''Returns list of currently selected segments
@@ -1244,7 +1589,8 @@ class pGlyph(object):
 		Returns:
 			list[CurveEx]
 		'''
-		return [self.contours(layer)[cID].segment(self.mapNodes2Times(layer)[cID][nID]) for cID, nID in self.selectedAtContours()]
+		allContours, timeMaps = self.contours(layer), self._timeMaps(layer)
+		return [allContours[cID].segment(timeMaps[cID][0][nID]) for cID, nID in self.selectedAtContours()]
 
 	def findNode(self, nodeName, layer=None):
 		'''Find node by name/tag'''
@@ -1256,51 +1602,82 @@ class pGlyph(object):
 		if temp is not None: return temp[1]
 
 	# - Outline -----------------------------------------------
-	def _mapOn(self, layer=None):
-		'''Create map of onCurve Nodes for every contour in given layer
+	def _timeMaps(self, layer=None, deep=True):
+		'''Cached node <-> contour time maps for every contour in given layer, as compact integer arrays.
 		Returns:
-			dict: {contour_index : {True_Node_Index : on_Curve__Node_Index}...}
+			list[tuple(array nodeTimes, array timeStarts)]: Per contour: nodeTimes[node index] = contour time; 
+			timeStarts[time + 1] = index of the first node at that time (nodes before the first on-curve have time -1), last item = node count
 		'''
-		contourMap = {}		
-		allContours = self.contours(layer)
-		
-		for contour in allContours:
-			nodeMap = {}
-			countOn = -1
+		def builder():
+			timeMaps = []
 
-			for node in contour.nodes():
-				countOn += node.isOn() # Hack-ish but working
-				nodeMap[node.index] = countOn
-				
-			contourMap[allContours.index(contour)] = nodeMap
+			for contour_nodes in self.contourNodes(layer, deep):
+				nodeTimes, timeStarts = array('i'), array('i', [0])
+				countOn = -1
+
+				for nid, node in enumerate(contour_nodes):
+					if node.isOn():
+						countOn += 1
+						timeStarts.append(nid)
+
+					nodeTimes.append(countOn)
+
+				timeStarts.append(len(contour_nodes))
+				timeMaps.append((nodeTimes, timeStarts))
+
+			return timeMaps
 
-		return contourMap
+		return self._cached(layer, ('timeMaps', deep), builder)
+
+	def _mapOn(self, layer=None):
+		'''Create map of onCurve Nodes for every contour in given layer
+		Returns:
+			dict: {contour_index : array[True_Node_Index] = on_Curve__Node_Index...}
+		'''
+		return {cID:array('i', nodeTimes) for cID, (nodeTimes, timeStarts) in enumerate(self._timeMaps(layer))}
 
 	def mapNodes2Times(self, layer=None):
 		'''Create map of Nodes at contour times for every contour in given layer
 		Returns:
-			dict{Contour index (int) : dict{Contour Time (int): Node Index (int) }}
+			dict{Contour index (int) : array[Node Index (int)] = Contour Time (int)}
 		'''
 		return self._mapOn(layer)
 
 	def mapTimes2Nodes(self, layer=None):
 		'''Create map of Contour times at node indexes for every contour in given layer
 		Returns:
-			dict{Contour index (int) : dict{Node Index (int) : Contour Time (int) }}
+			dict{Contour index (int) : dict{Contour Time (int) : list[Node Index (int)]}}
 		'''
-		n2tMap = self._mapOn(layer)
 		t2nMap = {}
 
-		for cID, nodeMap in n2tMap.iteritems():
-			tempMap = {}
-			
-			for nID, time in nodeMap.iteritems():
-				tempMap.setdefault(time, []).append(nID)
-
-			t2nMap[cID] = tempMap
+		for cID, (nodeTimes, timeStarts) in enumerate(self._timeMaps(layer)):
+			t2nMap[cID] = {time - 1:range(timeStarts[time], timeStarts[time + 1]) for time in range(len(timeStarts) - 1) if timeStarts[time] < timeStarts[time + 1]}
 
 		return t2nMap
 
+	def nodeTime(self, cID, nID, layer=None):
+		'''Returns the contour time (segment index) of the node specified at given layer - O(1)
+		Args:
+			cID (int): Contour index
+			nID (int): Node index
+			layer (int or str): Layer index or name. If None returns ActiveLayer
+		Returns:
+			int
+		'''
+		return self._timeMaps(layer)[cID][0][nID]
+
+	def timeNodes(self, cID, time, layer=None):
+		'''Returns the indices of the nodes at contour time (segment index) specified at given layer - O(1)
+		Args:
+			cID (int): Contour index
+			time (int): Contour time
+			layer (int or str): Layer index or name. If None returns ActiveLayer
+		Returns:
+			list[int]: On-curve node followed by the off-curve nodes of the segment
+		'''
+		timeStarts = self._timeMaps(layer)[cID][1]
+		return range(timeStarts[time + 1], timeStarts[time + 2])
+
 	def getSegment(self, cID, nID, layer=None):
 		'''Returns contour segment of the node specified at given layer
 		Args:
@@ -1310,7 +1687,7 @@ class pGlyph(object):
 		Returns:
 			CurveEx
 		'''
-		return self.contours(layer)[cID].segment(self._mapOn(layer)[cID][nID])
+		return self.contours(layer)[cID].segment(self.nodeTime(cID, nID, layer))
 
 	def segments(self, cID, layer=None):
 		'''Returns all contour segments at given layer
@@ -1334,14 +1711,17 @@ class pGlyph(object):
 		segments = self.segments(cID, layer)
 		
 		#nodes = self.nodes(layer)
-		nodes = self.contours(layer)[cID].nodes()
+		nodes = self.contourNodes(layer)[cID]
 		nodes.append(nodes[0]) # Dirty Close contour
 
-		timeTable = self.mapTimes2Nodes(layer)[cID]
+		timeStarts = self._timeMaps(layer)[cID][1]
 		n4sMap = {}
 
-		for time, nodeIndexes in timeTable.iteritems():
-			n4sMap[time] = (segments[time], [nodes[nID] for nID in nodeIndexes] + [nodes[nodeIndexes[-1] + 1]]) # Should be closed otherwise fail			
+		for time in range(len(timeStarts) - 1):
+			start, end = timeStarts[time], timeStarts[time + 1]
+
+			if start < end:
+				n4sMap[time - 1] = (segments[time - 1], nodes[start:end + 1]) # Should be closed otherwise fail
 
 		return n4sMap
 
@@ -1356,6 +1736,7 @@ class pGlyph(object):
 			None
 		'''
 		self.contours(layer)[cID].insert(nID, nodeList)
+		self.invalidate()
 
 	def removeNodes(self, cID, nodeList, layer=None):
 		'''Removes a list of nodes from contour at layer specified.
@@ -1366,9 +1747,13 @@ class pGlyph(object):
 		Returns:
 			None
 		'''
+		wContour = self.contours(layer)[cID]
+
 		for node in nodeList:
-			self.contours(layer)[cID].removeOne(node)
-			#self.contours(layer)[cID].updateIndices()
+			wContour.removeOne(node)
+			#wContour.updateIndices()
+
+		self.invalidate()
 
 	def insertNodeAt(self, cID, nID_time, layer=None):
 		''' Inserts node in contour at specified layer
@@ -1381,6 +1766,7 @@ class pGlyph(object):
 		so inserting a node at .5 t between nodes with indexes 3 and 4 will be 3 (index) + 0.5 (time) = 3.5
 		'''
 		self.contours(layer)[cID].insertNodeTo(nID_time)
+		self.invalidate()
 
 	def removeNodeAt(self, cID, nID, layer=None):
 		'''Removes a node from contour at layer specified.
@@ -1392,6 +1778,7 @@ class pGlyph(object):
 			None
 		'''
 		self.contours(layer)[cID].removeAt(nID)
+		self.invalidate()
 
 	def translate(self, dx, dy, layer=None):
 		'''Translate (shift) outline at given layer.
@@ -1497,6 +1884,33 @@ class pGlyph(object):
 		'''Get Glyph's Boundig Box at given layer (int or str). Returns QRectF.'''
 		return self.layer(layer).boundingBox
 
+	def getContourBounds(self, layer=None):
+		'''Get tight (curve aware) bounding boxes of all contours at given layer (int or str). Returns list[brain.contourBounds].'''
+		from typerig.brain import contourBounds
+		contour_bounds = []
+
+		for contour in self.contours(layer):
+			contour_nodes = contour.nodes()
+			contour_bounds.append(contourBounds(contour_nodes, [node.isOn() for node in contour_nodes], contour.closed))
+
+		return contour_bounds
+
+	def getTightBounds(self, layer=None):
+		'''Get Glyph's tight (curve aware) Bounding Box at given layer (int or str)
+		or the merged box of a list of layers (ex. all masters). Returns brain.bounds.
+		'''
+		from typerig.brain import bounds
+		layers = layer if isinstance(layer, (list, tuple)) else [layer]
+		contour_bounds = [item for layer in layers for item in self.getContourBounds(layer) if len(item.segments)]
+		return bounds.union(contour_bounds) if len(contour_bounds) else bounds()
+
+	def getIntersections(self, layer=None, tolerance=.5):
+		'''Find contour overlaps and self-intersections at given layer (int or str).
+		Returns list[tuple((contour_A, segment_A, t_A), (contour_B, segment_B, t_B), (x, y))] - see brain.sweepIntersections
+		'''
+		from typerig.brain import sweepIntersections
+		return sweepIntersections(self.getContourBounds(layer), tolerance).getIntersections()
+
 	def setLSB(self, newLSB, layer=None):
 		'''Set the Left Side-bearing (int) at given layer (int or str)'''
 		pLayer = self.layer(layer)
@@ -1894,6 +2308,32 @@ class pFont(object):
 			if foundShape is not None:
 				return foundShape
 
+	def getStems(self, position, glyphs=None, layer=None, vertical=True):
+		'''Measure the stems of many glyphs in a single bulk query along one probe line.
+		Args:
+			position (int or float): Y of the (horizontal) probe line for vertical stems or X of the (vertical) probe line for horizontal stems
+			glyphs (list[pGlyph]): Glyphs to measure. If None all glyphs in font
+			layer (int or str): Layer index or name. If None returns ActiveLayer
+			vertical (bool): Measure vertical or horizontal stems
+		Returns:
+			dict{glyph_name: list[float]}: Stem widths in the order met along the probe line (empty for glyphs without contours)
+		'''
+		from typerig.brain import CurveBatch
+		batches, owners, stems = [], [], {}
+
+		for glyph in (glyphs if glyphs is not None else self.pGlyphs()):
+			stems[glyph.name] = []
+
+			for contour in glyph.getContourBounds(layer):
+				batches.append(contour.batch)
+				owners += [glyph.name]*len(contour.batch)
+
+		if len(owners):
+			probe = ((0, position), (1, position)) if vertical else ((position, 0), (position, 1))
+			stems.update(CurveBatch.concat(batches).getStems(probe[0], probe[1], owners))
+
+		return stems
+
 	# - Font metrics -----------------------------------------------
 	def getItalicAngle(self):
 		return self.fl.italicAngle_value
@@ -1922,9 +2362,22 @@ class pFont(object):
 			flObject (flGlyph, flLayer, flShape, flNode, flContour): Object to be update and set undo state
 			undoMessage (string): Message to be added in undo/history list.
 		'''
+		if pEditBatch.active is not None: # Sent once when the batch closes
+			pEditBatch.active.addFont(self, flObject)
+			return
+
 		fl6.flItems.notifyChangesApplied(undoMessage, flObject, True)
 		if verbose: print 'DONE:\t %s' %undoMessage
 
+	def batch_edit(self, undoMessage='TypeRig', verbose=True):
+		'''Transaction deferring the update notifications of all glyphs and the font to its end - see pEditBatch.
+		Args:
+			undoMessage (string): Message of the undo/history items
+		Returns:
+			pEditBatch: Context manager (with font.batch_edit('Message'): ...)
+		'''
+		return pEditBatch(undoMessage, verbose)
+
 	def update(self):
 		self.updateObject(self.fl, verbose=False)
 
@@ -2294,6 +2747,7 @@ class pKerning(object):
 
 		self.__kern_group_type = {'L':'KernLeft', 'R':'KernRight', 'B': 'KernBothSide'}
 		self.__kern_pair_mode = ('glyphMode', 'groupMode')
+		self.__group_index = None # Persistent group index, see _groupIndex()
 		
 		#self.groups = self.groups()
 		
@@ -2310,6 +2764,7 @@ class pKerning(object):
 	def setExternalGroupData(self, externalGroupData):
 		self.external_groups = externalGroupData
 		self.useExternalGroupData = True	
+		self.__group_index = None
 
 	def storeExternalGroupData(self):
 		for key, value in self.useExternalGroupData.iteritems():
@@ -2318,6 +2773,7 @@ class pKerning(object):
 	def resetGroups(self):
 		# - Delete all group kerning at given layer
 		self.groups().clear()	
+		self.__group_index = None
 
 	def asDict(self):
 		return self.fg.asDict()
@@ -2334,14 +2790,43 @@ class pKerning(object):
 		else:
 			return self.external_groups
 
-	def groupsBiDict(self):
+	def _groupIndex(self, rebuild=False):
+		'''Persistent group index with O(1) reverse (glyph name to group) lookups.
+		Built once and kept in sync by the group editing methods of this object. Must not be modified by callers.
+		'''
 		from typerig.brain import extBiDict
-		temp_data = {}
 
-		for key, value in self.groupsAsDict().iteritems():
-			temp_data.setdefault(value[1], {}).update({key : value[0]})
+		if self.__group_index is None or rebuild:
+			self.__group_index = {group_type:extBiDict() for group_type in self.__kern_group_type.values()}
+
+			for key, value in self.groupsAsDict().items():
+				self.__group_index.setdefault(value[1], extBiDict())[key] = value[0]
+
+		return self.__group_index
+
+	def groupsBiDict(self, rebuild=False):
+		'''Groups by type with O(1) reverse (glyph name to group) lookups. 
+		Returns a copy of the persistent group index - changing it does not change the groups or the index.
+		Use rebuild=True after the groups were changed elsewhere (ex. Fontlab UI or the fgKerningGroups object directly).
 
-		return {key:extBiDict(value) for key, value in temp_data.iteritems()}
+		Returns:
+			dict{group type (str): brain.extBiDict{group name: list(glyph names)}}: All three group types are present
+		'''
+		from typerig.brain import extBiDict
+		return {group_type:extBiDict(group_data) for group_type, group_data in self._groupIndex(rebuild).items()}
+
+	def getGroupFor(self, glyphName, side='L'):
+		'''Find the group of a glyph at given kerning side.
+		Args:
+			glyphName (string): Glyph name
+			side (string): L - Left (1st), R - Right (2nd). Both side groups are used when there is no single side group.
+		
+		Returns:
+			string or None: Group name
+		'''
+		group_index = self._groupIndex()
+		group_type = self.__kern_group_type[side.upper()]
+		return group_index[group_type].getKey(glyphName, group_index['KernBothSide'].getKey(glyphName))
 
 	def groupsFromDict(self, groupDict):
 		# - Build Group kerning from dictionary
@@ -2350,14 +2835,25 @@ class pKerning(object):
 		for key, value in groupDict.iteritems():
 			kerning_groups[key] = value
 
+		self.__group_index = None
+
 	def removeGroup(self, key):
 		'''Remove a group from fonts kerning groups at given layer.'''
 		del self.groups()[key]
 
+		if self.__group_index is not None:
+			for group_data in self.__group_index.values():
+				group_data.pop(key, None)
+
 	def renameGroup(self, oldkey, newkey):
 		'''Rename a group in fonts kerning groups at given layer.'''
 		self.groups().rename(oldkey, newkey)
 
+		if self.__group_index is not None:
+			for group_data in self.__group_index.values():
+				if oldkey in group_data:
+					group_data[newkey] = group_data.pop(oldkey)
+
 	def addGroup(self, key, glyphNameList, type):
 		'''Adds a new group to fonts kerning groups.
 		Args:
@@ -2371,30 +2867,17 @@ class pKerning(object):
 		'''
 		self.groups()[key] = (glyphNameList, self.__kern_group_type[type.upper()])
 
-	def getPairObject(self, pairTuple):
-		left, right = pairTuple
-		modeLeft, modeRight = 0, 0
-		groupsBiDict = self.groupsBiDict()
-		
-		if len(groupsBiDict.keys()):
-			if groupsBiDict['KernLeft'].inverse.has_key(left):
-				left = groupsBiDict['KernLeft'].inverse[left]
-				modeLeft = 1
-
-			elif groupsBiDict['KernBothSide'].inverse.has_key(left):
-				left = groupsBiDict['KernBothSide'].inverse[left]
-				modeLeft = 1
+		if self.__group_index is not None:
+			for group_data in self.__group_index.values():
+				group_data.pop(key, None)
 
-			if groupsBiDict['KernRight'].inverse.has_key(right):
-				right = groupsBiDict['KernRight'].inverse[right]
-				modeRight = 1
-
-			elif groupsBiDict['KernBothSide'].inverse.has_key(right):
-				right = groupsBiDict['KernBothSide'].inverse[right]
-				modeRight = 1
+			self.__group_index[self.__kern_group_type[type.upper()]][key] = glyphNameList
 
+	def getPairObject(self, pairTuple):
+		left, right = pairTuple
+		groupLeft, groupRight = self.getGroupFor(left, 'L'), self.getGroupFor(right, 'R')
 		
-		return self.newPair(left[0], right[0], modeLeft, modeRight)
+		return self.newPair(left if groupLeft is None else groupLeft, right if groupRight is None else groupRight, int(groupLeft is not None), int(groupRight is not None))
 
 	def getPair(self, pairTuple):
 		pairObject = self.getPairObject(pairTuple)
@@ -10,11 +10,17 @@
 
 # Note: Revisit as most of these are redundant as they were needed for FDK5, some are even from Python 2.4 times
 
-__version__ = '0.2.3'
+__version__ = '0.9.1'
 
 # - Dependencies -------------------------
+import os
+import re
 import json
-import json.scanner
+import marshal
+import hashlib
+import tempfile
+import traceback
+from time import time
 from collections import defaultdict
 
 # - Classes -------------------------------------------------------
@@ -22,7 +28,7 @@ from collections import defaultdict
 # --- VFJ Font helper classes
 class jsontree(defaultdict):
 	'''
-	Default dictionary where keys can be accessed as attributes
+	Default dictionary where keys can be accessed as attributes. Legacy: missing keys are created on read - see jsonnode.
 	----
 	Adapted from JsonTree by Doug Napoleone: https://github.com/dougn/jsontree
 	'''
@@ -43,27 +49,151 @@ class jsontree(defaultdict):
 	  return str(self.keys())
 
 
+class jsonnode(dict):
+	'''
+	Read mostly dictionary where keys can be accessed as attributes - the VFJ tree node produced by vfj_decoder.
+	Compared to jsontree: no default factory and no instance dictionary (same size as a dict), 
+	methods and stored keys are found without Python level exception handling and reads never create keys -
+	missing keys raise AttributeError/KeyError. Missing nodes are created explicitly with branch() or setdefault().
+
+	Constructor:
+		jsonnode(dict or pairs or **keys)
+
+	Example:
+		>>> font = json.load(vfj_file, cls=vfj_decoder)
+		>>> font.font.glyphs[0].name
+		>>> font.branch('font', 'lib').note = 'Checked'
+	'''
+	__slots__ = ()
+
+	def __getattr__(self, name):
+		# - Called only if name is not an attribute (method) of the dictionary
+		if name in self:
+			return self[name]
+
+		raise AttributeError(name)
+
+	__setattr__ = dict.__setitem__
+	__delattr__ = dict.__delitem__
+
+	def __repr__(self):
+		return '<%s: %s>' %(self.__class__.__name__, self.keys())
+
+	def branch(self, *keys):
+		'''Returns the node at the path of [keys], creating missing nodes on the way'''
+		node = self
+
+		for key in keys:
+			if key not in node:
+				node[key] = jsonnode()
+
+			node = node[key]
+
+		return node
+
+
+class jsonview(object):
+	'''
+	Lazy attribute access wrapper over plain decoded JSON (dicts and lists) - an alternative to the eager jsonnode conversion.
+	Nested containers are wrapped only when accessed and the data itself is never copied: writes go straight to the underlying data.
+	Missing keys raise AttributeError/KeyError.
+	
+	Constructor:
+		jsonview(dict or list)
+
+	Example:
+		>>> font = jsonview(json.load(vfj_file))
+		>>> font.font.glyphs[0].name
+	'''
+	__slots__ = ('_data',)
+
+	def __init__(self, data):
+		object.__setattr__(self, '_data', data)
+
+	@staticmethod
+	def _wrap(value):
+		return jsonview(value) if isinstance(value, (dict, list)) else value
+
+	@staticmethod
+	def _unwrap(value):
+		return value._data if isinstance(value, jsonview) else value
+
+	def __getattr__(self, name):
+		try:
+			return self._wrap(self._data[name])
+		except (KeyError, TypeError):
+			raise AttributeError(name)
+
+	def __setattr__(self, name, value):
+		self._data[name] = self._unwrap(value)
+
+	def __getitem__(self, key):
+		return self._wrap(self._data[key])
+
+	def __setitem__(self, key, value):
+		self._data[key] = self._unwrap(value)
+
+	def __delitem__(self, key):
+		del self._data[key]
+
+	def __len__(self):
+		return len(self._data)
+
+	def __contains__(self, item):
+		return self._unwrap(item) in self._data
+
+	def __iter__(self):
+		if isinstance(self._data, dict):
+			return iter(self._data)
+
+		return (self._wrap(item) for item in self._data)
+
+	def __eq__(self, other):
+		return self._data == self._unwrap(other)
+
+	def __ne__(self, other):
+		return not self == other
+
+	def __repr__(self):
+		return '<%s: %s>' %(self.__class__.__name__, list(self._data.keys()) if isinstance(self._data, dict) else 'list[%s]' %len(self._data))
+
+	def keys(self):
+		return self._data.keys()
+
+	def values(self):
+		return [self._wrap(value) for value in self._data.values()]
+
+	def items(self):
+		return [(key, self._wrap(value)) for key, value in self._data.items()]
+
+	def get(self, key, default=None):
+		return self._wrap(self._data.get(key, default))
+
+	def append(self, value):
+		self._data.append(self._unwrap(value))
+
+	def unwrap(self):
+		'''Returns the underlying plain data'''
+		return self._data
+
+
 class vfj_decoder(json.JSONDecoder):
 	'''
-	VFJ (JSON) decoder class for deserializing to a jsontree object structure.
+	VFJ (JSON) decoder class for deserializing to a jsonnode object structure.
+	Objects are converted by an object_hook, so the fast (C) scanner of the json module is used.
 	----
 	Parts adapted from JsonTree by Doug Napoleone: https://github.com/dougn/jsontree
 	'''
 	def __init__(self, *args, **kwdargs):
+		if 'object_pairs_hook' not in kwdargs:
+			kwdargs.setdefault('object_hook', jsonnode)
+
 		super(vfj_decoder, self).__init__(*args, **kwdargs)
-		self.__parse_object = self.parse_object
-		self.parse_object = self._parse_object
-		self.scan_once = json.scanner.py_make_scanner(self)
-		self.__jsontreecls = jsontree
-	
-	def _parse_object(self, *args, **kwdargs):
-		result = self.__parse_object(*args, **kwdargs)
-		return self.__jsontreecls(result[0]), result[1]
 
 
 class vfj_encoder(json.JSONEncoder):
 	'''
-	VFJ (JSON) encoder class that serializes out jsontree object structures.
+	VFJ (JSON) encoder class that serializes out jsonnode, jsontree and jsonview object structures.
 	----
 	Parts adapted from JsonTree by Doug Napoleone: https://github.com/dougn/jsontree
 	'''
@@ -71,9 +201,935 @@ class vfj_encoder(json.JSONEncoder):
 		super(vfj_encoder, self).__init__(*args, **kwdargs)
 	
 	def default(self, obj):
+		if isinstance(obj, jsonview):
+			return obj.unwrap()
+
 		return super(vfj_encoder, self).default(obj)
 
+class vfj_reader(object):
+	'''
+	Streaming VFJ reader: walks the file with an incremental tokenizer and decodes one item (glyph, master, class...) at a time
+	with the fast (C) scanner of the json module. Parts of the file that are not requested are skipped item by item and discarded, 
+	so memory stays bounded by the largest item (ex. glyph), not by the file. Every query is a new pass over the file.
+
+	Constructor:
+		vfj_reader(vfj_file_path): Items are returned as lazy jsonview objects
+		vfj_reader(vfj_file_path, lazy=False, chunkSize=65536): Items are returned as jsonnode objects; Size of the file reads
+
+	Example:
+		>>> for glyph in vfj_reader('Font.vfj').glyphs(): print glyph.name
+	'''
+	sections = {'glyphs':('font', 'glyphs'), 'masters':('font', 'masters'), 'classes':('font', 'classes')}
+	__reSpace = re.compile(r'[\s,:]*')
+	__reDelimiter = re.compile(r'[\s,\]}]')
+
+	def __init__(self, file_path, lazy=True, chunkSize=65536):
+		self.path = file_path
+		self.lazy = lazy
+		self.chunkSize = chunkSize
+		self.__decoder = json.JSONDecoder() if lazy else vfj_decoder()
+
+	# - Tokenizer ------------------------------
+	def __open(self):
+		self.__file = open(self.path, 'rb') # Binary: positions are byte offsets in the file
+		self.__buffer, self.__pos, self.__eof = '', 0, False
+		self.__base = 0 # File offset of the buffer start
+
+	def __fill(self):
+		'''Append the next chunk to the buffer. Returns False at the end of the file.'''
+		if self.__eof: return False
+		chunk = self.__file.read(max(self.chunkSize, len(self.__buffer) - self.__pos)) # Grows with the value being read: linear time for big items
+
+		if not len(chunk):
+			self.__eof = True
+			return False
+
+		self.__buffer += chunk
+		return True
+
+	def __next(self):
+		'''Skip separators (whitespace, commas, colons) and return the next significant character or None at the end of the file'''
+		if self.__pos > self.chunkSize: # Drop consumed data
+			self.__base += self.__pos
+			self.__buffer, self.__pos = self.__buffer[self.__pos:], 0
+
+		while True:
+			self.__pos = self.__reSpace.match(self.__buffer, self.__pos).end()
+
+			if self.__pos < len(self.__buffer):
+				return self.__buffer[self.__pos]
+
+			if not self.__fill():
+				return None
+
+	def __value(self):
+		'''Decode the value at the current position (fast C scanner), reading as much of the file as needed'''
+		if self.__buffer[self.__pos] not in '{["': # A number could continue in the next chunk
+			while self.__reDelimiter.search(self.__buffer, self.__pos) is None and self.__fill():
+				pass
+
+		while True:
+			try:
+				obj, self.__pos = self.__decoder.raw_decode(self.__buffer, self.__pos)
+				return obj
+
+			except ValueError:
+				if not self.__fill(): raise # Incomplete value: read more and retry
+
+	def __skip(self):
+		'''Skip the value at the current position. Containers are skipped item by item, so memory is bounded by their largest item.'''
+		container = self.__next()
+
+		if container not in ('{', '['):
+			self.__value()
+			return
+
+		closing = '}' if container == '{' else ']'
+		self.__pos += 1
+
+		while True:
+			char = self.__next()
+
+			if char == closing:
+				self.__pos += 1
+				return
+
+			if char is None:
+				raise ValueError('Unexpected end of VFJ data: %s' %self.path)
+
+			self.__value() # Key or item
+			
+			if container == '{':
+				self.__next()
+				self.__value()
+
+	def __decode(self):
+		obj = self.__value()
+		return jsonview(obj) if self.lazy and isinstance(obj, (dict, list)) else obj
+
+	def __key(self):
+		return self.__value()
+
+	def __seek(self, path):
+		'''Position the tokenizer at the value found at [path] (sequence of keys and indices). Returns False if missing.'''
+		for step in path:
+			char = self.__next()
+
+			if char == '{':
+				self.__pos += 1
+
+				while self.__next() == '"':
+					if self.__key() == step:
+						break
+
+					self.__skip()
+				else:
+					return False
+
+			elif char == '[' and isinstance(step, int):
+				self.__pos += 1
+
+				for index in range(step):
+					if self.__next() in (']', None): return False
+					self.__skip()
+
+				if self.__next() in (']', None): return False
+			else:
+				return False
+
+		return self.__next() is not None
+
+	# - Queries --------------------------------
+	def read(self, *path):
+		'''Decode the value at [path] (ex. 'font', 'glyphs', 0). Raises KeyError if missing.'''
+		self.__open()
+
+		try:
+			if not self.__seek(path):
+				raise KeyError(path)
+
+			return self.__decode()
+		finally:
+			self.__file.close()
+
+	def locate(self, *path):
+		'''Returns tuple(start, end): the byte offsets of the value at [path] in the file (see readAt). Raises KeyError if missing.'''
+		self.__open()
+
+		try:
+			if not self.__seek(path):
+				raise KeyError(path)
+
+			start = self.__base + self.__pos
+			self.__skip()
+			return start, self.__base + self.__pos
+		finally:
+			self.__file.close()
+
+	def iterItems(self, *path):
+		'''Yield the items of the array (or the (key, value) pairs of the object) at [path] one at a time'''
+		for start, end, item in self.iterOffsets(*path):
+			yield item
+
+	def iterOffsets(self, *path):
+		'''Yield tuple(start, end, item) for the items of the array (or tuple(start, end, (key, value)) for the object) at [path],
+		where start and end are the byte offsets of the item (value) in the file - see readAt()
+		'''
+		self.__open()
+
+		try:
+			if not self.__seek(path):
+				return
+
+			container = self.__next()
+			self.__pos += 1
+
+			if container == '[':
+				while self.__next() not in (']', None):
+					start = self.__base + self.__pos
+					item = self.__decode()
+					yield start, self.__base + self.__pos, item
+
+			elif container == '{':
+				while self.__next() == '"':
+					key = self.__key()
+					self.__next()
+					start = self.__base + self.__pos
+					item = self.__decode()
+					yield start, self.__base + self.__pos, (key, item)
+		finally:
+			self.__file.close()
+
+	def readAt(self, start, end, source=None):
+		'''Decode a single value stored between the byte offsets [start] and [end] of the file (see iterOffsets).
+		Source: a file-like object (seek/read) or a mmap of the file to read from. If None the file is opened.
+		'''
+		if source is None:
+			with open(self.path, 'rb') as source:
+				source.seek(start)
+				data = source.read(end - start)
+		
+		elif hasattr(source, '__getitem__'): # mmap
+			data = source[start:end]
+		else:
+			source.seek(start)
+			data = source.read(end - start)
+
+		obj = self.__decoder.decode(data)
+		return jsonview(obj) if self.lazy and isinstance(obj, (dict, list)) else obj
+
+	def glyphs(self, names=None):
+		'''Yield the glyphs one at a time. Only the glyphs in [names] (if given) are returned.'''
+		for glyph in self.iterItems(*self.sections['glyphs']):
+			if names is None or glyph['name'] in names:
+				yield glyph
+
+	def masters(self):
+		'''Yield the font masters one at a time'''
+		return self.iterItems(*self.sections['masters'])
+
+	def classes(self):
+		'''Yield the font classes one at a time'''
+		return self.iterItems(*self.sections['classes'])
+
+	def kerning(self):
+		'''Yield tuple(master name, kerning) for every font master, one master at a time'''
+		for master in self.masters():
+			font_master = master['fontMaster']
+			yield font_master['name'], font_master['kerning'] if 'kerning' in font_master else None
+
+
+class vfj_index(object):
+	'''
+	Glyph index of a VFJ file: glyph names, unicodes and byte offsets, built in one streaming pass (vfj_reader) on first open.
+	The index is stored in a sidecar file (<vfj_file_path>.idx) keyed by the file size and modification time, 
+	so later opens only read the sidecar. Glyphs are decoded individually, only when accessed, and cached.
+
+	Constructor:
+		vfj_index(vfj_file_path): Glyphs are returned as lazy jsonview objects
+		vfj_index(vfj_file_path, lazy=False, useMmap=True, sidecar=True): jsonnode glyphs; Read through a memory map; Store the index
+
+	Example:
+		>>> index = vfj_index('Font.vfj')
+		>>> index.glyph('Aacute'), index.glyphsByUnicode(0xC1)
+	'''
+	indexVersion = 1
+
+	def __init__(self, file_path, lazy=True, useMmap=False, sidecar=True):
+		self.path = file_path
+		self.reader = vfj_reader(file_path, lazy)
+		self.sidecarPath = file_path + '.idx' if sidecar else None
+		self.useMmap = useMmap
+		self.__source = None
+		self.__cache = {}
+		
+		self.load()
+
+	def __len__(self):
+		return len(self.offsets)
+
+	def __contains__(self, glyphName):
+		return glyphName in self.offsets
+
+	def __repr__(self):
+		return '<%s: %s; Glyphs=%s>' %(self.__class__.__name__, self.path, len(self))
+
+	# - Index ----------------------------------
+	def _fileKey(self):
+		stat = os.stat(self.path)
+		return [stat.st_size, stat.st_mtime]
+
+	@staticmethod
+	def _glyphUnicodes(glyph):
+		'''Unicodes of a glyph as integers: VFJ stores them as a hex string ("0041" or "0041,0061") or a list'''
+		unicodes = glyph.get('unicodes', glyph.get('unicode', []))
+
+		if isinstance(unicodes, basestring):
+			unicodes = unicodes.replace(',', ' ').split()
+
+		elif not isinstance(unicodes, (list, tuple, jsonview)):
+			unicodes = [unicodes]
+
+		return [int(code, 16) if isinstance(code, basestring) else int(code) for code in unicodes]
+
+	def load(self):
+		'''Load the index from the sidecar if it matches the file, otherwise rebuild it'''
+		if self.sidecarPath is not None and os.path.exists(self.sidecarPath):
+			try:
+				with open(self.sidecarPath, 'r') as importFile:
+					stored = json.load(importFile)
+
+				if stored['version'] == self.indexVersion and stored['key'] == self._fileKey():
+					self._setIndex(stored['glyphs'])
+					return
+			except (ValueError, KeyError, IOError):
+				pass # Corrupted or foreign sidecar: rebuild
+
+		self.rebuild()
+
+	def rebuild(self):
+		'''Scan the file (streaming) and store the index in the sidecar'''
+		glyphs = [(glyph['name'], self._glyphUnicodes(glyph), start, end) for start, end, glyph in self.reader.iterOffsets(*self.reader.sections['glyphs'])]
+		self._setIndex(glyphs)
+		self._store()
+
+	def _store(self):
+		if self.sidecarPath is not None:
+			try:
+				with open(self.sidecarPath, 'w') as exportFile:
+					json.dump({'version':self.indexVersion, 'key':self._fileKey(), 'glyphs':self.entries}, exportFile)
+			except IOError:
+				pass # Read only location: keep the index in memory only
+
+	def _setIndex(self, glyphs, keepCache=False):
+		self.entries = [list(glyph) for glyph in glyphs]
+		self.names = [glyph[0] for glyph in glyphs]
+		self.offsets = {}
+		self.unicodes = {}
+		
+		if not keepCache:
+			self.__cache = {}
+
+		for name, unicodes, start, end in glyphs:
+			self.offsets[name] = (start, end)
+
+			for code in unicodes:
+				self.unicodes.setdefault(code, []).append(name)
+
+	def applySplice(self, changes):
+		'''Update the index after the file was rewritten by vfj_splice() - no rescan of the file. 
+		Changes: list of tuple(start, end, new length, glyph or None) sorted by start, where start and end are the old offsets 
+		of a replaced region. Glyph: the object written in place of an indexed glyph (its name and unicodes are refreshed).
+		'''
+		self.close()
+		glyphs, shift, position = [], 0, 0
+
+		for name, unicodes, start, end in self.entries: # In file order
+			while position < len(changes) and changes[position][1] <= start: # Regions before the glyph
+				shift += changes[position][2] - (changes[position][1] - changes[position][0])
+				position += 1
+
+			if position < len(changes) and changes[position][0] < end and changes[position][:2] != (start, end):
+				self.rebuild() # A replaced region holds or cuts into the glyph: offsets within it are unknown
+				return
+
+			if position < len(changes) and changes[position][:2] == (start, end):
+				glyph = changes[position][3]
+				newLength = changes[position][2]
+
+				if glyph is not None:
+					self.__cache.pop(name, None)
+					name, unicodes = glyph['name'], self._glyphUnicodes(glyph)
+					self.__cache[name] = glyph
+
+				glyphs.append((name, unicodes, start + shift, start + shift + newLength))
+			else:
+				glyphs.append((name, unicodes, start + shift, end + shift))
+
+		self._setIndex(glyphs, keepCache=True)
+		self._store()
+
+	# - Access ---------------------------------
+	def _source(self):
+		if self.useMmap and self.__source is None:
+			import mmap
+			self.__file = open(self.path, 'rb')
+			self.__source = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+
+		return self.__source
+
+	def close(self):
+		'''Release the memory map (if used)'''
+		if self.__source is not None:
+			self.__source.close()
+			self.__file.close()
+			self.__source = None
+
+	def glyph(self, glyphName):
+		'''Returns the glyph with given name, decoded on first access - O(1). Raises KeyError if missing.'''
+		if glyphName not in self.__cache:
+			start, end = self.offsets[glyphName]
+			self.__cache[glyphName] = self.reader.readAt(start, end, self._source())
+
+		return self.__cache[glyphName]
+
+	def glyphsByUnicode(self, code):
+		'''Returns the list of glyphs mapped to given unicode (int or hex string) - O(1)'''
+		code = int(code, 16) if isinstance(code, basestring) else code
+		return [self.glyph(name) for name in self.unicodes.get(code, [])]
+
+	def cached(self):
+		'''Returns dict{glyph name: glyph} of the glyphs decoded so far'''
+		return dict(self.__cache)
+
+
+class vfj_cache(object):
+	'''
+	Binary cache of decoded VFJ files: the plain data (dict, list...) is stored with marshal, which loads much faster than JSON text.
+	Entries are keyed by the source size, modification time and content hash (MD5): an entry is used while the size and time match,
+	or if only the time changed but the content is the same. The cache folder is bounded in size - least recently used entries are evicted.
+
+	Constructor:
+		vfj_cache(): Cache entries in a '.vfjcache' folder next to every VFJ file, up to 512 MB per folder
+		vfj_cache(folder, maxSize): Shared cache folder; Size limit in bytes
+
+	Example:
+		>>> cache = vfj_cache()
+		>>> data = cache.load('Font.vfj') # None if missing or stale
+		>>> if data is None: cache.store('Font.vfj', json.load(open('Font.vfj')))
+	'''
+	cacheVersion = 1
+	folderName = '.vfjcache'
+	extension = '.cache'
+
+	def __init__(self, folder=None, maxSize=512*1024*1024):
+		self.folder = folder
+		self.maxSize = maxSize
+
+	def __repr__(self):
+		return '<%s: %s; Max size=%s>' %(self.__class__.__name__, self.folder or self.folderName, self.maxSize)
+
+	# - Entries --------------------------------
+	def _folder(self, file_path):
+		return self.folder or os.path.join(os.path.dirname(os.path.abspath(file_path)), self.folderName)
+
+	def entryPath(self, file_path):
+		'''Path of the cache entry of the VFJ at [file_path]: file name and a hash of the full path (same names in a shared folder)'''
+		source = os.path.abspath(file_path)
+		key = hashlib.sha1(source.encode('utf-8') if isinstance(source, unicode) else source).hexdigest()[:12]
+		return os.path.join(self._folder(file_path), '%s.%s%s' %(os.path.basename(source), key, self.extension))
+
+	@staticmethod
+	def fileHash(file_path, chunkSize=1024*1024):
+		'''MD5 hex digest of the file content'''
+		digest = hashlib.md5()
+
+		with open(file_path, 'rb') as importFile:
+			for chunk in iter(lambda: importFile.read(chunkSize), ''):
+				digest.update(chunk)
+
+		return digest.hexdigest()
+
+	def entries(self, folder):
+		'''List of tuple(entry path, size, last use) in [folder], least recently used first'''
+		if not os.path.isdir(folder):
+			return []
+
+		entries = []
+
+		for name in os.listdir(folder):
+			if name.endswith(self.extension):
+				entry_path = os.path.join(folder, name)
+				stat = os.stat(entry_path)
+				entries.append((entry_path, stat.st_size, stat.st_mtime))
+
+		return sorted(entries, key=lambda entry: entry[2])
+
+	# - Cache ----------------------------------
+	def load(self, file_path):
+		'''Returns the cached data of the VFJ at [file_path] or None if there is no valid entry'''
+		entry_path = self.entryPath(file_path)
+
+		if not os.path.exists(entry_path):
+			return None
+
+		try:
+			with open(entry_path, 'rb') as cacheFile:
+				header = marshal.load(cacheFile)
+				stat = os.stat(file_path)
+
+				if header['version'] != self.cacheVersion or header['size'] != stat.st_size:
+					return None
+
+				if header['mtime'] != stat.st_mtime and header['hash'] != self.fileHash(file_path):
+					return None
+
+				data = marshal.load(cacheFile)
+
+		except (EOFError, ValueError, TypeError, KeyError, IOError, OSError):
+			return None # Corrupted, foreign or unreadable entry
+
+		os.utime(entry_path, None) # Last use
+		return data
+
+	def store(self, file_path, data):
+		'''Store the decoded [data] (plain JSON types or jsonview) of the VFJ at [file_path]. Returns True if stored.'''
+		data = data.unwrap() if isinstance(data, jsonview) else data
+		folder = self._folder(file_path)
+		stat = os.stat(file_path)
+		header = {'version':self.cacheVersion, 'size':stat.st_size, 'mtime':stat.st_mtime, 'hash':self.fileHash(file_path)}
+
+		try:
+			if not os.path.isdir(folder):
+				os.makedirs(folder)
+
+			_writeAtomic(self.entryPath(file_path), lambda cacheFile: (marshal.dump(header, cacheFile, 2), marshal.dump(data, cacheFile, 2)))
+
+		except (IOError, OSError):
+			return False # Read only location
+
+		self.evict(folder)
+		return True
+
+	def invalidate(self, file_path):
+		'''Remove the cache entry of the VFJ at [file_path]. Returns True if there was one.'''
+		entry_path = self.entryPath(file_path)
+
+		if os.path.exists(entry_path):
+			os.remove(entry_path)
+			return True
+
+		return False
+
+	def evict(self, folder):
+		'''Remove the least recently used entries in [folder] until it fits in the size limit. The last used entry is always kept.'''
+		entries = self.entries(folder)
+		total = sum(entry[1] for entry in entries)
+
+		for entry_path, size, last_use in entries[:-1]:
+			if total <= self.maxSize: break
+			os.remove(entry_path)
+			total -= size
+
+	def clear(self, folder):
+		'''Remove all entries in [folder]'''
+		for entry_path, size, last_use in self.entries(folder):
+			os.remove(entry_path)
+
+
+# --- VFJ Font
+class jFont(object):
+	'''
+	Proxy VFJ Font (Fontlab JSON Font format)
+
+	Constructor:
+		jFont(): Construct an empty jFont
+		jFont(vfj_file_path): Load VFJ form vfj_file_path (STR)
+		jFont(pFont): Load VFJ from pFont.path. VFJ Font has to be in the same path as the VFC
+		jFont(..., lazy=True): Load as plain JSON wrapped in a lazy jsonview instead of a jsonnode tree (faster, less memory)
+		jFont(..., stream=True): Do not load, only set the path - use .stream() to read glyphs, masters or classes one at a time
+		jFont(..., indexed=True): Do not load, index the glyphs instead (utils.vfj_index, stored in a sidecar file): glyphs are decoded on access
+		jFont(..., indexed=True, useMmap=True): Indexed, glyphs are read trough a memory map of the file
+		jFont(..., lazy=True, cache=True): Lazy load through a binary cache (utils.vfj_cache) next to the VFJ, or through given vfj_cache object
+
+	Methods:
+		.data(): Access to VFJ font
+		.load(file_path, lazy=False): Load VFJ font from path
+		.invalidate_cache(): Remove the cache entry of the VFJ
+		.stream(file_path=None): Streaming reader (utils.vfj_reader) over the VFJ - constant memory scans
+		.glyph(glyph_name): Glyph by name - O(1)
+		.glyphs_by_unicode(unicode): List of glyphs by unicode (int or hex string) - O(1)
+		.section(*path): Value at path (ex. 'font', 'masters', 0) - from the loaded data or decoded from the file (indexed/stream)
+		.touch(glyph_name): Mark glyph as changed - by its name in the file (as loaded or last saved), so renamed glyphs are touched by their old name
+		.touch_section(*path): Mark the value at path as changed (ex. 'font', 'masters', 1, 'fontMaster', 'kerning')
+		.dirty(): Changed glyph names and section paths
+		.save_as(file_path, compact=False, incremental=True): Save VFJ font to path
+		.save(compact=False, incremental=True): Save VFJ (overwrite)
+
+	Saving:
+		Incremental: if only touched glyphs and sections changed, they are encoded and spliced into a copy of the original file 
+		(utils.vfj_splice), the rest is copied byte for byte. Indexed fonts (not loaded) can only be saved this way.
+		Full: the whole data is encoded in chunks (utils.vfj_write). Used for loaded fonts with nothing touched (changes are not known), 
+		new glyphs or sections, or if the file was changed by someone else since it was loaded.
+		Both write to a temporary file that replaces the target only when complete. Compact: no whitespace after separators.
+	'''
+
+	def __init__(self, source=None, lazy=False, stream=False, indexed=False, useMmap=False, cache=None):
+		# - Init
+		self.data = None
+		self.source = None
+		self.path = None
+		self.lazy = lazy
+		self.index = None
+		self.cache = vfj_cache() if cache is True else cache
+		self.__glyph_names = None
+		self.__file_glyphs = {}
+		self.__sections = {}
+		self.__dirty_glyphs = {}
+		self.__dirty_sections = {}
+		self.__file_key = None
+
+		if source is not None:
+			if isinstance(source, basestring):
+				self.path = source
+
+			elif hasattr(source, 'path'): # pFont
+				self.path = source.path.replace('vfc', 'vfj')
+			
+			if indexed:
+				self.index = vfj_index(self.path, lazy, useMmap)
+				self.__file_key = self.__fileKey()
+
+			elif not stream:
+				self.load(self.path, lazy)
+
+	def load(self, file_path, lazy=False):
+		if lazy and self.cache is not None: # The tree (lazy=False) is built by the decoder hook: faster from text than from the cache
+			data = self.cache.load(file_path)
+
+			if data is None:
+				with open(file_path, 'r') as importFile:
+					data = json.load(importFile)
+
+				self.cache.store(file_path, data)
+
+			self.data = jsonview(data)
+
+		else:
+			with open(file_path, 'r') as importFile:
+				if lazy:
+					self.data = jsonview(json.load(importFile))
+				else:
+					self.data = json.load(importFile, cls=vfj_decoder)
+		
+		self.path = file_path
+		self.lazy = lazy
+		self.index = self.__glyph_names = None
+		self.__sections, self.__dirty_glyphs, self.__dirty_sections = {}, {}, {}
+		self.__file_key = self.__fileKey()
+		self.__snapshotNames()
+		return True
+
+	def invalidate_cache(self):
+		return self.cache is not None and self.path is not None and self.cache.invalidate(self.path)
+
+	def stream(self, file_path=None):
+		return vfj_reader(file_path if file_path is not None else self.path, lazy=self.lazy)
+
+	# - Glyphs ------------------------------
+	def __glyph_index(self):
+		# - Name and unicode maps over the loaded data, built on first use
+		if self.__glyph_names is None:
+			self.__glyph_names, self.__glyph_unicodes = {}, {}
+
+			for glyph in self.data['font']['glyphs']:
+				self.__glyph_names[glyph['name']] = glyph
+
+				for code in vfj_index._glyphUnicodes(glyph):
+					self.__glyph_unicodes.setdefault(code, []).append(glyph)
+
+		return self.__glyph_names, self.__glyph_unicodes
+
+	def __snapshotNames(self):
+		# - Glyph names as in the file, taken whenever data and file match: touch() resolves through them, so renamed glyphs are spliced at their old place
+		self.__file_glyphs = {glyph['name']:glyph for glyph in self.data['font']['glyphs']} if self.data is not None else {}
+
+	def glyph(self, glyph_name):
+		if self.index is not None:
+			return self.index.glyph(glyph_name)
+
+		return self.__glyph_index()[0][glyph_name]
+
+	def glyphs_by_unicode(self, unicode):
+		if self.index is not None:
+			return self.index.glyphsByUnicode(unicode)
+
+		unicode = int(unicode, 16) if isinstance(unicode, basestring) else unicode
+		return list(self.__glyph_index()[1].get(unicode, []))
+
+	# - Changes -----------------------------
+	def section(self, *path):
+		if self.data is not None:
+			value = self.data
+
+			for step in path:
+				value = value[step]
+
+			return value
+
+		if path not in self.__sections:
+			self.__sections[path] = self.stream().read(*path)
+
+		return self.__sections[path]
+
+	def touch(self, glyph_name):
+		# - Keyed by the name in the file (renamed glyphs are touched by their old name), new glyphs by their current name
+		glyph = self.__file_glyphs.get(glyph_name)
+		self.__dirty_glyphs.setdefault(glyph_name, glyph if glyph is not None else self.glyph(glyph_name))
+
+	def touch_section(self, *path):
+		self.__dirty_sections[path] = self.section(*path)
+
+	def dirty(self):
+		return sorted(self.__dirty_glyphs.keys()), sorted(self.__dirty_sections.keys())
+
+	# - IO ------------------------------------
+	def __fileKey(self):
+		stat = os.stat(self.path)
+		return [stat.st_size, stat.st_mtime]
+
+	def __changes(self, compact):
+		# - Regions of the file to replace: list of (start, end, data, glyph or None), or None if an incremental save is not possible
+		if self.path is None or not os.path.exists(self.path) or self.__fileKey() != self.__file_key:
+			return None # Nothing to splice into or changed on disk
+
+		if self.data is not None and not (self.__dirty_glyphs or self.__dirty_sections):
+			return None # Untracked changes
+
+		regions = []
+
+		try:
+			if len(self.__dirty_glyphs):
+				offsets = (self.index or vfj_index(self.path, self.lazy)).offsets
+
+				for glyph_name, glyph in self.__dirty_glyphs.items():
+					regions.append(offsets[glyph_name] + (glyph, True))
+
+			reader = vfj_reader(self.path)
+
+			for path, value in self.__dirty_sections.items():
+				regions.append(reader.locate(*path) + (value, False))
+
+		except KeyError:
+			return None # New glyph or section
+
+		changes = []
+
+		for start, end, value, is_glyph in sorted(regions, key=lambda region: (region[0], -region[1])):
+			if len(changes) and start < changes[-1][1]:
+				if self.data is None:
+					return None # Nested regions are decoded separately: neither is up to date
+
+				continue # Encoded with the loaded data of the enclosing region
+
+			changes.append((start, end, vfj_dumps(value, compact), value if is_glyph else None))
+
+		return changes
+
+	def save_as(self, file_path, compact=False, incremental=True):
+		if self.data is None and self.index is None:
+			print 'ERROR:\t VFJ Font: %s; Nothing to save, font data is not loaded!' %self.path
+			return False
+
+		same_file = self.path is not None and os.path.abspath(file_path) == os.path.abspath(self.path)
+		changes = self.__changes(compact) if incremental else None
+
+		if changes == [] and same_file:
+			return True # Nothing changed
+
+		if self.index is not None:
+			self.index.close() # Release the memory map before the file is replaced
+
+		if changes is not None:
+			vfj_splice(self.path, file_path, [change[:3] for change in changes])
+
+		elif self.data is not None:
+			vfj_write(self.data, file_path, compact)
+
+		else:
+			print 'ERROR:\t VFJ Font: %s; Changes can not be saved incrementally, font data is not loaded!' %self.path
+			return False
+
+		if same_file:
+			if self.index is not None:
+				self.index.applySplice([(start, end, len(data), glyph) for start, end, data, glyph in changes])
+
+			self.__dirty_glyphs, self.__dirty_sections = {}, {}
+			self.__file_key = self.__fileKey()
+			self.__snapshotNames()
+			self.invalidate_cache()
+
+		return True
+
+	def save(self, compact=False, incremental=True):
+		return self.save_as(self.path, compact, incremental)
+
+
 # - Functions ----------------------------------------------
+# -- VFJ Font: Writing --------------------------------------
+def _tempFor(file_path):
+	'''Temporary file next to [file_path] (same file system, so it can be renamed over it). Returns tuple(file object, path).'''
+	folder, name = os.path.split(os.path.abspath(file_path))
+	handle, temp_path = tempfile.mkstemp(prefix='.%s.' %name, suffix='.tmp', dir=folder)
+	return os.fdopen(handle, 'wb'), temp_path
+
+def _umask():
+	'''Current process umask (it can only be read by setting it)'''
+	mask = os.umask(0)
+	os.umask(mask)
+	return mask
+
+def _replaceFile(temp_path, file_path):
+	'''Move [temp_path] over [file_path]: atomic on POSIX, Windows can not rename over an existing file'''
+	if os.name == 'nt' and os.path.exists(file_path):
+		os.remove(file_path)
+
+	os.rename(temp_path, file_path)
+
+def _writeAtomic(file_path, writer):
+	'''Call writer(file object) on a temporary file and move it over [file_path] only if it succeeds'''
+	exportFile, temp_path = _tempFor(file_path)
+
+	try:
+		with exportFile:
+			writer(exportFile)
+
+		if os.path.exists(file_path):
+			os.chmod(temp_path, os.stat(file_path).st_mode) # Keep the permissions of the replaced file
+		else:
+			os.chmod(temp_path, 0o666 & ~_umask()) # As open() would create it: mkstemp makes it private (0600)
+
+		_replaceFile(temp_path, file_path)
+	except:
+		if os.path.exists(temp_path):
+			os.remove(temp_path)
+		raise
+
+def vfj_dumps(obj, compact=False):
+	'''Encode a single VFJ value (glyph, section...). Compact: no whitespace after the separators.'''
+	return json.dumps(obj, cls=vfj_encoder, separators=(',', ':') if compact else None)
+
+def vfj_write(data, file_path, compact=False, chunkSize=65536):
+	'''Write VFJ [data] to [file_path] through a temporary file that replaces the target when complete.
+	The encoder output is collected and written in blocks of about [chunkSize] bytes, so the file text is never held in memory.
+	Compact: no whitespace after the separators (smaller file, faster write).
+	'''
+	encoder = vfj_encoder(separators=(',', ':') if compact else None)
+
+	def writer(exportFile):
+		block, blockSize = [], 0
+
+		for chunk in encoder.iterencode(data):
+			block.append(chunk)
+			blockSize += len(chunk)
+
+			if blockSize >= chunkSize:
+				exportFile.write(''.join(block))
+				block, blockSize = [], 0
+
+		exportFile.write(''.join(block))
+
+	_writeAtomic(file_path, writer)
+
+def vfj_splice(source_path, file_path, changes, chunkSize=65536):
+	'''Write [file_path] as a copy of the VFJ file at [source_path] where byte regions are replaced - the rest is copied as is,
+	without decoding or encoding. Written through a temporary file, so [file_path] can be [source_path].
+	Changes: list of tuple(start, end, data) - the region between the byte offsets [start] and [end] of the source 
+	(see vfj_reader.locate, vfj_reader.iterOffsets) is replaced by the string [data]. Regions must not overlap.
+	'''
+	def copy(sourceFile, exportFile, size):
+		while size > 0:
+			chunk = sourceFile.read(min(chunkSize, size))
+			if not len(chunk): break
+			exportFile.write(chunk)
+			size -= len(chunk)
+
+	def writer(exportFile):
+		with open(source_path, 'rb') as sourceFile:
+			position = 0
+
+			for start, end, data in sorted(changes, key=lambda change: change[0]):
+				if start < position:
+					raise ValueError('Overlapping VFJ regions: %s' %((start, end),))
+
+				copy(sourceFile, exportFile, start - position)
+				exportFile.write(data)
+				sourceFile.seek(end)
+				position = end
+
+			copy(sourceFile, exportFile, float('inf'))
+
+	_writeAtomic(file_path, writer)
+
+# -- VFJ Font: Batch processing ----------------------------
+def _vfj_batchTask(task):
+	'''Worker: run the job over one font. Module level, so it can be sent to worker processes.'''
+	file_path, job, save, compact, options = task
+	result = {'path':file_path, 'result':None, 'saved':False, 'error':None, 'time':0.}
+	start = time()
+
+	try:
+		font = jFont(file_path, **options)
+		result['result'] = job(font)
+
+		if save or (save is None and any(font.dirty())):
+			result['saved'] = font.save(compact)
+
+	except Exception:
+		result['error'] = traceback.format_exc()
+
+	result['time'] = time() - start
+	return result
+
+def vfj_batch(file_paths, job, processes=None, maxTasks=1, save=None, compact=False, **options):
+	'''Run [job] over every VFJ font in [file_paths] using a pool of worker processes.
+	
+	Arguments:
+		file_paths (list(str)): VFJ files
+		job (function): Called as job(jFont) for every font - should return picklable data. Must be a module level function.
+		processes (int): Worker processes - default: one per CPU core. 1: run in this process (ex. within Fontlab).
+		maxTasks (int): Fonts processed by a worker before it is replaced by a new one - bounds worker memory
+		save (bool or None): Save the fonts after the job: None - only fonts with touched glyphs or sections (see jFont.touch), 
+			True - all fonts (incremental if touched, otherwise full), False - never. Saved through a temporary file that replaces the font.
+		compact (bool): Save with compact separators
+		options: jFont constructor options for every font (ex. lazy=True, indexed=True)
+
+	Returns:
+		list(dict): One result per font in the order of [file_paths]: {'path', 'result' - returned by job, 'saved', 'error' - traceback or None, 'time'}
+
+	Example:
+		>>> def count(font): return len(font.data.font.glyphs)
+		>>> if __name__ == '__main__': print vfj_batch(['Light.vfj', 'Bold.vfj'], count, lazy=True)
+	'''
+	tasks = [(file_path, job, save, compact, options) for file_path in file_paths]
+
+	if processes == 1 or len(tasks) < 2:
+		return [_vfj_batchTask(task) for task in tasks]
+
+	import multiprocessing
+	pool = multiprocessing.Pool(processes, maxtasksperchild=maxTasks)
+
+	try:
+		results = pool.map(_vfj_batchTask, tasks, chunksize=1)
+		pool.close()
+	except:
+		pool.terminate()
+		raise
+	finally:
+		pool.join()
+
+	return results
+
 # -- Units -------------------------------------------------
 def point2pixel(points):
 	return points*1.333333
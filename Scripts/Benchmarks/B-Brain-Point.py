@@ -0,0 +1,77 @@
+#FLM: Benchmark: Brain Point (TypeRig)
+# ----------------------------------------
+# (C) Vassil Kateliev, 2018 (http://www.kateliev.com)
+# (C) Karandash Type Foundry (http://www.karandash.eu)
+#-----------------------------------------
+# www.typerig.com
+
+# No warranties. By using this you agree
+# that you use it at your own risk!
+
+# Note: Compares the slotted brain._Point/Coord against the legacy (dict based, eager angle and transform) point.
+# Runs within Fontlab or any Python 2.7 interpreter where TypeRig is installed.
+
+# - Dependencies -----------------
+import gc
+from timeit import timeit
+
+from typerig.brain import _Point, Coord, transform
+
+# - Init --------------------------------
+app_name, app_version = 'Benchmark | Point', '0.01'
+iterations = 100000
+
+# - Reference: legacy point -----------------
+class legacyPoint(object):
+	def __init__(self, *argv):
+		multiCheck = lambda t, type: all([isinstance(i, type) for i in t])
+
+		if multiCheck(argv, float) or multiCheck(argv, int):
+			self.x, self.y = argv[0], argv[1]
+
+		if multiCheck(argv, tuple) or multiCheck(argv, list):
+			self.x, self.y = argv[0]
+
+		self.angle = 0
+		self.transform = transform()
+
+	def __add__(self, other):
+		if isinstance(other, self.__class__):
+			return self.__class__(self.x + other.x, self.y + other.y)
+
+		elif isinstance(other, int) or isinstance(other, float):
+			return self.__class__(self.x + other, self.y + other)
+
+	def __mul__(self, other):
+		if isinstance(other, int) or isinstance(other, float):
+			return self.__class__(self.x * other, self.y * other)
+
+# - Helpers -----------------------------
+def countAllocations(operation, count=1000):
+	'''Number of GC tracked objects that remain alive per single operation'''
+	gc.collect()
+	gc.disable()
+	before = len(gc.get_objects())
+	keep = [operation() for i in range(count)]
+	after = len(gc.get_objects())
+	gc.enable()
+	return float(after - before - 1)/count # -1 for the list holding the results
+
+def benchmark(pointClass):
+	a, b = pointClass(10., 20.), pointClass(30., 40.)
+	operations = [	('new', lambda: pointClass(10., 20.)), 
+					('point + point', lambda: a + b), 
+					('point + scalar', lambda: a + 5.),
+					('point * scalar', lambda: a * 2.)]
+
+	print '\n%s' %pointClass.__name__
+
+	for name, operation in operations:
+		time_per_op = timeit(operation, number=iterations)/iterations*1e6
+		print '{:<16} {:>8.3f} us/op {:>6.2f} objects/op'.format(name, time_per_op, countAllocations(operation))
+
+# - Run ---------------------------------
+print '%s %s: %s iterations' %(app_name, app_version, iterations)
+
+for pointClass in (legacyPoint, _Point, Coord):
+	benchmark(pointClass)
@@ -0,0 +1,133 @@
+#FLM: Benchmark: VFJ Load (TypeRig)
+# ----------------------------------------
+# (C) Vassil Kateliev, 2018 (http://www.kateliev.com)
+# (C) Karandash Type Foundry (http://www.karandash.eu)
+#-----------------------------------------
+# www.typerig.com
+
+# No warranties. By using this you agree
+# that you use it at your own risk!
+
+# Note: Compares load time and peak memory of the VFJ decoding modes:
+# legacy (pure Python scanner + jsontree), tree (C scanner + jsonnode), lazy (C scanner + jsonview), plain json
+# stream (vfj_reader: all glyphs read one at a time) and cache (vfj_cache: plain data from the binary cache, primed before the run).
+# Every mode runs in its own process, so peak memory (max RSS) is measured per mode (Unix only).
+# Runs within any Python 2.7 interpreter where TypeRig is installed:
+#	python B-VFJ-Load.py <path/to/font.vfj>
+#	python B-VFJ-Load.py --synthetic <glyph count>
+
+# - Dependencies -----------------
+import os
+import sys
+import json
+import json.scanner
+import subprocess
+import tempfile
+from time import time
+
+from typerig.utils import jsontree, jsonview, vfj_decoder, vfj_reader, vfj_cache
+
+# - Init --------------------------------
+app_name, app_version = 'Benchmark | VFJ Load', '0.03'
+modes = ('legacy', 'tree', 'lazy', 'plain', 'stream', 'cache')
+repeats = 3
+
+# - Reference: legacy decoder -----------------
+class legacy_decoder(json.JSONDecoder):
+	'''The former vfj_decoder: forces the pure Python scanner'''
+	def __init__(self, *args, **kwdargs):
+		super(legacy_decoder, self).__init__(*args, **kwdargs)
+		self.__parse_object = self.parse_object
+		self.parse_object = self._parse_object
+		self.scan_once = json.scanner.py_make_scanner(self)
+
+	def _parse_object(self, *args, **kwdargs):
+		result = self.__parse_object(*args, **kwdargs)
+		return jsontree(result[0]), result[1]
+
+# - Helpers -----------------------------
+def load(file_path, mode):
+	if mode == 'stream':
+		return sum(1 for glyph in vfj_reader(file_path).glyphs())
+
+	if mode == 'cache':
+		return jsonview(vfj_cache().load(file_path))
+
+	with open(file_path, 'r') as importFile:
+		if mode == 'legacy':
+			return json.load(importFile, cls=legacy_decoder)
+
+		if mode == 'tree':
+			return json.load(importFile, cls=vfj_decoder)
+
+		if mode == 'lazy':
+			return jsonview(json.load(importFile))
+
+		return json.load(importFile)
+
+def peakMemory():
+	'''Peak resident memory of the current process in MB or None'''
+	try:
+		import resource
+	except ImportError:
+		return None
+
+	maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+	return maxrss/(1024.*1024.) if sys.platform == 'darwin' else maxrss/1024. # Bytes on macOS, KB elsewhere
+
+def synthetic(glyphCount):
+	'''Writes a VFJ like file with given number of glyphs (two masters, three contours each). Returns its path.'''
+	nodes = ['%s %s' %(x, y) for x, y in zip(range(0, 600, 25), range(0, 1200, 50))]
+	contour = {'nodes':nodes}
+	layer = lambda name: {'name':name, 'advanceWidth':600, 'elements':[{'elementData':{'contours':[contour, contour, contour]}}]}
+	glyphs = [{'name':'glyph%s' %gid, 'unicodes':[gid], 'layers':[layer('Light'), layer('Bold')]} for gid in range(glyphCount)]
+
+	handle, file_path = tempfile.mkstemp(suffix='.vfj')
+
+	with os.fdopen(handle, 'w') as exportFile:
+		json.dump({'version':8, 'font':{'glyphs':glyphs, 'masters':[{'name':'Light'}, {'name':'Bold'}]}}, exportFile)
+
+	return file_path
+
+def measure(file_path, mode):
+	'''Child process: best of [repeats] load times and peak memory'''
+	times = []
+
+	for repeat in range(repeats):
+		start = time()
+		data = load(file_path, mode)
+		times.append(time() - start)
+		del data
+
+	print json.dumps({'time':min(times), 'memory':peakMemory()})
+
+# - Run ---------------------------------
+if __name__ == '__main__':
+	if len(sys.argv) == 4 and sys.argv[1] == '--measure':
+		measure(sys.argv[2], sys.argv[3])
+		sys.exit(0)
+
+	if len(sys.argv) == 3 and sys.argv[1] == '--synthetic':
+		file_path, temporary = synthetic(int(sys.argv[2])), True
+	elif len(sys.argv) == 2:
+		file_path, temporary = sys.argv[1], False
+	else:
+		print 'Usage: %s <path/to/font.vfj> | --synthetic <glyph count>' %os.path.basename(__file__)
+		sys.exit(1)
+
+	print '%s %s: %s (%.1f MB), best of %s' %(app_name, app_version, os.path.basename(file_path), os.path.getsize(file_path)/(1024.*1024.), repeats)
+	baseline = None
+	cache = vfj_cache()
+	cache.store(file_path, load(file_path, 'plain'))
+
+	for mode in modes:
+		output = subprocess.check_output([sys.executable, os.path.abspath(__file__), '--measure', file_path, mode])
+		result = json.loads(output.strip().splitlines()[-1])
+		baseline = baseline or result['time']
+		memory = '{:>8.1f} MB'.format(result['memory']) if result['memory'] is not None else '     n/a'
+		print '{:<8} {:>8.3f} s {:>6.1f}x {} peak'.format(mode, result['time'], baseline/result['time'], memory)
+
+	cache.invalidate(file_path)
+
+	if temporary:
+		os.remove(file_path)
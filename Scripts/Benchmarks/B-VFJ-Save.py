@@ -0,0 +1,119 @@
+#FLM: Benchmark: VFJ Save (TypeRig)
+# ----------------------------------------
+# (C) Vassil Kateliev, 2018 (http://www.kateliev.com)
+# (C) Karandash Type Foundry (http://www.karandash.eu)
+#-----------------------------------------
+# www.typerig.com
+
+# No warranties. By using this you agree
+# that you use it at your own risk!
+
+# Note: Compares full (vfj_write) and incremental (vfj_splice) saving of a jFont with one edited glyph
+# and checks that the incremental save writes the same font as the full one:
+# a glyph renamed before it is touched, a touched section and the permissions of a new file.
+# Works on a copy of the font. Runs within any Python 2.7 interpreter where TypeRig is installed:
+#	python B-VFJ-Save.py <path/to/font.vfj>
+#	python B-VFJ-Save.py --synthetic <glyph count>
+
+# - Dependencies -----------------
+import os
+import sys
+import json
+import shutil
+import stat
+import tempfile
+from time import time
+
+from typerig.utils import jFont
+
+# - Init --------------------------------
+app_name, app_version = 'Benchmark | VFJ Save', '0.01'
+repeats = 3
+
+# - Helpers -----------------------------
+def synthetic(glyphCount):
+	'''Writes a VFJ like file with given number of glyphs (two masters, three contours each). Returns its path.'''
+	nodes = ['%s %s' %(x, y) for x, y in zip(range(0, 600, 25), range(0, 1200, 50))]
+	contour = {'nodes':nodes}
+	layer = lambda name: {'name':name, 'advanceWidth':600, 'elements':[{'elementData':{'contours':[contour, contour, contour]}}]}
+	glyphs = [{'name':'glyph%s' %gid, 'unicodes':[gid], 'layers':[layer('Light'), layer('Bold')]} for gid in range(glyphCount)]
+	masters = [{'fontMaster':{'name':name, 'kerning':{'pairs':{'glyph0':{'glyph1':-50}}}}} for name in ('Light', 'Bold')]
+
+	handle, file_path = tempfile.mkstemp(suffix='.vfj')
+
+	with os.fdopen(handle, 'w') as exportFile:
+		json.dump({'version':8, 'font':{'glyphs':glyphs, 'masters':masters}}, exportFile, indent=1)
+
+	return file_path
+
+def plain(file_path):
+	with open(file_path, 'r') as importFile:
+		return json.load(importFile)
+
+def check(file_path):
+	'''Rename a glyph, touch it by its name in the file, splice-save and compare with the edited data. Returns list of failures.'''
+	failures = []
+	font = jFont(file_path)
+	glyph = font.data['font']['glyphs'][len(font.data['font']['glyphs'])//2]
+	old_name = glyph['name']
+
+	glyph['name'] = old_name + '.renamed'
+	glyph['layers'][0]['advanceWidth'] = 777
+	font.touch(old_name)
+	font.data['font']['masters'][0]['fontMaster']['name'] += ' Edited'
+	font.touch_section('font', 'masters', 0, 'fontMaster')
+
+	if font.dirty() != ([old_name], [('font', 'masters', 0, 'fontMaster')]):
+		failures.append('dirty: %s' %(font.dirty(),))
+
+	font.save()
+
+	if plain(file_path) != json.loads(json.dumps(font.data)):
+		failures.append('incremental save differs from the edited data')
+
+	new_path = file_path + '.new.vfj'
+	font.save_as(new_path, incremental=False)
+	mask = os.umask(0)
+	os.umask(mask)
+
+	if stat.S_IMODE(os.stat(new_path).st_mode) != 0o666 & ~mask:
+		failures.append('new file mode: %s' %oct(stat.S_IMODE(os.stat(new_path).st_mode)))
+
+	os.remove(new_path)
+	return failures
+
+def measure(file_path, incremental):
+	'''Best of [repeats] save times of the font with one touched glyph'''
+	times = []
+	font = jFont(file_path)
+	glyph_name = font.data['font']['glyphs'][0]['name']
+
+	for repeat in range(repeats):
+		font.glyph(glyph_name)['layers'][0]['advanceWidth'] = 600 + repeat
+		font.touch(glyph_name)
+		start = time()
+		font.save(incremental=incremental)
+		times.append(time() - start)
+
+	return min(times)
+
+# - Run ---------------------------------
+if __name__ == '__main__':
+	if len(sys.argv) == 3 and sys.argv[1] == '--synthetic':
+		file_path = synthetic(int(sys.argv[2]))
+	elif len(sys.argv) == 2:
+		file_path = tempfile.mkstemp(suffix='.vfj')[1]
+		shutil.copyfile(sys.argv[1], file_path)
+	else:
+		print 'Usage: %s <path/to/font.vfj> | --synthetic <glyph count>' %os.path.basename(__file__)
+		sys.exit(1)
+
+	print '%s %s: %s (%.1f MB), best of %s' %(app_name, app_version, os.path.basename(sys.argv[-1]), os.path.getsize(file_path)/(1024.*1024.), repeats)
+	full, incremental = measure(file_path, False), measure(file_path, True)
+	print '{:<12} {:>8.3f} s'.format('full', full)
+	print '{:<12} {:>8.3f} s {:>6.1f}x'.format('incremental', incremental, full/incremental)
+
+	failures = check(file_path)
+	print 'Check:\t%s' %('; '.join(failures) if failures else 'OK')
+	os.remove(file_path)
+	sys.exit(1 if failures else 0)
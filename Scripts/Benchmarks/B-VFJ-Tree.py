@@ -0,0 +1,107 @@
+#FLM: Benchmark: VFJ Tree nodes (TypeRig)
+# ----------------------------------------
+# (C) Vassil Kateliev, 2018 (http://www.kateliev.com)
+# (C) Karandash Type Foundry (http://www.karandash.eu)
+#-----------------------------------------
+# www.typerig.com
+
+# No warranties. By using this you agree
+# that you use it at your own risk!
+
+# Note: Compares the VFJ tree node classes: jsontree (legacy, defaultdict based) and jsonnode (dict based, no auto vivification).
+# Measured: decoding time, memory (deep size of the tree and peak RSS) and an attribute heavy traversal of all glyphs.
+# Every class runs in its own process, so peak memory (max RSS) is measured per class (Unix only).
+# Runs within any Python 2.7 interpreter where TypeRig is installed:
+#	python B-VFJ-Tree.py <path/to/font.vfj>
+#	python B-VFJ-Tree.py --synthetic <glyph count>
+
+# - Dependencies -----------------
+import os
+import sys
+import json
+import subprocess
+from time import time
+
+from typerig.utils import jsontree, jsonnode
+
+# - Init --------------------------------
+app_name, app_version = 'Benchmark | VFJ Tree', '0.01'
+nodeClasses = {'jsontree':jsontree, 'jsonnode':jsonnode}
+repeats = 3
+
+# - Helpers -----------------------------
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from importlib import import_module
+loadBenchmark = import_module('B-VFJ-Load') # Shared: peakMemory() and synthetic()
+
+def deepSize(obj):
+	'''Size in bytes of the containers of a tree (strings and numbers are shared by both classes, so not counted)'''
+	size, stack = 0, [obj]
+
+	while stack:
+		item = stack.pop()
+		size += sys.getsizeof(item)
+
+		if isinstance(item, dict):
+			stack.extend(value for value in item.itervalues() if isinstance(value, (dict, list)))
+
+		elif isinstance(item, list):
+			stack.extend(value for value in item if isinstance(value, (dict, list)))
+
+	return size
+
+def traverse(font):
+	'''Attribute access over every glyph, layer, element and contour - returns the number of nodes'''
+	count = 0
+
+	for glyph in font.font.glyphs:
+		for layer in glyph.layers:
+			width = layer.advanceWidth
+
+			for element in layer.elements:
+				for contour in element.elementData.contours:
+					count += len(contour.nodes)
+
+	return count
+
+def measure(file_path, className):
+	'''Child process: best of [repeats] decoding and traversal times, tree size and peak memory'''
+	nodeClass = nodeClasses[className]
+	loadTimes, walkTimes = [], []
+
+	for repeat in range(repeats):
+		with open(file_path, 'r') as importFile:
+			start = time()
+			data = json.load(importFile, object_hook=nodeClass)
+			loadTimes.append(time() - start)
+
+		start = time()
+		traverse(data)
+		walkTimes.append(time() - start)
+
+	print json.dumps({'load':min(loadTimes), 'walk':min(walkTimes), 'size':deepSize(data)/(1024.*1024.), 'memory':loadBenchmark.peakMemory()})
+
+# - Run ---------------------------------
+if __name__ == '__main__':
+	if len(sys.argv) == 4 and sys.argv[1] == '--measure':
+		measure(sys.argv[2], sys.argv[3])
+		sys.exit(0)
+
+	if len(sys.argv) == 3 and sys.argv[1] == '--synthetic':
+		file_path, temporary = loadBenchmark.synthetic(int(sys.argv[2])), True
+	elif len(sys.argv) == 2:
+		file_path, temporary = sys.argv[1], False
+	else:
+		print 'Usage: %s <path/to/font.vfj> | --synthetic <glyph count>' %os.path.basename(__file__)
+		sys.exit(1)
+
+	print '%s %s: %s (%.1f MB), best of %s' %(app_name, app_version, os.path.basename(file_path), os.path.getsize(file_path)/(1024.*1024.), repeats)
+
+	for className in sorted(nodeClasses.keys(), reverse=True):
+		output = subprocess.check_output([sys.executable, os.path.abspath(__file__), '--measure', file_path, className])
+		result = json.loads(output.strip().splitlines()[-1])
+		memory = '{:>8.1f} MB'.format(result['memory']) if result['memory'] is not None else '     n/a'
+		print '{:<9} load {:>7.3f} s  walk {:>7.3f} s  tree {:>7.1f} MB {} peak'.format(className, result['load'], result['walk'], result['size'], memory)
+
+	if temporary:
+		os.remove(file_path)
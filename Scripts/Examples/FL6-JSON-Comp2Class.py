@@ -1,5 +1,5 @@
 #FLM: JSON: Classes from composites
-# VER: 1.0
+# VER: 1.1
 #----------------------------------
 # Foundry: 	The Font Maker
 # Typeface: Bolyar Sans
@@ -54,5 +54,6 @@ for key, value in class_dict.iteritems():
 	jfont.data.font.masters[1].fontMaster.kerning.kerningClasses.append(new_json_2nd_class)
 	print 'ADD:\t 1st and 2nd Classes: %s -> %s' %(key, ' '.join(sorted(value)))
 
+jfont.touch_section('font', 'masters', 1, 'fontMaster', 'kerning') # Only the kerning is re-encoded on save
 jfont.save()
 print 'DONE.'
\ No newline at end of file
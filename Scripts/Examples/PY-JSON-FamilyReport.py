@@ -0,0 +1,41 @@
+#FLM: JSON: Family report (batch)
+# VER: 1.0
+#----------------------------------
+# Family wide QA over VFJ files, one worker process per CPU core.
+# Runs outside Fontlab, within any Python 2.7 interpreter where TypeRig is installed:
+#	python PY-JSON-FamilyReport.py <path/to/folder/with/vfj/files>
+#----------------------------------
+
+# - Dependancies
+import os
+import sys
+from typerig.utils import vfj_batch
+
+# - Job ------------------------------------------------
+def report(font):
+	'''Per font: glyph count, unencoded glyphs and kerning pairs per master'''
+	glyphs = font.data.font.glyphs
+	unencoded = [glyph.name for glyph in glyphs if 'unicode' not in glyph and 'unicodes' not in glyph]
+	kerning = {}
+
+	for master in font.data.font.masters:
+		pairs = master.fontMaster.get('kerning', {}).get('pairs', {})
+		kerning[master.fontMaster.name] = sum(len(right) for right in pairs.values())
+
+	return {'glyphs':len(glyphs), 'unencoded':len(unencoded), 'kerning':kerning}
+
+# - Run ------------------------------------------------
+if __name__ == '__main__': # Required: worker processes import this script
+	folder = sys.argv[1] if len(sys.argv) > 1 else os.getcwd()
+	file_paths = sorted(os.path.join(folder, name) for name in os.listdir(folder) if name.endswith('.vfj'))
+
+	for item in vfj_batch(file_paths, report, lazy=True, save=False):
+		if item['error'] is not None:
+			print 'ERROR:\t Font: %s;\n%s' %(item['path'], item['error'])
+			continue
+
+		result = item['result']
+		print 'DONE:\t Font: %s; Glyphs: %s; Unencoded: %s; Time: %.2f s' %(os.path.basename(item['path']), result['glyphs'], result['unencoded'], item['time'])
+
+		for master_name, pairs in sorted(result['kerning'].items()):
+			print '\t Master: %s; Kerning pairs: %s' %(master_name, pairs)
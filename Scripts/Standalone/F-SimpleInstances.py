@@ -14,15 +14,14 @@ import fontlab as fl6
 from PythonQt import QtCore, QtGui
 
 #from typerig.proxy import pFont, pGlyph, pShape
-from typerig.brain import fontFamilly, linAxis, geoAxis, linspread, geospread
-from itertools import product
+from typerig.brain import instanceAxis, instanceGrid
 
 # - Init --------------------------------
-app_version = '0.02'
+app_version = '0.03'
 app_name = 'Simple Instance Calc'
 
 # -- Strings
-text_prog = ['Geometric']
+text_prog = ['Geometric', 'Linear']
 
 # -- Widgets
 class WTableView(QtGui.QTableWidget):
@@ -64,6 +63,21 @@ class WTableView(QtGui.QTableWidget):
 		self.setVerticalHeaderLabels(name_row)
 		self.blockSignals(False)
 
+	def setTableRows(self, columns, rows, count):
+		'''Populate the table row by row from an iterable (ex. generator), without building the data first'''
+		self.blockSignals(True)
+
+		self.setColumnCount(len(columns))
+		self.setRowCount(count)
+
+		for n, row in enumerate(rows):
+			for m, value in enumerate(row):
+				self.setItem(n, m, QtGui.QTableWidgetItem(str(value)))
+
+		self.setHorizontalHeaderLabels(columns)
+		self.setVerticalHeaderLabels([str(n) for n in range(count)])
+		self.blockSignals(False)
+
 	def getTable(self):
 		returnDict = {}
 		for row in range(self.rowCount):
@@ -125,10 +139,13 @@ class dlg_sInstance(QtGui.QDialog):
 		self.show()
 
 	def calculateInstances(self):
-		newFamily = fontFamilly(wt0 = int(self.edt_wt0.text), wt1 = int(self.edt_wt1.text) , wt_steps=self.spb_weights.value, wd_steps=self.spb_widths.value)
-		if self.spb_widths.value < 2: newFamily.wd_instances = [0] # Self Hack :)
-		instances = [(item[0][0], item[0][1], item[1]) for item in product(zip(newFamily.wt_stems, newFamily.wt_instances), newFamily.wd_instances)]
-		self.edt_result.setTable({n:{'Stem':inst[0], 'Weight':inst[1], 'Width':inst[2]} for n, inst in enumerate(instances)})
+		weight = instanceAxis('Weight', int(self.edt_wt0.text), int(self.edt_wt1.text), self.spb_weights.value, self.cmb_prog.currentText.lower(), rounded=True)
+		width = instanceAxis('Width', 0, 1000, max(self.spb_widths.value, 1))
+		grid = instanceGrid([weight, width])
+
+		# - Instances are generated lazily, straight into the table
+		rows = ((int(round(stems['Weight'])), int(location['Weight']), int(location['Width'])) for location, stems in grid)
+		self.edt_result.setTableRows(['Stem', 'Weight', 'Width'], rows, len(grid))
 
 	
 
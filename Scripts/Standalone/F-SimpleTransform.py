@@ -17,7 +17,7 @@ from typerig.proxy import pFont, pGlyph, pShape
 from typerig.brain import transform
 
 # - Init --------------------------------
-app_version = '0.01'
+app_version = '0.02'
 app_name = 'Font Slanter'
 
 # -- Strings
@@ -93,9 +93,11 @@ class dlg_transformFont(QtGui.QDialog):
 			'''
 			if glyph.hasLayer(layer):
 				if not len(glyph.hasGlyphComponents()):
-					for node in glyph.nodes(layer):
-						tNode = matrix.applyTransformation(node.x, node.y)
-						node.setXY(*tNode)
+					layer_nodes = glyph.nodes(layer)
+					new_xs, new_ys = matrix.apply_many([node.x for node in layer_nodes], [node.y for node in layer_nodes])
+					
+					for node, x, y in zip(layer_nodes, new_xs, new_ys):
+						node.setXY(x, y)
 									
 				glyph.update()
 				glyph.updateObject(glyph.fl, 'DONE:\tTransform:\t Glyph /%s;\tLayer: %s' %(glyph.name, layer))
@@ -18,7 +18,7 @@ from typerig.proxy import pFont
 from typerig.brain import extBiDict
 
 # - Init --------------------------------
-app_version = '1.5'
+app_version = '1.6'
 app_name = 'Copy Kernig'
 
 # -- Strings 
@@ -114,6 +114,17 @@ class dlg_copyKerning(QtGui.QDialog):
 			else:
 				print 'ERROR:\t Class kering not found for Master: %s' %layer
 
+	def get_pair(self, layer, pair):
+		# - Resolve glyph names to kerning groups (O(1) reverse lookups), returns newKernPair arguments
+		left, right = pair
+		layer_groups = self.class_data[layer]
+		empty = extBiDict()
+
+		group_left = layer_groups.get('KernLeft', empty).getKey(left, layer_groups.get('KernBothSide', empty).getKey(left))
+		group_right = layer_groups.get('KernRight', empty).getKey(right, layer_groups.get('KernBothSide', empty).getKey(right))
+
+		return (left if group_left is None else group_left, right if group_right is None else group_right, int(group_left is not None), int(group_right is not None))
+
 	def expr_fromFile(self):
 		fontPath = os.path.split(self.active_font.fg.path)[0]
 		fname = QtGui.QFileDialog.getOpenFileName(self, 'Load kerning expressions from file', fontPath)
@@ -173,52 +184,11 @@ class dlg_copyKerning(QtGui.QDialog):
 
 						# - Build Destination pairs
 						for pair in dst_names:
-							left, right = pair
-							modeLeft, modeRight = 0, 0
-							
-							if len(self.class_data[layer].keys()):
-								if self.class_data[layer]['KernLeft'].inverse.has_key(left):
-									left = self.class_data[layer]['KernLeft'].inverse[left]
-									modeLeft = 1
-
-								elif self.class_data[layer]['KernBothSide'].inverse.has_key(left):
-									left = self.class_data[layer]['KernBothSide'].inverse[left]
-									modeLeft = 1
-
-								if self.class_data[layer]['KernRight'].inverse.has_key(right):
-									right = self.class_data[layer]['KernRight'].inverse[right]
-									modeRight = 1
-
-								elif self.class_data[layer]['KernBothSide'].inverse.has_key(right):
-									right = self.class_data[layer]['KernBothSide'].inverse[right]
-									modeRight = 1
-
-							dst_pairs.append(self.active_font.newKernPair(left[0], right[0], modeLeft, modeRight))
+							dst_pairs.append(self.active_font.newKernPair(*self.get_pair(layer, pair)))
 
 						# - Build Source pairs
-						for pair in src_names: # Ugly boilerplate... but may be useful in future
-							left, right = pair
-							modeLeft, modeRight = 0, 0
-							
-							if len(self.class_data[layer].keys()):
-								if self.class_data[layer]['KernLeft'].inverse.has_key(left):
-									left = self.class_data[layer]['KernLeft'].inverse[left]
-									modeLeft = 1
-
-								elif self.class_data[layer]['KernBothSide'].inverse.has_key(left):
-									left = self.class_data[layer]['KernBothSide'].inverse[left]
-									modeLeft = 1
-
-								if self.class_data[layer]['KernRight'].inverse.has_key(right):
-									right = self.class_data[layer]['KernRight'].inverse[right]
-									modeRight = 1
-
-								elif self.class_data[layer]['KernBothSide'].inverse.has_key(right):
-									right = self.class_data[layer]['KernBothSide'].inverse[right]
-									modeRight = 1
-
-							
-							src_pairs.append(self.active_font.newKernPair(left[0], right[0], modeLeft, modeRight))
+						for pair in src_names:
+							src_pairs.append(self.active_font.newKernPair(*self.get_pair(layer, pair)))
 
 						# !!! Add only as plain pairs supported - No class kerning trough python in build 6927
 						# !!! Syntax fgKerning.setPlainPairs([(('A','V'),-30)])
@@ -28,7 +28,7 @@ from typerig.gui import trSliderCtrl, trMsgSimple
 
 
 # - Init --------------------------------
-app_version = '0.16'
+app_version = '0.17'
 app_name = 'TypeRig | Delta Machine'
 
 ss_controls = """
@@ -443,6 +443,11 @@ class dlg_DeltaMachine(QtGui.QDialog):
 		# - Helper
 		def helper_calc_stem(glyph, master_name, vertical):
 			selection = glyph.selectedNodes(master_name)
+
+			if len(selection) < 2: # No stem selected: probe through the middle of x-height (vertical) or advance (horizontal)
+				position = self.active_font.fontMetrics().getXHeight(master_name)/2 if vertical else glyph.getAdvance(master_name)/2
+				stems = self.active_font.getStems(position, [glyph], master_name, vertical).get(glyph.name, [])
+				return stems[0] if len(stems) else 0.
 			
 			if vertical:
 				return abs(selection[0].x - selection[-1].x)
@@ -27,7 +27,7 @@ global pLayers
 global pMode
 pLayers = (True, True, False, False)
 pMode = 0
-app_name, app_version = 'TypeRig | Corner', '1.97'
+app_name, app_version = 'TypeRig | Corner', '1.98'
 
 # -- Strings
 filter_name = 'Smart corner'
@@ -422,14 +422,14 @@ class QSmartCorner(QtGui.QVBoxLayout):
 			print 'DONE:\t Filter: Remove Smart Corner; Glyphs: %s' %'; '.join([g.name for g in process_glyphs])
 
 	def update_glyphs(self, glyphs, complete=False):
-		for glyph in glyphs:
-			glyph.update()
-			
-			if not complete: # Partial update - contour only
-				for contour in glyph.contours():
-					contour.changed()
-			else: # Full update - with undo snapshot
-				glyph.updateObject(glyph.fl, verbose=False)						
+		with pFont().batch_edit('Smart Corner', verbose=False): # One set of notifications for all glyphs
+			for glyph in glyphs:
+				glyph.update()
+				
+				if not complete: # Partial update - contour only
+					glyph.changed()
+				else: # Full update - with undo snapshot
+					glyph.updateObject(glyph.fl, verbose=False)						
 
 class QCornerControl(QtGui.QVBoxLayout):
 	# - Split/Break contour 
@@ -491,14 +491,14 @@ class QCornerControl(QtGui.QVBoxLayout):
 		self.update_glyphs(self.process_glyphs)
 
 	def update_glyphs(self, glyphs, complete=False):
-		for glyph in glyphs:
-			glyph.update()
-			
-			if not complete: # Partial update - contour only
-				for contour in glyph.contours():
-					contour.changed()
-			else: # Full update - with undo snapshot
-				glyph.updateObject(glyph.fl, verbose=False)
+		with self.active_font.batch_edit('Smart Corner', verbose=False): # One set of notifications for all glyphs
+			for glyph in glyphs:
+				glyph.update()
+				
+				if not complete: # Partial update - contour only
+					glyph.changed()
+				else: # Full update - with undo snapshot
+					glyph.updateObject(glyph.fl, verbose=False)
 
 		if complete: print 'DONE:\t Update/Snapshot for glyphs: %s' %'; '.join([g.name for g in glyphs])
 
@@ -12,7 +12,7 @@ global pLayers
 global pMode
 pLayers = None
 pMode = 0
-app_name, app_version = 'TypeRig | Curves', '0.10'
+app_name, app_version = 'TypeRig | Curves', '0.11'
 
 # - Dependencies -----------------
 import fontlab as fl6
@@ -35,12 +35,14 @@ class curveEq(QtGui.QGridLayout):
 		self.btn_hobby_get = QtGui.QPushButton('Get')
 		self.btn_hobby_swap = QtGui.QPushButton('Swap')
 		self.btn_prop = QtGui.QPushButton('Set &Handles')
+		self.btn_hobby_contour = QtGui.QPushButton('Hobby C&ontour')
 		
 		self.btn_tunni.setToolTip('Apply Tunni curve optimization')
 		self.btn_hobby.setToolTip('Set Hobby spline curvature')
 		self.btn_hobby_swap.setToolTip('Swap C0, C1 curvatures')
 		self.btn_hobby_get.setToolTip('Get curvature for current selected\nsegment at active layer.')
 		self.btn_prop.setToolTip('Set handle length in proportion to bezier node distance')
+		self.btn_hobby_contour.setToolTip('Solve Hobby spline for whole selected contours at once.\nUses C0 as tension.')
 		
 		self.spn_hobby0 = QtGui.QDoubleSpinBox()
 		self.spn_hobby1 = QtGui.QDoubleSpinBox()
@@ -58,6 +60,7 @@ class curveEq(QtGui.QGridLayout):
 		self.btn_hobby_get.clicked.connect(self.hobby_get)
 		self.btn_hobby.clicked.connect(lambda: self.eqContour('hobby'))
 		self.btn_prop.clicked.connect(lambda: self.eqContour('prop'))
+		self.btn_hobby_contour.clicked.connect(self.hobby_contour)
 
 		# -- Build: Curve optimization
 		self.addWidget(self.btn_tunni,						 0, 0, 1, 5)    
@@ -73,6 +76,7 @@ class curveEq(QtGui.QGridLayout):
 		self.addWidget(self.spn_hobby1,						 4, 4, 1, 1)  
 		self.addWidget(self.btn_hobby_get,					 5, 0, 1, 1)  
 		self.addWidget(self.btn_hobby,						 5, 1, 1, 4)
+		self.addWidget(self.btn_hobby_contour,				 6, 0, 1, 5)
 
 		self.setColumnStretch(0,1)
 		self.setColumnStretch(4,0)
@@ -96,6 +100,15 @@ class curveEq(QtGui.QGridLayout):
 		self.spn_hobby0.setValue(c0.real)
 		self.spn_hobby1.setValue(c1.real)
 
+	def hobby_contour(self):
+		glyph = eGlyph()
+		wLayers = glyph._prepareLayers(pLayers)
+		contours = sorted(set([cid for cid, nid in glyph.selectedAtContours()]))
+
+		glyph.eqHobbyContours(contours, pLayers, float(self.spn_hobby0.value))
+		glyph.updateObject(glyph.fl, 'Hobby contour @ %s.' %'; '.join(wLayers))
+		glyph.update()
+
 	def eqContour(self, method):
 		glyph = eGlyph()
 		selection = glyph.selected(True)